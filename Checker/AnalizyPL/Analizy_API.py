@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.4
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -15,20 +15,29 @@
     Date            Who                     What
     2024-04-29      Stanisław Horna         Add logging capabilities.
 
+    2026-10-18      Stanisław Horna         Use shared HTTP client with connection pool, timeouts and retries.
+                                            Conditional requests based on cached ETag / Last-Modified validators.
+                                            API URL configurable with ANALIZY_API_URL variable.
+                                            Parse dates with Dates.parseDate() fast path.
+
 """
 
-import requests
+import os
 import datetime
-from dateutil.parser import parse
 from dataclasses import dataclass, field
 from Utility.Exceptions import AnalizyAPIexception
+from Utility.HTTPClient import HTTPClient
+from Utility.ResponseCache import ResponseCache
+from Utility.Dates import Dates
 from Log.Logger import logger
 
 
 @dataclass
 class AnalizyAPI:
 
-    __API_URL = "https://www.analizy.pl/api/quotation"
+    __API_URL = os.getenv(
+        'ANALIZY_API_URL', "https://www.analizy.pl/api/quotation"
+    )
 
     __RESPONSE_DETAILS = "series"
     __RESPONSE_LIST = "price"
@@ -42,11 +51,26 @@ class AnalizyAPI:
         # Create custom URL to access API to download JSON with all quotation
         url = f"{AnalizyAPI.__API_URL}/{fund_category}/{fund_id}"
 
+        # Get validators of previous response, to ask only for modified content
+        cacheEntry = ResponseCache.read(url)
+
         try:
             # Invoke web request and convert JSON response to dict
             logger.debug("Calling %s", url)
-            apiResponse = requests.get(url)
+            apiResponse = HTTPClient.get(
+                url,
+                headers=ResponseCache.getValidatorHeaders(cacheEntry)
+            )
             logger.debug("Response status code: %d", apiResponse.status_code)
+
+            # Quotation did not change since the last call, return cached date without parsing
+            if (apiResponse.status_code == 304) and (cacheEntry is not None):
+                logger.debug("Returning cached date for fund: %s", fund_id)
+                ResponseCache.touch(url)
+                return datetime.date.fromisoformat(
+                    cacheEntry[ResponseCache.VALUE_LABEL]
+                )
+
             fundQuotation = apiResponse.json()
         except Exception as err:
             logger.exception("Exception occurred", exc_info=True)
@@ -55,9 +79,12 @@ class AnalizyAPI:
         logger.debug("Parsing %s", AnalizyAPI.__RESPONSE_DATE_NAME)
         quotation = fundQuotation[AnalizyAPI.__RESPONSE_DETAILS][0][AnalizyAPI.__RESPONSE_LIST]
 
-        lastDate = parse(
+        lastDate = Dates.parseDate(
             quotation[-1][AnalizyAPI.__RESPONSE_DATE_NAME]
         ).date()
 
+        # Save validators with parsed date for the next call
+        ResponseCache.write(url, apiResponse.headers, lastDate.isoformat())
+
         logger.debug("Returning date for fund: %s", fund_id)
         return lastDate
@@ -9,7 +9,7 @@
 
 .NOTES
 
-    Version:            1.2
+    Version:            1.7
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -20,8 +20,19 @@
     2024-04-29      Stanisław Horna         Add additional messages for detection that tables are empty.
                                             Add logging capabilities.
 
+    2026-10-18      Stanisław Horna         Compare refund dates with fund quotation dates retrieved once per check.
+                                            Check funds concurrently with QUOTATION_CHECK_WORKERS threads,
+                                            update quotation of all outdated funds with a single request.
+                                            Refresh all outdated investments with a single request.
+                                            Check refund dates only as fallback of API refresh (REFUND_CHECK_MODE).
+                                            Check refund dates at least once per REFUND_CHECK_MAX_INTERVAL_MS.
+
 """
 
+import os
+import time
+import datetime
+from concurrent.futures import ThreadPoolExecutor
 from AnalizyPL.Analizy_API import AnalizyAPI
 from InvestmentAPI.Investment_API_Handler import InvestmentAPI
 from InvestmentAPI.Unpacker import Unpacker
@@ -29,18 +40,29 @@ from Utility.Sleeper import Sleeper
 from Utility.Exceptions import InvestmentAPIexception, AnalizyAPIexception
 from Log.Logger import logger
 
+QUOTATION_CHECK_WORKERS = int(os.getenv('QUOTATION_CHECK_WORKERS', 4))
+
+# API refreshes investments holding funds with new quotation on its own,
+# so in FALLBACK mode refund dates are checked in cycles without quotation update,
+# and at least once per REFUND_CHECK_MAX_INTERVAL_MS to catch investments which API refresh missed
+REFUND_CHECK_MODE = os.getenv('REFUND_CHECK_MODE', "FALLBACK").upper()
+REFUND_CHECK_MAX_INTERVAL_MS = int(os.getenv('REFUND_CHECK_MAX_INTERVAL_MS', 10800000))
+
 
 def Main():
 
     InvestmentAPI.waitForFullSystemInitialization()
 
     scheduler = Sleeper()
+    lastRefundCheck = None
 
     try:
         while True:
             try:
-                quotationUpdate()
-                refundUpdate()
+                fundsUpdated = quotationUpdate()
+                if isRefundCheckRequired(fundsUpdated, lastRefundCheck):
+                    lastRefundCheck = time.monotonic()
+                    refundUpdate()
             except InvestmentAPIexception:
                 logger.exception(
                     "InvestmentAPI exception occurred",
@@ -52,7 +74,17 @@ def Main():
         logger.exception("Exception occurred", exc_info=True)
 
 
-def quotationUpdate():
+def isRefundCheckRequired(fundsUpdated: bool, lastRefundCheck: float) -> bool:
+
+    # Check is always done in ALWAYS mode, in cycles without quotation update and on the first cycle
+    if (REFUND_CHECK_MODE == "ALWAYS") or (not fundsUpdated) or (lastRefundCheck is None):
+        return True
+
+    # Otherwise it is done if the last one is older than the max interval
+    return (time.monotonic() - lastRefundCheck) * 1000 >= REFUND_CHECK_MAX_INTERVAL_MS
+
+
+def quotationUpdate() -> bool:
 
     logger.info("quotationUpdate()")
 
@@ -68,42 +100,75 @@ def quotationUpdate():
         except InvestmentAPIexception:
             logger.exception(
                 "InvestmentAPI exception occurred", exc_info=True)
+            return False
 
         except AnalizyAPIexception:
             logger.exception("AnalizyAPI exception occurred", exc_info=True)
+            return False
 
-        return None
+        return True
 
-    # Loop through monitored funds
-    for item in fundsToCheck:
+    # Check all monitored funds concurrently
+    fundsToUpdate = getOutdatedFunds(fundsToCheck)
 
+    # Invoke update of all funds with newer quotation with a single request
+    if fundsToUpdate:
         try:
-            # Unpack response items
-            fund_id, fund_cat, quotation_date = (
-                Unpacker.fundGetter(item)
-            )
-
-            # Download quotation date
-            quotation_date_web = AnalizyAPI.getLastQuotationDate(
-                fund_id, fund_cat)
-
-            logger.debug(
-                "Comparing quotation dates (web | DB): %s, %s",
-                quotation_date_web, quotation_date
-            )
-            # Check if Analizy.pl api has newer quotation available,
-            # if yes, then invoke update for particular fund
-            if quotation_date_web > quotation_date:
-                logger.info(str(InvestmentAPI.updateFunds(fund_id)))
+            logger.info(str(InvestmentAPI.updateFunds(fundsToUpdate)))
 
         except InvestmentAPIexception:
             logger.exception(
                 "InvestmentAPI exception occurred", exc_info=True)
+            return False
+
+        return True
+
+    return False
+
+
+def getOutdatedFunds(fundsToCheck: list[dict]) -> list[str]:
+
+    logger.info("getOutdatedFunds(), workers: %d", QUOTATION_CHECK_WORKERS)
+
+    # Requests to Analizy.pl are sent concurrently,
+    # number of simultaneous requests to the same host is limited by the HTTP client
+    with ThreadPoolExecutor(max_workers=QUOTATION_CHECK_WORKERS) as executor:
+        checks = [
+            executor.submit(isFundOutdated, item)
+            for item in fundsToCheck
+        ]
+
+    # Collect results in the same order as funds were provided
+    fundsToUpdate = []
+    for item, check in zip(fundsToCheck, checks):
+
+        try:
+            if check.result():
+                fundsToUpdate.append(Unpacker.fundGetter(item)[0])
 
         except AnalizyAPIexception:
             logger.exception("AnalizyAPI exception occurred", exc_info=True)
 
-    return None
+    return fundsToUpdate
+
+
+def isFundOutdated(item: dict) -> bool:
+
+    # Unpack response items
+    fund_id, fund_cat, quotation_date = (
+        Unpacker.fundGetter(item)
+    )
+
+    # Download quotation date
+    quotation_date_web = AnalizyAPI.getLastQuotationDate(
+        fund_id, fund_cat)
+
+    logger.debug(
+        "Comparing quotation dates (web | DB): %s, %s",
+        quotation_date_web, quotation_date
+    )
+    # Check if Analizy.pl api has newer quotation available
+    return quotation_date_web > quotation_date
 
 
 def refundUpdate():
@@ -131,49 +196,63 @@ def refundUpdate():
     # Init local set of investment IDs to trigger update
     investmentsToUpdate = set()
 
+    # Get quotation dates of all funds with a single request,
+    # it is done after quotation update, so dates of just downloaded quotations are included
+    try:
+        fundQuotationDates = getFundQuotationDates()
+
+    except InvestmentAPIexception:
+        logger.exception(
+            "InvestmentAPI exception occurred", exc_info=True)
+        return None
+
     # Loop through configured investments
     for item in investmentsToCheck:
 
-        try:
-            # Unpack response items
-            investment_id, fund_id, refund_date = (
-                Unpacker.investmentGetter(item)
-            )
-
-            # Get quotation date for current fund
-            _, _, quotation_date = (
-                Unpacker.fundGetter(
-                    InvestmentAPI.getFunds(fund_id)
-                )
-            )
-
+        # Unpack response items
+        investment_id, fund_id, refund_date = (
+            Unpacker.investmentGetter(item)
+        )
+
+        # Get quotation date for current fund
+        if fund_id not in fundQuotationDates:
+            logger.warning(
+                "Fund (%s) of investment (%s) has no quotation date", fund_id, investment_id)
+            continue
+        quotation_date = fundQuotationDates[fund_id]
+
+        logger.debug(
+            "Comparing dates (quotation | refund): %s, %s",
+            quotation_date, refund_date
+        )
+        # Check if quotation date is newer than the calculated refund date,
+        # if yes add investment to update set
+        if quotation_date > refund_date:
+            investmentsToUpdate.add(investment_id)
             logger.debug(
-                "Comparing dates (quotation | refund): %s, %s",
-                quotation_date, refund_date
-            )
-            # Check if quotation date is newer than the calculated refund date,
-            # if yes add investment to update set
-            if quotation_date > refund_date:
-                investmentsToUpdate.add(investment_id)
-                logger.debug(
-                    "Investment (%s) added to update set", investment_id)
-
-        except InvestmentAPIexception:
-            logger.exception(
-                "InvestmentAPI exception occurred", exc_info=True)
-
-    # Loop through investments to update
-    for investment in investmentsToUpdate:
+                "Investment (%s) added to update set", investment_id)
 
+    # Trigger refund calculation of all outdated investments with a single request
+    if investmentsToUpdate:
         try:
-            # Trigger investment refund calculation
-            logger.info(str(InvestmentAPI.updateInvestment(investment)))
+            logger.info(str(InvestmentAPI.updateInvestment(sorted(investmentsToUpdate))))
 
         except InvestmentAPIexception as invErr:
             logger.exception(
                 "InvestmentAPI exception occurred", exc_info=True)
 
 
+def getFundQuotationDates() -> dict[str, datetime.date]:
+
+    # Map each monitored fund to its last quotation date stored in DB
+    fundQuotationDates = {}
+    for item in InvestmentAPI.getFunds():
+        fund_id, _, quotation_date = Unpacker.fundGetter(item)
+        fundQuotationDates[fund_id] = quotation_date
+
+    return fundQuotationDates
+
+
 if __name__ == '__main__':
     logger.info("Service started")
     Main()
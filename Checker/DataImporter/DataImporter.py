@@ -6,7 +6,7 @@
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.2
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -16,6 +16,8 @@
     Date            Who                     What
     2024-05-17      Stanisław Horna         Documented code. Enabled logging.
 
+    2026-10-18      Stanisław Horna         Method to get paths of config directories.
+
 """
 
 import os
@@ -243,6 +245,22 @@ class DataImporter:
             logger.debug("No investments imported")
             return False
 
+    @staticmethod
+    def getConfigDirectories() -> list[str]:
+        '''
+            Method to get absolute paths of fund and investment config directories
+        '''
+        return [
+            os.path.join(
+                DataImporter.__config_directory,
+                directory
+            )
+            for directory in (
+                DataImporter.__fund_config_dir,
+                DataImporter.__investment_config_dir
+            )
+        ]
+
     @staticmethod
     def __get_files_to_last_modify_date(directory: str) -> dict[str, datetime.datetime]:
         '''
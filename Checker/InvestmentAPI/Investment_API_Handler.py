@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.2
+    Version:            1.5
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -17,6 +17,10 @@
     
     2024-05-14      Stanisław Horna         Add new methods to put funds and investments to system.
 
+    2026-10-18      Stanisław Horna         Parse dates with Dates.parseDate() fast path.
+                                            Update quotation of multiple funds with a single request.
+                                            Refresh multiple investments with a single request.
+
 """
 import os
 import requests
@@ -24,8 +28,8 @@ import time
 import json
 from Log.Logger import logger
 from datetime import date
-from dateutil.parser import parse
 from Utility.Exceptions import InvestmentAPIexception
+from Utility.Dates import Dates
 
 
 class InvestmentAPI:
@@ -89,7 +93,7 @@ class InvestmentAPI:
             )
             # loop through returned list and convert date from sting to datetime
             for i in range(0, len(result)):
-                result[i][InvestmentAPI.__FUND_RESP_DATE] = parse(
+                result[i][InvestmentAPI.__FUND_RESP_DATE] = Dates.parseDate(
                     result[i][InvestmentAPI.__FUND_RESP_DATE]
                 ).date()
 
@@ -101,25 +105,32 @@ class InvestmentAPI:
         return result
 
     @staticmethod
-    def updateFunds(ID: str = None) -> list[dict[str, str | date]]:
+    def updateFunds(ID: str | list[str] = None) -> list[dict[str, str | date]]:
 
         logger.debug("updateFunds(%s)", ID)
 
-        # create appropriate url whether ID was provided or not
+        # create appropriate url whether ID was provided or not,
+        # list of IDs is sent in request body
+        body = None
         if ID is None:
             logger.debug("URL for fund is none created")
             url = f"http://{InvestmentAPI.__API_IP}:{InvestmentAPI.__API_PORT}/{InvestmentAPI.__QUOTATION_ENDPOINT}"
+        elif isinstance(ID, list):
+            logger.debug("URL for fund list created")
+            url = f"http://{InvestmentAPI.__API_IP}:{InvestmentAPI.__API_PORT}/{InvestmentAPI.__QUOTATION_ENDPOINT}"
+            body = ID
         else:
             logger.debug("URL for fund is NOT none created")
             url = f"http://{InvestmentAPI.__API_IP}:{InvestmentAPI.__API_PORT}/{InvestmentAPI.__QUOTATION_ENDPOINT}/{ID}"
 
         # call API
         logger.debug("Calling %s", url)
-        apiResponse = requests.put(url)
+        apiResponse = requests.put(url, json=body)
         logger.debug("Response status code: %d", apiResponse.status_code)
         result = apiResponse.json()
 
-        if apiResponse.status_code != 200:
+        # update of fund list is partially successful if some of them do not exist
+        if apiResponse.status_code not in ((200, 206) if body is not None else (200,)):
 
             raise InvestmentAPIexception(result)
 
@@ -152,7 +163,7 @@ class InvestmentAPI:
                          InvestmentAPI.__INVESTMENT_RESP_DATE)
             # loop through returned list and convert date from sting to datetime
             for i in range(0, len(result)):
-                result[i][InvestmentAPI.__INVESTMENT_RESP_DATE] = parse(
+                result[i][InvestmentAPI.__INVESTMENT_RESP_DATE] = Dates.parseDate(
                     result[i][InvestmentAPI.__INVESTMENT_RESP_DATE]
                 ).date()
 
@@ -163,21 +174,27 @@ class InvestmentAPI:
         return result
 
     @staticmethod
-    def updateInvestment(ID: int = None) -> list[dict[str, str | date]]:
+    def updateInvestment(ID: int | list[int] = None) -> list[dict[str, str | date]]:
 
         logger.debug("updateInvestment(%s)", ID)
 
-        # create appropriate url whether ID was provided or not
+        # create appropriate url whether ID was provided or not,
+        # list of IDs is sent in request body
+        body = None
         if ID is None:
             logger.debug("URL for investment is none created")
             url = f"http://{InvestmentAPI.__API_IP}:{InvestmentAPI.__API_PORT}/{InvestmentAPI.__REFUND_ENDPOINT}"
+        elif isinstance(ID, list):
+            logger.debug("URL for investment list created")
+            url = f"http://{InvestmentAPI.__API_IP}:{InvestmentAPI.__API_PORT}/{InvestmentAPI.__REFUND_ENDPOINT}"
+            body = ID
         else:
             logger.debug("URL for investment is NOT none created")
             url = f"http://{InvestmentAPI.__API_IP}:{InvestmentAPI.__API_PORT}/{InvestmentAPI.__REFUND_ENDPOINT}/{ID}"
 
         # call API
         logger.debug("Calling %s", url)
-        apiResponse = requests.put(url)
+        apiResponse = requests.put(url, json=body)
         logger.debug("Response status code: %d", apiResponse.status_code)
         result = apiResponse.json()
 
@@ -0,0 +1,123 @@
+"""
+.DESCRIPTION
+    Class to watch config directories for changed files.
+    Uses Linux inotify through libc, so no additional package is required.
+    If inotify is not available, or CONFIG_WATCH_MODE is set to POLL,
+    watcher is disabled and config directories are polled by Sleeper class.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import os
+import struct
+import ctypes
+import ctypes.util
+import fnmatch
+from Log.Logger import logger
+
+
+class ConfigWatcher:
+
+    WatchModes = ("INOTIFY", "POLL")
+    WatchMode = os.getenv('CONFIG_WATCH_MODE', "INOTIFY").upper()
+
+    # Flags defined in <sys/inotify.h>
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0x00000800
+    IN_CLOEXEC = 0x00080000
+
+    # File is written, moved into directory or its modify date is changed
+    WatchMask = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO
+
+    # Header of inotify_event structure: wd, mask, cookie, len
+    EventHeader = struct.Struct("iIII")
+    ReadBufferSize = 4096
+
+    def __init__(self, directories: list[str], pattern: str = "*.json") -> None:
+
+        self.__fd: int = None
+        self.__pattern = pattern
+
+        if ConfigWatcher.WatchMode != "INOTIFY":
+            logger.info("Config directories will be polled")
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+            fd = libc.inotify_init1(
+                ConfigWatcher.IN_NONBLOCK | ConfigWatcher.IN_CLOEXEC
+            )
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+
+            for directory in directories:
+                if libc.inotify_add_watch(fd, os.fsencode(directory), ConfigWatcher.WatchMask) < 0:
+                    errno = ctypes.get_errno()
+                    os.close(fd)
+                    raise OSError(errno, f"{os.strerror(errno)}: {directory}")
+
+            self.__fd = fd
+            logger.info("Watching config directories: %s", directories)
+
+        except (OSError, AttributeError):
+            logger.warning(
+                "Failed to watch config directories, they will be polled",
+                exc_info=True
+            )
+
+        return None
+
+    def isEnabled(self) -> bool:
+        return self.__fd is not None
+
+    def fileno(self) -> int:
+        return self.__fd
+
+    def readChanges(self) -> bool:
+        '''
+            Method to read all pending events without blocking.
+            Returns True if any file matching the pattern was changed.
+        '''
+        changed = False
+
+        while True:
+            try:
+                buffer = os.read(self.__fd, ConfigWatcher.ReadBufferSize)
+            except BlockingIOError:
+                break
+
+            # Buffer contains sequence of event headers followed by null padded file names
+            offset = 0
+            while offset < len(buffer):
+                _, mask, _, length = ConfigWatcher.EventHeader.unpack_from(
+                    buffer, offset
+                )
+                offset += ConfigWatcher.EventHeader.size
+                name = (
+                    buffer[offset:offset + length]
+                    .rstrip(b"\0")
+                    .decode(errors="replace")
+                )
+                offset += length
+
+                logger.debug("Config directory event %#x: %s", mask, name)
+                # Overflowed queue means that some events were lost, so directories have to be checked
+                if (mask & ConfigWatcher.IN_Q_OVERFLOW) or fnmatch.fnmatch(name, self.__pattern):
+                    changed = True
+
+        return changed
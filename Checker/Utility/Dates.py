@@ -0,0 +1,34 @@
+"""
+.DESCRIPTION
+    Class to handle date related operations.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import datetime
+from dateutil.parser import parse
+
+
+class Dates:
+
+    @staticmethod
+    def parseDate(text: str) -> datetime.datetime:
+        '''
+            Method to convert string to datetime.
+            ISO format is parsed directly, general purpose parser is used only for other formats
+        '''
+        try:
+            return datetime.datetime.fromisoformat(text)
+        except ValueError:
+            return parse(text)
@@ -0,0 +1,135 @@
+"""
+.DESCRIPTION
+    Utility class definition for shared HTTP client.
+    Single session is created per process, it keeps connections alive in the pool,
+    applies connect/read timeouts and retries failed requests with jittered backoff.
+    Requests sent to the same host are spread evenly to keep HTTP_RATE_LIMIT_PER_S limit.
+
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Add per host rate limit.
+
+"""
+
+import os
+import time
+import threading
+import requests
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from Log.Logger import logger
+
+
+class HTTPClient:
+
+    PoolSize = int(os.getenv('HTTP_POOL_SIZE', 10))
+    ConnectTimeout_s = float(os.getenv('HTTP_CONNECT_TIMEOUT_S', 5))
+    ReadTimeout_s = float(os.getenv('HTTP_READ_TIMEOUT_S', 30))
+    Retries = int(os.getenv('HTTP_RETRIES', 3))
+    BackoffFactor_s = float(os.getenv('HTTP_BACKOFF_FACTOR_S', 0.5))
+    BackoffJitter_s = float(os.getenv('HTTP_BACKOFF_JITTER_S', 0.5))
+    RateLimit_per_s = float(os.getenv('HTTP_RATE_LIMIT_PER_S', 0))
+
+    RetryStatusCodes = (429, 500, 502, 503, 504)
+
+    __session: requests.Session = None
+    __sessionPID: int = None
+    __lock = threading.Lock()
+    __nextSlots: dict[str, float] = {}
+    __rateLock = threading.Lock()
+
+    @staticmethod
+    def get(url: str, **kwargs) -> requests.Response:
+
+        # Apply default timeouts if they were not provided by the caller
+        kwargs.setdefault(
+            "timeout",
+            (HTTPClient.ConnectTimeout_s, HTTPClient.ReadTimeout_s)
+        )
+
+        HTTPClient.__wait_for_slot(url)
+
+        return HTTPClient.getSession().get(url, **kwargs)
+
+    @staticmethod
+    def getSession() -> requests.Session:
+
+        with HTTPClient.__lock:
+
+            # Session is created per process,
+            # connections opened before fork can not be shared with a child process
+            if (
+                (HTTPClient.__session is None) or
+                (HTTPClient.__sessionPID != os.getpid())
+            ):
+                HTTPClient.__session = HTTPClient.__create_session()
+                HTTPClient.__sessionPID = os.getpid()
+
+            return HTTPClient.__session
+
+    @staticmethod
+    def __wait_for_slot(url: str) -> None:
+
+        # Rate limit is disabled with 0
+        if HTTPClient.RateLimit_per_s <= 0:
+            return None
+
+        # Each request reserves the next free slot of its host,
+        # so concurrent threads are delayed one after another instead of sending requests at once
+        host = urlsplit(url).netloc
+        with HTTPClient.__rateLock:
+            now = time.monotonic()
+            slot = max(now, HTTPClient.__nextSlots.get(host, now))
+            HTTPClient.__nextSlots[host] = slot + (1 / HTTPClient.RateLimit_per_s)
+
+        if slot > now:
+            time.sleep(slot - now)
+
+        return None
+
+    @staticmethod
+    def __create_session() -> requests.Session:
+
+        logger.debug(
+            "Creating HTTP session. Pool size: %d, retries: %d",
+            HTTPClient.PoolSize,
+            HTTPClient.Retries
+        )
+
+        retryPolicy = Retry(
+            total=HTTPClient.Retries,
+            connect=HTTPClient.Retries,
+            read=HTTPClient.Retries,
+            status=HTTPClient.Retries,
+            backoff_factor=HTTPClient.BackoffFactor_s,
+            backoff_jitter=HTTPClient.BackoffJitter_s,
+            status_forcelist=HTTPClient.RetryStatusCodes,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTPClient.PoolSize,
+            pool_maxsize=HTTPClient.PoolSize,
+            max_retries=retryPolicy
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive"
+            }
+        )
+
+        return session
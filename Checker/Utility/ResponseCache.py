@@ -0,0 +1,199 @@
+"""
+.DESCRIPTION
+    Class to handle on-disk cache of HTTP responses.
+    Each entry is stored in separate JSON file named after hash of requested URL,
+    it contains validators returned by the server (ETag, Last-Modified)
+    and the value parsed from the response body,
+    so unchanged resources can be confirmed with conditional request without parsing the body again.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import os
+import json
+import time
+import hashlib
+from Log.Logger import logger
+
+
+class ResponseCache:
+    __dir_path: str = os.getenv(
+        'HTTP_CACHE_PATH', '/var/lib/checker/http_cache'
+    )
+    __max_entries: int = int(os.getenv('HTTP_CACHE_MAX_ENTRIES', 1000))
+    __max_age_s: float = float(os.getenv('HTTP_CACHE_MAX_AGE_S', 604800))
+
+    URL_LABEL: str = "URL"
+    ETAG_LABEL: str = "ETag"
+    LAST_MODIFIED_LABEL: str = "LastModified"
+    VALUE_LABEL: str = "Value"
+
+    @staticmethod
+    def isEnabled() -> bool:
+        '''
+            Method to check if cache is enabled.
+            Empty HTTP_CACHE_PATH variable disables the cache.
+        '''
+        return bool(ResponseCache.__dir_path)
+
+    @staticmethod
+    def read(url: str) -> dict[str, str]:
+        '''
+            Method to read cache entry for provided URL.
+            Returns None if there is no entry, it is expired or can not be read.
+        '''
+        if not ResponseCache.isEnabled():
+            return None
+
+        filePath = ResponseCache.__get_file_path(url)
+
+        # Entries older than max age are removed,
+        # so the resource is downloaded without validators
+        try:
+            if (time.time() - os.path.getmtime(filePath)) > ResponseCache.__max_age_s:
+                logger.debug("Cache entry for %s expired", url)
+                os.remove(filePath)
+                return None
+
+            with open(filePath, 'r') as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            logger.debug("Cache entry for %s NOT found", url)
+            return None
+        except:
+            logger.exception("Failed to read cache entry for %s", url, exc_info=True)
+            return None
+
+        # Hash collision or entry written for different URL
+        if entry.get(ResponseCache.URL_LABEL) != url:
+            return None
+
+        return entry
+
+    @staticmethod
+    def getValidatorHeaders(entry: dict[str, str]) -> dict[str, str]:
+        '''
+            Method to create headers for conditional request based on cache entry.
+            Returns empty dict if there is no entry.
+        '''
+        headers = {}
+        if entry is None:
+            return headers
+
+        if entry.get(ResponseCache.ETAG_LABEL):
+            headers["If-None-Match"] = entry[ResponseCache.ETAG_LABEL]
+
+        if entry.get(ResponseCache.LAST_MODIFIED_LABEL):
+            headers["If-Modified-Since"] = entry[ResponseCache.LAST_MODIFIED_LABEL]
+
+        return headers
+
+    @staticmethod
+    def write(url: str, responseHeaders: dict[str, str], value: str) -> bool:
+        '''
+            Method to save validators from response headers together with parsed value.
+            Nothing is saved if server did not return any validator.
+            Returns True if entry was saved, otherwise returns False
+        '''
+        if not ResponseCache.isEnabled():
+            return False
+
+        entry = {
+            ResponseCache.URL_LABEL: url,
+            ResponseCache.ETAG_LABEL: responseHeaders.get("ETag"),
+            ResponseCache.LAST_MODIFIED_LABEL: responseHeaders.get("Last-Modified"),
+            ResponseCache.VALUE_LABEL: value
+        }
+        if (entry[ResponseCache.ETAG_LABEL] is None) and (entry[ResponseCache.LAST_MODIFIED_LABEL] is None):
+            logger.debug("Response for %s has no validators", url)
+            return False
+
+        filePath = ResponseCache.__get_file_path(url)
+
+        # Write to temporary file and replace the entry at once,
+        # so the other thread never reads partially written file
+        try:
+            os.makedirs(ResponseCache.__dir_path, exist_ok=True)
+            tempPath = f"{filePath}.{os.getpid()}.{id(entry)}.tmp"
+            with open(tempPath, 'w') as file:
+                json.dump(entry, file)
+            os.replace(tempPath, filePath)
+        except:
+            logger.exception("Failed to save cache entry for %s", url, exc_info=True)
+            return False
+
+        ResponseCache.__evict()
+        return True
+
+    @staticmethod
+    def touch(url: str) -> None:
+        '''
+            Method to mark cache entry as fresh, after server confirmed it is not modified
+        '''
+        try:
+            os.utime(ResponseCache.__get_file_path(url))
+        except:
+            logger.exception("Failed to refresh cache entry for %s", url, exc_info=True)
+
+        return None
+
+    @staticmethod
+    def __evict() -> None:
+        '''
+            Method to remove the least recently validated entries above max number of entries
+        '''
+        try:
+            entries = [
+                entry for entry in os.scandir(ResponseCache.__dir_path)
+                if entry.name.endswith(".json")
+            ]
+        except:
+            logger.exception("Failed to list cache entries", exc_info=True)
+            return None
+
+        if len(entries) <= ResponseCache.__max_entries:
+            return None
+
+        logger.debug(
+            "Evicting %d cache entries",
+            len(entries) - ResponseCache.__max_entries
+        )
+        entries.sort(key=ResponseCache.__get_entry_time)
+        for entry in entries[:len(entries) - ResponseCache.__max_entries]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+        return None
+
+    @staticmethod
+    def __get_entry_time(entry: os.DirEntry) -> float:
+        '''
+            Method to get modification time of cache file, removed files are treated as the oldest
+        '''
+        try:
+            return entry.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    @staticmethod
+    def __get_file_path(url: str) -> str:
+        '''
+            Method to get cache file path for provided URL
+        '''
+        return os.path.join(
+            ResponseCache.__dir_path,
+            hashlib.sha256(url.encode()).hexdigest() + ".json"
+        )
@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.4
+    Version:            1.5
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -22,15 +22,20 @@
     
     2024-05-18      Stanisław Horna         Read class default intervals from environment variables.
 
+    2026-10-18      Stanisław Horna         Replace 1 second sleep loop with a single timed wait,
+                                            interrupted by stop signal or change in watched config directories.
+
 """
 
 import os
 import time
+import select
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from DataImporter.DataImporter import DataImporter
 from Status.StatusFile import StatusFile
 from Utility.Terminator import Terminator
+from Utility.ConfigWatcher import ConfigWatcher
 from Log.Logger import logger
 
 
@@ -57,6 +62,7 @@ class Sleeper:
     )
     __IMPORTER = DataImporter()
     __TERMINATOR = Terminator()
+    __WATCHER = ConfigWatcher(DataImporter.getConfigDirectories())
 
     __LastCheckIn: datetime = field(init=False)
     __NextCheckIn: datetime = field(init=False)
@@ -131,16 +137,17 @@ class Sleeper:
         # return calculated time to sleep
         return TimeToSleep
 
-    def __exit_sleep_loop(self) -> bool:
+    def __exit_sleep_loop(self, importConfigs: bool = True) -> bool:
         '''
             Method to check if there were any updates to config files, which were inserted to system,
             or next check in time already passed and verification if new quotation exists is needed.
+            Config directories are not listed if importConfigs is False.
         '''
         # read status file
         statusFileContent = StatusFile.readFile()
 
         # import fund and investment configs to system
-        configPutStatus = self.__IMPORTER.putChangedConfigs(
+        configPutStatus = importConfigs and self.__IMPORTER.putChangedConfigs(
             statusFileContent.get(
                 StatusFile.LAST_MODIFY_DATES_LABEL,
                 {}
@@ -184,58 +191,52 @@ class Sleeper:
         # as exiting wait loop is not needed
         return False
 
-    def __check_status_file(self, counter: int) -> bool:
-        '''
-            Method to check if status file should be read, based on configured check interval
-        '''
-        # +1 <- to skip triggering it for counter == 0,
-        # which will occur on the first iteration of main sleep loop
-        return (
-            (counter + 1) % (self.StatusFileCheckInterval_ms / 1000) == 0
-        )
-
     def __invoke_sleep(self, sleepTime: float):
         '''
-            Method to sleep for time remaining to next check in, which allows to receive stop signal
-            and actively checks config files changes to update existing config, once file will be updated.
+            Method to sleep for time remaining to next check in with a single timed wait,
+            which is interrupted by stop signal or by changed file in watched config directories.
+            Each wait is limited to the status file check interval, to keep heartbeat up to date
+            and to poll config directories if they are not watched.
         '''
 
         logger.debug("__invoke_sleep(%f)", sleepTime)
 
-        # get decimal part of sleep time
-        fractionTime = sleepTime % 1
+        # Descriptors which become readable on stop signal and on config file change
+        waitFor = [self.__TERMINATOR.fileno()]
+        if self.__WATCHER.isEnabled():
+            waitFor.append(self.__WATCHER.fileno())
 
-        # get number of full seconds to wait without decimal part
-        fullSeconds = int(sleepTime)
+        wakeUpTime = time.monotonic() + sleepTime
+        while (remainingTime := wakeUpTime - time.monotonic()) > 0:
 
-        # sleep for fraction time, as it will be less than 1 second
-        # and each wait loop iteration will sleep for 1 second
-        logger.debug("Sleeping for fraction time: %f", fractionTime)
-        time.sleep(fractionTime)
-
-        # Start sleep loop
-        logger.debug(
-            "Starting main sleep loop. Will be executed: %d times.",
-            fullSeconds
-        )
-        for c in range(0, fullSeconds):
+            logger.debug("Waiting for events: %f seconds", remainingTime)
+            ready, _, _ = select.select(
+                waitFor,
+                [],
+                [],
+                min(remainingTime, self.StatusFileCheckInterval_ms / 1000)
+            )
 
             # check if kill signal was sent, if yes exit the program
             if self.__TERMINATOR.getStatus() == True:
                 logger.info("Exiting program with code 0.")
                 exit(0)
 
-            # perform check on changes in status and config files
-            # on each n -th iteration defined based on StatusFileCheckInterval_ms
-            elif self.__check_status_file(c):
+            if self.__TERMINATOR.fileno() in ready:
+                self.__TERMINATOR.clearWakeUp()
 
-                # if returns true - some new data was imported, or next check in time passed
-                # exit the wait loop
-                if self.__exit_sleep_loop():
+            # config file was changed, import it and exit the wait loop if anything was imported
+            if self.__WATCHER.isEnabled() and (self.__WATCHER.fileno() in ready):
+                if self.__WATCHER.readChanges() and self.__exit_sleep_loop():
                     return None
 
-            # sleep program execution on each for loop iteration
-            time.sleep(1)
+            # wait timed out, refresh heartbeat in status file and check if next check in time changed,
+            # config directories are listed only if they are not watched
+            elif not ready:
+                if self.__exit_sleep_loop(
+                    importConfigs=not self.__WATCHER.isEnabled()
+                ):
+                    return None
 
         # refresh last and next check in dates
         self.checkIn()
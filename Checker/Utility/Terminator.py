@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.2
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -15,7 +15,10 @@
     Date            Who                     What
     2024-04-29      Stanisław Horna         Add logging capabilities.
 
+    2026-10-18      Stanisław Horna         Wake up waiting process with signal written to pipe.
+
 """
+import os
 import signal
 from Log.Logger import logger
 from dataclasses import dataclass, field
@@ -36,9 +39,26 @@ class Terminator:
         signal.signal(signal.SIGINT, self.exit_gracefully)
         signal.signal(signal.SIGTERM, self.exit_gracefully)
 
+        # Number of received signal is written to the pipe,
+        # so waiting on its read end is interrupted immediately
+        self.wakeup_fd, wakeupWrite = os.pipe()
+        os.set_blocking(self.wakeup_fd, False)
+        os.set_blocking(wakeupWrite, False)
+        signal.set_wakeup_fd(wakeupWrite)
+
     def exit_gracefully(self, signum, frame):
         logger.warning("Stop signal received.")
         self.kill_now = True
 
     def getStatus(self) -> bool:
         return self.kill_now
+
+    def fileno(self) -> int:
+        return self.wakeup_fd
+
+    def clearWakeUp(self) -> None:
+        try:
+            while os.read(self.wakeup_fd, 512):
+                pass
+        except BlockingIOError:
+            pass
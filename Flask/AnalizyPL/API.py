@@ -6,7 +6,7 @@
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.6
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -16,14 +16,22 @@
     Date            Who                     What
     2024-04-30      Stanisław Horna         Add logging capabilities.
 
+    2026-10-18      Stanisław Horna         Use shared HTTP client with connection pool, timeouts and retries.
+                                            Incremental mode converting only entries newer than provided date.
+                                            Parse dates with Dates.parseDate() fast path.
+                                            Return quotation entries as QuotationRow.
+                                            Log failed download with message, so exhausted retries are reported per fund.
+
 """
 from Utility.Logger import logger
 from dataclasses import dataclass, field
 from SQL.Fund import Fund
 from SQL.Quotation import Quotation
 import json
-import requests
-from dateutil.parser import parse
+import datetime
+from Utility.HTTPClient import HTTPClient
+from Utility.Dates import Dates
+from Utility.Rows import QuotationRow
 
 
 @dataclass
@@ -39,42 +47,81 @@ class AnalizyFundAPI:
     RESPONSE_PRICE_NAME = "value"
 
     @staticmethod
-    def downloadQuotation(fund: Fund) -> list[Quotation]:
+    def downloadQuotation(fund: Fund, newerThan: datetime.datetime = None) -> dict[str, str | list[QuotationRow]]:
 
-        logger.debug("downloadQuotation(%s)", fund.getFundID())
+        logger.debug("downloadQuotation(%s, %s)", fund.getFundID(), newerThan)
 
         # Create custom URL to access API to download JSON with all quotation
         URL = f"{AnalizyFundAPI.__API_URL}/{fund.getFundCategoryShort()}/{fund.getFundID()}"
 
         # Invoke web request and convert JSON response to dict
         try:
-            fundQuotationResponse = json.loads(requests.get(URL).content)
-        except:
-            logger.exception(exc_info=True)
+            fundQuotationResponse = json.loads(HTTPClient.get(URL).content)
+        except Exception:
+            logger.exception("Failed to download quotation for %s", fund.getFundID())
             return None
 
         fundID = fundQuotationResponse[AnalizyFundAPI.RESPONSE_ID]
-
-        result = {
-            "Fund_ID": fundID,
-            "Fund_Currency": None,
-            "FundQuotation": (
-                fundQuotationResponse[AnalizyFundAPI.RESPONSE_DETAILS][0][AnalizyFundAPI.RESPONSE_LIST]
-            )
-        }
+        quotationList = (
+            fundQuotationResponse[AnalizyFundAPI.RESPONSE_DETAILS][0][AnalizyFundAPI.RESPONSE_LIST]
+        )
 
         logger.debug(
             "Converting str types to proper ones (%s, %s)",
             AnalizyFundAPI.RESPONSE_DATE_NAME,
             AnalizyFundAPI.RESPONSE_PRICE_NAME
         )
-        for i in range(len(result["FundQuotation"])):
-            result["FundQuotation"][i][AnalizyFundAPI.RESPONSE_DATE_NAME] = parse(
-                result["FundQuotation"][i][AnalizyFundAPI.RESPONSE_DATE_NAME]
-            )
-            result["FundQuotation"][i][AnalizyFundAPI.RESPONSE_PRICE_NAME] = float(
-                result["FundQuotation"][i][AnalizyFundAPI.RESPONSE_PRICE_NAME]
-            )
-
-        logger.debug("Returning quotation")
+        if newerThan is None:
+            result = AnalizyFundAPI.__convertAll(quotationList)
+        else:
+            result = AnalizyFundAPI.__convertNewest(quotationList, newerThan)
+
+        logger.debug("Returning %d quotation entries", len(result))
+        return {
+            "Fund_ID": fundID,
+            "Fund_Currency": None,
+            "FundQuotation": result
+        }
+
+    @staticmethod
+    def __convertAll(quotationList: list[dict[str, str]]) -> list[QuotationRow]:
+        return [
+            AnalizyFundAPI.__convertEntry(entry)
+            for entry in quotationList
+        ]
+
+    @staticmethod
+    def __convertNewest(
+        quotationList: list[dict[str, str]],
+        newerThan: datetime.datetime
+    ) -> list[QuotationRow]:
+
+        # Entries older than 1 year before the last known date are not needed to calculate value changes,
+        # except the latest one of them, which is still compared with as yearly reference
+        windowStart = Dates.addDays(newerThan, -Dates.Yearly)
+
+        # Response is ordered by date, so it is enough to convert entries from the end
+        # until the first one outside of the window is reached
+        result = []
+        position = len(quotationList)
+        while (position := position - 1) >= 0:
+            entry = AnalizyFundAPI.__convertEntry(quotationList[position])
+
+            # Entries are not ordered, convert all of them to be on the safe side
+            if result and (entry.date >= result[-1].date):
+                logger.warning("Quotation is not ordered by date, converting all entries")
+                return AnalizyFundAPI.__convertAll(quotationList)
+            result.append(entry)
+
+            if entry.date <= windowStart:
+                break
+
+        result.reverse()
         return result
+
+    @staticmethod
+    def __convertEntry(entry: dict[str, str]) -> QuotationRow:
+        return QuotationRow(
+            Dates.parseDate(entry[AnalizyFundAPI.RESPONSE_DATE_NAME]),
+            float(entry[AnalizyFundAPI.RESPONSE_PRICE_NAME])
+        )
@@ -0,0 +1,67 @@
+"""
+.DESCRIPTION
+    Micro-benchmark of quotation date parsing.
+    Compares dateutil parser with Dates.parseDate() fast path on a 5,000-entry series
+    in the same format as returned by Analizy.pl API.
+
+    Run from Flask directory:
+        python -m Benchmarks.DateParsing
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import datetime
+import timeit
+from dateutil.parser import parse
+from Utility.Dates import Dates
+
+NUMBER_OF_ENTRIES = 5000
+REPEAT = 5
+
+
+def main():
+
+    # Create series of consecutive dates in API format
+    firstDate = datetime.date(2010, 1, 1)
+    series = [
+        Dates.convertDateToString(Dates.addDays(firstDate, i))
+        for i in range(NUMBER_OF_ENTRIES)
+    ]
+
+    # Both methods have to return the same dates
+    assert [parse(d) for d in series] == [Dates.parseDate(d) for d in series]
+
+    results = {
+        "dateutil.parser.parse": min(timeit.repeat(
+            lambda: [parse(d) for d in series],
+            number=1,
+            repeat=REPEAT
+        )),
+        "Dates.parseDate": min(timeit.repeat(
+            lambda: [Dates.parseDate(d) for d in series],
+            number=1,
+            repeat=REPEAT
+        ))
+    }
+
+    print(f"Parsing {NUMBER_OF_ENTRIES} dates, best of {REPEAT} runs")
+    for name, duration in results.items():
+        print(f"{name:<24}{duration * 1000:10.2f} ms")
+    print(
+        f"{'Speedup':<24}{results['dateutil.parser.parse'] / results['Dates.parseDate']:10.1f} x"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+.DESCRIPTION
+    Micro-benchmark of building investment orders index.
+    Compares the previous nested dict built with membership checks on lists of keys
+    with OrderLedger, for 10,000 recurring orders of 10 funds.
+
+    Run from Flask directory:
+        python -m Benchmarks.OrderLedger
+
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Remove cumulative lookups, as OrderLedger does not index them anymore.
+
+"""
+
+import random
+import datetime
+import timeit
+from Utility.OrderLedger import OrderLedger
+from Utility.Dates import Dates
+
+NUMBER_OF_ORDERS = 10000
+NUMBER_OF_FUNDS = 10
+REPEAT = 3
+
+
+def buildOrderMap(orders: list[tuple]) -> dict:
+
+    # Previous implementation of InvestmentCalcResult.getInvestmentOrderMap()
+    resultMap = {}
+    for date, fund_id, money in orders:
+        if date not in list(resultMap.keys()):
+            resultMap[date] = {}
+
+        if fund_id not in list(resultMap[date].keys()):
+            resultMap[date][fund_id] = {
+                "Money": 0,
+                "ParticipationUnits": 0
+            }
+
+        resultMap[date][fund_id]["Money"] += money
+
+    return resultMap
+
+
+def buildOrderLedger(orders: list[tuple]) -> OrderLedger:
+
+    orderLedger = OrderLedger()
+    for date, fund_id, money in orders:
+        orderLedger.add(date, fund_id, money)
+
+    return orderLedger
+
+
+def createOrders() -> tuple:
+
+    random.seed(0)
+    funds = [f"FUND{i}" for i in range(NUMBER_OF_FUNDS)]
+
+    # Orders sorted by date as they are read from DB, a few of them are placed on the same day
+    startDate = datetime.datetime(2000, 1, 1)
+    orders = []
+    for i in range(NUMBER_OF_ORDERS):
+        orders.append((
+            Dates.addDays(startDate, i - i // 10),
+            funds[i % NUMBER_OF_FUNDS],
+            random.randint(1, 20) * 50
+        ))
+
+    # Each fund is quoted on every order day
+    quot = {
+        fund: {date: 100.0 + random.random() for date, _, _ in orders}
+        for fund in funds
+    }
+
+    return orders, quot
+
+
+def main():
+
+    orders, quot = createOrders()
+    resultMap = buildOrderMap(orders)
+    orderLedger = buildOrderLedger(orders)
+    orderLedger.applyQuotation(quot)
+
+    # Both structures have to contain the same orders and invested money
+    assert list(resultMap) == orderLedger.getDates()
+    assert all(
+        resultMap[date][fund]["Money"] == order.money
+        for date in orderLedger
+        for fund, order in orderLedger.getOrders(date).items()
+    )
+
+    results = {
+        "Build nested dict": min(timeit.repeat(
+            lambda: buildOrderMap(orders),
+            number=1,
+            repeat=REPEAT
+        )),
+        "Build OrderLedger": min(timeit.repeat(
+            lambda: buildOrderLedger(orders).applyQuotation(quot),
+            number=1,
+            repeat=REPEAT
+        ))
+    }
+
+    print(
+        f"{NUMBER_OF_ORDERS} orders of {NUMBER_OF_FUNDS} funds, "
+        f"best of {REPEAT} runs"
+    )
+    for name, duration in results.items():
+        print(f"{name:<24}{duration * 1000:10.2f} ms")
+    print(
+        f"{'Build speedup':<24}{results['Build nested dict'] / results['Build OrderLedger']:10.1f} x"
+    )
+
+
+if __name__ == '__main__':
+    main()
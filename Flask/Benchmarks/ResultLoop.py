@@ -0,0 +1,261 @@
+"""
+.DESCRIPTION
+    Micro-benchmark of investment result calculation loop.
+    Compares the previous loop over each calendar day, which skipped days without quotation on KeyError,
+    with InvestmentCalcResult.generateRecords() driven by merged quotation and order dates.
+    Both variants calculate the same row types with OrderLedger, so only the loop driver is measured.
+    Synthetic investment contains 10 funds quoted on working days for 10 years and monthly orders.
+
+    Run from Flask directory, with API dependencies available, as calculation classes are imported:
+        python -m Benchmarks.ResultLoop
+
+
+.NOTES
+
+    Version:            1.4
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Compare calendar loop on dicts with calculation on row types.
+                                            Pass orders to calculation in OrderLedger.
+                                            Collect generated entries with local calculateRecords().
+                                            Compare loop drivers on the same row types, dict based loop moved to RowMemory benchmark.
+
+"""
+
+import copy
+import random
+import datetime
+import time
+import timeit
+import statistics
+from Processing.InvestmentCalcResult import InvestmentCalcResult
+from Utility.Dates import Dates
+from Utility.OrderLedger import OrderLedger
+from Utility.Rows import FundState, ResultRow
+from Utility.TimeSeriesIndex import TimeSeriesIndex
+
+NUMBER_OF_FUNDS = 10
+NUMBER_OF_YEARS = 10
+REPEAT = 21
+
+
+def calculateRecords(
+    investment_id: int,
+    funds: list[str],
+    orderLedger: OrderLedger,
+    quot: dict[str, dict[datetime.datetime, float]],
+    tempOwnedFunds: dict[str, FundState],
+    currentProcessingDate: datetime.datetime
+) -> list[ResultRow]:
+
+    # Collect entries generated by calculation into list, to compare and measure them at once
+    return list(
+        InvestmentCalcResult.generateRecords(
+            investment_id,
+            funds,
+            orderLedger,
+            quot,
+            tempOwnedFunds,
+            currentProcessingDate,
+            []
+        )
+    )
+
+
+def calculateRecordsCalendar(
+    investment_id: int,
+    funds: list[str],
+    orderLedger: OrderLedger,
+    quot: dict[str, dict[datetime.datetime, float]],
+    tempOwnedFunds: dict[str, FundState],
+    currentProcessingDate: datetime.datetime
+) -> list[ResultRow]:
+
+    # Body of InvestmentCalcResult.generateRecords() with the previous loop driver:
+    # each calendar day until now, funds without quotation are skipped on KeyError
+    result = []
+    existingResults = set()
+    fundHistory = TimeSeriesIndex.groupBy([], "fund_id", "result_date", funds)
+
+    endDate = datetime.datetime.now()
+    while currentProcessingDate <= endDate:
+
+        if currentProcessingDate in orderLedger:
+            for fund, order in orderLedger.getOrders(currentProcessingDate).items():
+
+                if order.participation_units is None:
+                    raise KeyError(currentProcessingDate)
+
+                tempOwnedFunds[fund].participation_units += (
+                    order.participation_units
+                )
+                tempOwnedFunds[fund].invested_money += (
+                    order.money
+                )
+
+        desiredDates = Dates.getDesiredDates(currentProcessingDate)
+
+        for fund in funds:
+
+            try:
+                quotation = quot[fund][currentProcessingDate]
+            except KeyError:
+                continue
+
+            if (fund, currentProcessingDate) in existingResults:
+                continue
+
+            fundState = tempOwnedFunds[fund]
+            record = ResultRow(
+                currentProcessingDate,
+                investment_id,
+                fund,
+                fundState.participation_units,
+                fundState.invested_money,
+                fundState.participation_units * quotation
+            )
+
+            for date in desiredDates:
+                if ((
+                    entryToCompare := fundHistory[fund].getEntryWithDesiredDate(
+                        desiredDates[date]
+                    )
+                ) is not None) and record.fund_invested_money > 0:
+                    colName = InvestmentCalcResult.ConvertPeriodNamesDatesToInvestmentResult[
+                        date]
+                    try:
+                        setattr(
+                            record,
+                            colName,
+                            (
+                                (record.fund_value - record.fund_invested_money) -
+                                (entryToCompare.fund_value -
+                                 entryToCompare.fund_invested_money)
+                            )
+                        )
+                    except:
+                        pass
+
+            result.append(record)
+            fundHistory[fund].append(record)
+            fundHistory[fund].trim(desiredDates["yearly"])
+
+        currentProcessingDate = Dates.addDays(currentProcessingDate, 1)
+
+    return result
+
+
+def createInvestment() -> tuple:
+
+    random.seed(0)
+    funds = [f"FUND{i}" for i in range(NUMBER_OF_FUNDS)]
+
+    # Quotations are available on working days only
+    today = datetime.datetime.combine(datetime.date.today(), datetime.time())
+    startDate = Dates.addDays(today, -365 * NUMBER_OF_YEARS)
+    workingDays = [
+        Dates.addDays(startDate, day)
+        for day in range((today - startDate).days + 1)
+        if Dates.addDays(startDate, day).weekday() < 5
+    ]
+    quot = {}
+    for fund in funds:
+        value = 100.0
+        quot[fund] = {}
+        for date in workingDays:
+            value *= 1 + random.uniform(-0.02, 0.021)
+            quot[fund][date] = value
+
+    # Each fund is bought once a month
+    orderLedger = OrderLedger()
+    for i, date in enumerate(workingDays[::21]):
+        orderLedger.add(date, funds[i % NUMBER_OF_FUNDS], 100)
+    orderLedger.applyQuotation(quot)
+
+    ownedFunds = {
+        fund: FundState()
+        for fund in funds
+    }
+
+    return funds, orderLedger, quot, ownedFunds, workingDays[0]
+
+
+def main():
+
+    funds, orderLedger, quot, ownedFunds, startDate = createInvestment()
+
+    # Both variants use the same row types and order ledger, only the loop driver differs
+    def runCalendar():
+        return calculateRecordsCalendar(
+            1, funds, orderLedger, quot, copy.deepcopy(ownedFunds), startDate
+        )
+
+    def runProcessingDates():
+        return calculateRecords(
+            1, funds, orderLedger, quot, copy.deepcopy(ownedFunds), startDate
+        )
+
+    # Both loops have to return the same entries
+    records = runProcessingDates()
+    assert [repr(record) for record in runCalendar()] == [
+        repr(record) for record in records
+    ]
+
+    # Work done by each driver does not depend on machine load:
+    # iterated dates and funds skipped because of missing quotation
+    calendarDays = (datetime.datetime.now() - startDate).days + 1
+    processingDates = len(
+        InvestmentCalcResult.getProcessingDates(
+            orderLedger, quot, startDate, datetime.datetime.now()
+        )
+    )
+    iterations = {
+        "Calendar days": (calendarDays, calendarDays * NUMBER_OF_FUNDS - len(records)),
+        "Processing dates": (processingDates, processingDates * NUMBER_OF_FUNDS - len(records))
+    }
+
+    # Variants are measured alternately with process CPU time,
+    # so changes of machine load affect both of them the same way
+    results = {
+        "Calendar days": [],
+        "Processing dates": []
+    }
+    for _ in range(REPEAT):
+        results["Calendar days"].append(
+            timeit.timeit(runCalendar, number=1, timer=time.process_time)
+        )
+        results["Processing dates"].append(
+            timeit.timeit(runProcessingDates, number=1, timer=time.process_time)
+        )
+
+    # Speedup is the median of ratios measured one after another, as load changes between the pairs
+    speedup = statistics.median(
+        calendar / processing
+        for calendar, processing in zip(results["Calendar days"], results["Processing dates"])
+    )
+    results = {
+        name: statistics.median(durations)
+        for name, durations in results.items()
+    }
+
+    print(
+        f"Calculating {NUMBER_OF_FUNDS} funds over {NUMBER_OF_YEARS} years, median CPU time of {REPEAT} runs"
+    )
+    print(f"{'':<24}{'CPU time':>10}{'dates':>10}{'skipped':>10}")
+    for name, duration in results.items():
+        print(
+            f"{name:<24}{duration * 1000:7.2f} ms{iterations[name][0]:10d}{iterations[name][1]:10d}"
+        )
+    print(
+        f"{'Speedup':<24}{speedup:8.2f} x"
+        f"{iterations['Calendar days'][0] / iterations['Processing dates'][0]:8.2f} x"
+    )
+
+
+if __name__ == '__main__':
+    main()
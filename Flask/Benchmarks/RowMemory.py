@@ -0,0 +1,236 @@
+"""
+.DESCRIPTION
+    Memory benchmark of rows kept by quotation download and investment result calculation.
+    Compares peak memory measured with tracemalloc for the previous dict based rows
+    and for compact row types defined in Utility.Rows.
+    Synthetic investment is the same as in ResultLoop benchmark.
+
+    Run from Flask directory, with API dependencies available, as calculation classes are imported:
+        python -m Benchmarks.RowMemory
+
+
+.NOTES
+
+    Version:            1.3
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Pass orders to calculation in OrderLedger.
+                                            Calculate result rows with calculateRecords() of ResultLoop benchmark.
+                                            Keep dict based calendar loop, as ResultLoop compares row types only.
+
+"""
+
+import copy
+import bisect
+import datetime
+import tracemalloc
+from Processing.InvestmentCalcResult import InvestmentCalcResult
+from Utility.Dates import Dates
+from Utility.OrderLedger import OrderLedger
+from Utility.Rows import FundState, QuotationRow
+from Benchmarks.ResultLoop import (
+    calculateRecords,
+    createInvestment,
+    NUMBER_OF_FUNDS,
+    NUMBER_OF_YEARS
+)
+
+NUMBER_OF_QUOTATIONS = 5000
+MB = 1024 * 1024
+
+
+class DictSeries:
+
+    # Sorted history of dict entries, as TimeSeriesIndex reads attributes of row types
+    def __init__(self) -> None:
+        self.dates = []
+        self.entries = []
+
+    def append(self, entry: dict) -> None:
+        self.dates.append(entry["result_date"])
+        self.entries.append(entry)
+
+    def getEntryWithDesiredDate(self, desiredDate: datetime.datetime) -> dict:
+        position = bisect.bisect_right(self.dates, desiredDate)
+        return self.entries[position - 1] if position else None
+
+
+def calculateRecordsDicts(
+    investment_id: int,
+    funds: list[str],
+    ordersMap: dict[datetime.datetime, dict[str, dict[str, float]]],
+    quot: dict[str, dict[datetime.datetime, float]],
+    tempOwnedFunds: dict[str, dict[str, float]],
+    currentProcessingDate: datetime.datetime
+) -> list[dict[str, str]]:
+
+    # Loop over each calendar day on dicts, as it was done before row types were introduced
+    result = []
+    fundHistory = {fund: DictSeries() for fund in funds}
+
+    while ((currentProcessingDate <= datetime.datetime.now())):
+
+        if currentProcessingDate in list(ordersMap.keys()):
+            for fund in ordersMap[currentProcessingDate]:
+                tempOwnedFunds[fund]["ParticipationUnits"] += (
+                    ordersMap[currentProcessingDate][fund]["Money"] /
+                    quot[fund][currentProcessingDate]
+                )
+                tempOwnedFunds[fund]["InvestedMoney"] += (
+                    ordersMap[currentProcessingDate][fund]["Money"]
+                )
+
+        desiredDates = Dates.getDesiredDates(currentProcessingDate)
+
+        for fund in funds:
+            try:
+                record = {
+                    "result_date": currentProcessingDate,
+                    "investment_id": investment_id,
+                    "fund_id": fund,
+                    "fund_participation_units": (
+                        tempOwnedFunds[fund]["ParticipationUnits"]
+                    ),
+                    "fund_invested_money": (
+                        tempOwnedFunds[fund]["InvestedMoney"]
+                    ),
+                    "fund_value": (
+                        tempOwnedFunds[fund]["ParticipationUnits"] *
+                        quot[fund][currentProcessingDate]
+                    ),
+                    "last_day_result": None,
+                    "last_week_result": None,
+                    "last_month_result": None,
+                    "last_year_result": None
+                }
+            except:
+                continue
+
+            for date in desiredDates:
+                if ((
+                    entryToCompare := fundHistory[fund].getEntryWithDesiredDate(
+                        desiredDates[date]
+                    )
+                ) != None) and record["fund_invested_money"] > 0:
+                    colName = InvestmentCalcResult.ConvertPeriodNamesDatesToInvestmentResult[
+                        date]
+                    record[colName] = (
+                        (record["fund_value"] - record["fund_invested_money"]) -
+                        (entryToCompare["fund_value"] -
+                         entryToCompare["fund_invested_money"])
+                    )
+
+            result.append(record)
+            fundHistory[fund].append(record)
+
+        currentProcessingDate = Dates.addDays(currentProcessingDate, 1)
+
+    return result
+
+
+def toDicts(
+    orderLedger: OrderLedger,
+    ownedFunds: dict[str, FundState]
+) -> tuple:
+
+    # Nested dicts used by calculation before row types were introduced
+    ordersDicts = {
+        date: {
+            fund: {
+                "Money": order.money,
+                "ParticipationUnits": order.participation_units
+            }
+            for fund, order in orderLedger.getOrders(date).items()
+        }
+        for date in orderLedger
+    }
+    ownedDicts = {
+        fund: {
+            "ParticipationUnits": state.participation_units,
+            "InvestedMoney": state.invested_money
+        }
+        for fund, state in ownedFunds.items()
+    }
+
+    return ordersDicts, ownedDicts
+
+
+def measurePeak(function) -> float:
+
+    # Result is kept until peak is read, as it is the memory held by worker
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return peak / MB
+
+
+def createQuotationDicts() -> list[dict]:
+
+    # Format returned by AnalizyFundAPI before QuotationRow was introduced
+    startDate = datetime.datetime(2000, 1, 1)
+    return [
+        {
+            "date": Dates.addDays(startDate, day),
+            "value": 100.0 + day / 100
+        }
+        for day in range(NUMBER_OF_QUOTATIONS)
+    ]
+
+
+def createQuotationRows() -> list[QuotationRow]:
+
+    startDate = datetime.datetime(2000, 1, 1)
+    return [
+        QuotationRow(
+            Dates.addDays(startDate, day),
+            100.0 + day / 100
+        )
+        for day in range(NUMBER_OF_QUOTATIONS)
+    ]
+
+
+def main():
+
+    funds, orderLedger, quot, ownedFunds, startDate = createInvestment()
+    ordersDicts, ownedDicts = toDicts(orderLedger, ownedFunds)
+
+    results = {
+        "Result rows": (
+            measurePeak(
+                lambda: calculateRecordsDicts(
+                    1, funds, ordersDicts, quot, copy.deepcopy(ownedDicts), startDate
+                )
+            ),
+            measurePeak(
+                lambda: calculateRecords(
+                    1, funds, orderLedger, quot, copy.deepcopy(ownedFunds), startDate
+                )
+            )
+        ),
+        "Quotation rows": (
+            measurePeak(createQuotationDicts),
+            measurePeak(createQuotationRows)
+        )
+    }
+
+    print(
+        f"Result rows of {NUMBER_OF_FUNDS} funds over {NUMBER_OF_YEARS} years, "
+        f"{NUMBER_OF_QUOTATIONS} quotation rows, tracemalloc peak"
+    )
+    print(f"{'':<18}{'dict [MB]':>12}{'rows [MB]':>12}{'reduction':>12}")
+    for name, (dictPeak, rowPeak) in results.items():
+        print(
+            f"{name:<18}{dictPeak:12.2f}{rowPeak:12.2f}{(1 - rowPeak / dictPeak) * 100:11.1f}%"
+        )
+
+
+if __name__ == '__main__':
+    main()
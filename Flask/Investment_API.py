@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.3
+    Version:            1.8
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -21,6 +21,13 @@
                                             Unified naming and structure.
     
     2024-04-30      Stanisław Horna         Add logging capabilities.
+
+    2026-10-18      Stanisław Horna         Calculation engine can be selected with "engine" query parameter.
+                                            Asynchronous job mode selected with "mode" query parameter.
+                                            Endpoint to get asynchronous job status implemented.
+                                            Recalculation of investment date range with "from" and "to" query parameters.
+                                            Quotation update of funds provided as JSON list in request body.
+                                            Refund calculation of investments provided as JSON list in request body.
     
 """
 
@@ -32,6 +39,7 @@ from Processing.Price import Price
 from Processing.InvestmentCalcResult import InvestmentCalcResult
 from Processing.FundConfig import FundConfig
 from Processing.InvestmentConfig import InvestmentConfig
+from Processing.AsyncJob import AsyncJob
 
 
 app = Flask(__name__)
@@ -90,9 +98,38 @@ def quotation_handler(id: str = None):
 
         case "PUT":
             logger.debug("Method: PUT")
-            responseCode, responseBody = (
-                Price.updateQuotation(id)
-            )
+
+            # Funds can be provided as JSON list of IDs in request body, instead of single ID in URL
+            invalidBody = False
+            if (id is None) and request.get_data():
+                id = request.get_json(silent=True)
+                invalidBody = (
+                    (not isinstance(id, list)) or
+                    (not id) or
+                    (not all(isinstance(fundID, str) for fundID in id))
+                )
+
+            if invalidBody:
+                logger.error("Request body is not a list of fund IDs")
+                responseCode, responseBody = (
+                    400,
+                    {"Status": "Request body has to be a JSON list of fund IDs"}
+                )
+            elif AsyncJob.isAsync(request.args.get('mode')):
+                logger.debug("Submitting asynchronous job")
+                responseCode, responseBody = (
+                    AsyncJob.submit(
+                        "FundQuotation",
+                        ",".join(sorted(id)) if isinstance(id, list) else id,
+                        None,
+                        Price.updateQuotation,
+                        id
+                    )
+                )
+            else:
+                responseCode, responseBody = (
+                    Price.updateQuotation(id)
+                )
 
     logger.debug(
         "quotation_handler(%s). Returning body and code: %d",
@@ -144,15 +181,109 @@ def refund_handler(id: int = None):
     match (request.method):
 
         case "PUT":
-            if id is None:
+            # Calculation engine is optional, if it is not provided the default one is used
+            engine = request.args.get('engine')
+
+            # Date range is optional, if start date is provided only results depending on the range are calculated again
+            dateFrom = request.args.get('from')
+            dateTo = request.args.get('to')
+
+            # Investments can be provided as JSON list of IDs in request body, instead of single ID in URL
+            investmentIDs = None
+            if (id is None) and request.get_data():
+                investmentIDs = request.get_json(silent=True)
+                if (
+                    (not isinstance(investmentIDs, list)) or
+                    (not investmentIDs) or
+                    (not all(
+                        isinstance(investmentID, int) and not isinstance(investmentID, bool)
+                        for investmentID in investmentIDs
+                    ))
+                ):
+                    investmentIDs = []
+
+            if investmentIDs == []:
+                logger.error("Request body is not a list of investment IDs")
+                responseCode, responseBody = (
+                    400,
+                    {"Status": "Request body has to be a JSON list of investment IDs"}
+                )
+            elif dateFrom is not None and id is None:
+                logger.debug("Method: PUT, date range without ID")
+                responseCode, responseBody = (
+                    400,
+                    {"Status": "Date range can be recalculated only for provided investment ID"}
+                )
+            elif dateFrom is not None and AsyncJob.isAsync(request.args.get('mode')):
+                logger.debug("Submitting asynchronous job, date range")
+                responseCode, responseBody = (
+                    AsyncJob.submit(
+                        "InvestmentRefundRange",
+                        id,
+                        {"engine": engine, "from": dateFrom, "to": dateTo},
+                        InvestmentCalcResult.recalculateRange,
+                        id,
+                        dateFrom,
+                        dateTo,
+                        engine
+                    )
+                )
+            elif dateFrom is not None:
+                logger.debug("Method: PUT, date range")
+                responseCode, responseBody = (
+                    InvestmentCalcResult.recalculateRange(
+                        id, dateFrom, dateTo, engine
+                    )
+                )
+            elif AsyncJob.isAsync(request.args.get('mode')) and investmentIDs is not None:
+                logger.debug("Submitting asynchronous job, ID list")
+                responseCode, responseBody = (
+                    AsyncJob.submit(
+                        "InvestmentRefund",
+                        ",".join(str(investmentID) for investmentID in sorted(set(investmentIDs))),
+                        {"engine": engine},
+                        InvestmentCalcResult.calculateSelectedResults,
+                        investmentIDs,
+                        engine
+                    )
+                )
+            elif AsyncJob.isAsync(request.args.get('mode')) and id is None:
+                logger.debug("Submitting asynchronous job, ID is none")
+                responseCode, responseBody = (
+                    AsyncJob.submit(
+                        "InvestmentRefund",
+                        id,
+                        {"engine": engine},
+                        InvestmentCalcResult.calculateAllResults,
+                        engine
+                    )
+                )
+            elif AsyncJob.isAsync(request.args.get('mode')):
+                logger.debug("Submitting asynchronous job, ID is NOT none")
+                responseCode, responseBody = (
+                    AsyncJob.submit(
+                        "InvestmentRefund",
+                        id,
+                        {"engine": engine},
+                        InvestmentCalcResult.calculateResult,
+                        id,
+                        engine
+                    )
+                )
+            elif investmentIDs is not None:
+                logger.debug("Method: PUT, ID list")
+                responseCode, responseBody = (
+                    InvestmentCalcResult.calculateSelectedResults(investmentIDs, engine)
+                )
+            elif id is None:
                 logger.debug("Method: PUT, ID is none")
                 responseCode, responseBody = (
-                    InvestmentCalcResult.calculateAllResults()
+                    InvestmentCalcResult.calculateAllResults(engine)
                 )
             else:
                 logger.debug("Method: PUT, ID is NOT none")
                 responseCode, responseBody = (
-                    InvestmentCalcResult.calculateResult(id)
+                    InvestmentCalcResult.calculateResult(id, engine)
                 )
 
     logger.debug(
@@ -163,6 +294,27 @@ def refund_handler(id: int = None):
     return responseBody, responseCode
 
 
+@app.route('/Jobs/<int:id>', methods=['GET'])
+def job_handler(id: int):
+
+    logger.info("job_handler(%s), method: %s", id, (request.method))
+
+    match (request.method):
+
+        case "GET":
+            logger.debug("Method: GET")
+            responseCode, responseBody = (
+                AsyncJob.getJob(id)
+            )
+
+    logger.debug(
+        "job_handler(%s). Returning body and code: %d",
+        id,
+        responseCode
+    )
+    return responseBody, responseCode
+
+
 if __name__ == '__main__':
     app.run(
         debug=FLASK_DEBUG_MODE,
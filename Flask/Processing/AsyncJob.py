@@ -0,0 +1,359 @@
+"""
+.DESCRIPTION
+    Class definition for static methods related to asynchronous API jobs.
+    Job state is stored in DB, so it can be read by any API process,
+    while the work itself is done by background thread of the process which accepted the request.
+    Duplicate submissions for the same target and parameters are coalesced into the job which is already queued or running.
+
+
+.NOTES
+
+    Version:            1.2
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Coalesce submissions only if their parameters are the same.
+                                            Check if job for given target is queued.
+
+"""
+
+import os
+import inspect
+import datetime
+import threading
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import func, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
+from SQL.Job import Job
+from SQL.write import Session_rw
+from SQL.read import Session_ro
+from Utility.Logger import logger
+
+
+class JobProgress:
+
+    def __init__(self, job_id: int) -> None:
+        self.__job_id = job_id
+
+    def start(self) -> None:
+        self.__update(
+            job_status="Running",
+            job_started_date=datetime.datetime.now()
+        )
+        return None
+
+    def setTotal(self, totalItems: int) -> None:
+        self.__update(job_total_items=totalItems)
+        return None
+
+    def itemCompleted(self, itemStatus: dict[str, str]) -> None:
+        self.__update(itemStatus=itemStatus)
+        return None
+
+    def finish(self, responseCode: int, responseBody: list | dict) -> None:
+        self.__update(
+            finalItems=responseBody if isinstance(responseBody, list) else [responseBody],
+            job_status="Completed",
+            job_response_code=responseCode,
+            job_response_body=responseBody,
+            job_finished_date=datetime.datetime.now()
+        )
+        return None
+
+    def fail(self, err: Exception) -> None:
+        self.__update(
+            job_status="Failed",
+            job_response_code=500,
+            job_response_body={
+                "Status": f"Job failed {type(err)}",
+                "Status Details": str(err)
+            },
+            job_finished_date=datetime.datetime.now()
+        )
+        return None
+
+    def __update(
+        self,
+        itemStatus: dict[str, str] = None,
+        finalItems: list[dict[str, str]] = None,
+        **columns
+    ) -> None:
+
+        # Progress is saved in separate session,
+        # so it is visible for other processes while the job is still running
+        s_rw = Session_rw()
+        try:
+            job = s_rw.get(Job, self.__job_id)
+
+            for column, value in columns.items():
+                setattr(job, column, value)
+
+            if itemStatus is not None:
+                job.job_items = job.job_items + [itemStatus]
+                job.job_completed_items += 1
+
+            # Job did not report any progress, so final response is the only item status
+            if (finalItems is not None) and (job.job_total_items is None):
+                job.job_items = finalItems
+                job.job_total_items = len(finalItems)
+                job.job_completed_items = len(finalItems)
+
+            job.job_updated_date = datetime.datetime.now()
+            s_rw.commit()
+        except:
+            # Failed progress update must not interrupt the job itself
+            logger.exception(
+                "Failed to update job %s",
+                self.__job_id,
+                exc_info=True
+            )
+            s_rw.rollback()
+
+        s_rw.close()
+        return None
+
+
+class AsyncJob:
+
+    JobModes = ("SYNC", "ASYNC")
+    DefaultJobMode = os.getenv('JOB_MODE', "SYNC").upper()
+    JobWorkers = int(os.getenv('JOB_WORKERS', 1))
+    JobTimeout_s = int(os.getenv('JOB_TIMEOUT_S', 3600))
+
+    ActiveStatuses = ("Queued", "Running")
+    UniqueViolationCode = "23505"
+
+    __executor: ThreadPoolExecutor = None
+    __executorPID: int = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def isAsync(mode: str = None) -> bool:
+        return (mode or AsyncJob.DefaultJobMode).upper() == "ASYNC"
+
+    @staticmethod
+    def submit(
+        jobType: str,
+        targetID: str | int,
+        parameters: dict[str, str],
+        function: Callable[..., tuple[int, list | dict]],
+        *args
+    ) -> tuple[int, dict[str, str]]:
+
+        logger.debug("submit(%s, %s, %s)", jobType, targetID, parameters)
+
+        # Jobs for all funds or investments are stored with empty target
+        targetKey = "" if targetID is None else str(targetID)
+
+        s_rw = Session_rw()
+        try:
+            AsyncJob.__fail_abandoned_jobs(s_rw)
+
+            # Unique index allows only one active job for given type, target and parameters,
+            # if there is one already, new job is not created and the existing one is returned,
+            # submission with different parameters (e.g. date range or engine) creates a new job
+            try:
+                job = Job(jobType, targetKey, parameters)
+                s_rw.add(job)
+                s_rw.commit()
+                coalesced = False
+            except IntegrityError as err:
+                s_rw.rollback()
+
+                # Only unique violation means that the job is already active,
+                # any other constraint violation is reported as failure
+                if getattr(err.orig, "pgcode", None) != AsyncJob.UniqueViolationCode:
+                    raise
+
+                job = AsyncJob.__get_active_job(
+                    s_rw, jobType, targetKey, parameters, AsyncJob.ActiveStatuses
+                )
+                coalesced = True
+
+                # Active job has finished in the meantime, so the submission has to be repeated
+                if job is None:
+                    s_rw.close()
+                    return AsyncJob.submit(
+                        jobType, targetID, parameters, function, *args
+                    )
+
+            responseBody = job.toDict()
+        except Exception as err:
+            logger.exception("Failed to create job", exc_info=True)
+            s_rw.rollback()
+            s_rw.close()
+            return 500, {
+                "Status": f"Failed to create job {type(err)}",
+                "Status Details": str(err)
+            }
+
+        s_rw.close()
+
+        if coalesced:
+            logger.info(
+                "Job for %s %s is already active, returning job %s",
+                jobType,
+                targetKey,
+                responseBody["Job ID"]
+            )
+        else:
+            AsyncJob.__get_executor().submit(
+                AsyncJob.__run,
+                responseBody["Job ID"],
+                function,
+                args
+            )
+
+        responseBody["Coalesced"] = coalesced
+        return 202, responseBody
+
+    @staticmethod
+    def isQueued(jobType: str, targetID: str | int, parameters: dict[str, str]) -> bool:
+
+        # Job which did not start yet will process all changes committed before it starts
+        targetKey = "" if targetID is None else str(targetID)
+
+        s_ro = Session_ro()
+        try:
+            job = AsyncJob.__get_active_job(
+                s_ro, jobType, targetKey, parameters, ("Queued",)
+            )
+        except:
+            logger.exception("Failed to get queued job", exc_info=True)
+            job = None
+        s_ro.close()
+
+        return job is not None
+
+    @staticmethod
+    def __get_active_job(
+        session,
+        jobType: str,
+        targetKey: str,
+        parameters: dict[str, str],
+        statuses: tuple[str]
+    ) -> Job:
+        return (
+            session
+            .query(Job)
+            .filter(
+                Job.job_type == jobType,
+                Job.job_target_id == targetKey,
+                func.coalesce(Job.job_parameters, type_coerce({}, JSONB)) ==
+                type_coerce(parameters or {}, JSONB),
+                Job.job_status.in_(statuses)
+            )
+            .first()
+        )
+
+    @staticmethod
+    def getJob(job_id: int) -> tuple[int, dict[str, str]]:
+
+        logger.debug("getJob(%s)", job_id)
+
+        s_ro = Session_ro()
+        try:
+            job = s_ro.get(Job, job_id)
+        except Exception as err:
+            logger.exception("Failed to get job %s", job_id, exc_info=True)
+            s_ro.close()
+            return 500, {
+                "Job ID": job_id,
+                "Status": "Failed to retrieve data from DB",
+                "Status Details": str(err)
+            }
+
+        if job is None:
+            s_ro.close()
+            return 404, {
+                "Job ID": job_id,
+                "Status": f"Job with ID: {job_id} does not exist"
+            }
+
+        responseBody = job.toDict()
+        s_ro.close()
+
+        return 200, responseBody
+
+    @staticmethod
+    def __run(
+        job_id: int,
+        function: Callable[..., tuple[int, list | dict]],
+        args: tuple
+    ) -> None:
+
+        logger.info("Starting job %s", job_id)
+        progress = JobProgress(job_id)
+        progress.start()
+
+        try:
+            # Progress is reported by functions processing multiple items,
+            # the other ones are treated as a single item job
+            if "progress" in inspect.signature(function).parameters:
+                responseCode, responseBody = function(*args, progress=progress)
+            else:
+                responseCode, responseBody = function(*args)
+
+            progress.finish(responseCode, responseBody)
+        except Exception as err:
+            logger.exception("Job %s failed", job_id, exc_info=True)
+            progress.fail(err)
+
+        logger.info("Job %s finished", job_id)
+        return None
+
+    @staticmethod
+    def __fail_abandoned_jobs(session) -> None:
+
+        # Job which was not updated for longer than timeout was lost together with process running it,
+        # it is marked as failed so the target can be submitted again
+        abandonedBefore = (
+            datetime.datetime.now() -
+            datetime.timedelta(seconds=AsyncJob.JobTimeout_s)
+        )
+        abandonedJobs = (
+            session
+            .query(Job)
+            .filter(
+                Job.job_status.in_(AsyncJob.ActiveStatuses),
+                Job.job_updated_date < abandonedBefore
+            )
+            .all()
+        )
+        for job in abandonedJobs:
+            logger.warning("Job %s abandoned", job.job_id)
+            job.job_status = "Failed"
+            job.job_response_code = 500
+            job.job_response_body = {
+                "Status": "Job abandoned",
+                "Status Details": f"No progress for {AsyncJob.JobTimeout_s}s"
+            }
+            job.job_finished_date = datetime.datetime.now()
+
+        session.commit()
+        return None
+
+    @staticmethod
+    def __get_executor() -> ThreadPoolExecutor:
+
+        with AsyncJob.__lock:
+
+            # Executor is created in each API process separately,
+            # threads started before fork do not exist in child process
+            if (
+                (AsyncJob.__executor is None) or
+                (AsyncJob.__executorPID != os.getpid())
+            ):
+                AsyncJob.__executor = ThreadPoolExecutor(
+                    max_workers=AsyncJob.JobWorkers,
+                    thread_name_prefix="AsyncJob"
+                )
+                AsyncJob.__executorPID = os.getpid()
+
+            return AsyncJob.__executor
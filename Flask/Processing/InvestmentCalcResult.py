@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.6
+    Version:            1.24
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -27,22 +27,77 @@
 
     2024-05-06      Stanisław Horna         Add missing I/O datatypes. Refactor variable names.
 
+    2026-10-18      Stanisław Horna         Day loop moved to .generateRecords().
+                                            Calculation engine selectable per call or by CALCULATION_ENGINE variable.
+                                            Look up for entries to compare with based on TimeSeriesIndex.
+                                            Calculated entries written in batches with ResultWriter.
+                                            Report per investment progress of asynchronous job.
+                                            Process pool execution mode selectable by CALCULATION_MODE variable.
+                                            Read fund quotations from QuotationCache.
+                                            Load investment data with constant number of queries, expose stage timings.
+                                            Read result window from ResultCheckpoint instead of whole history.
+                                            Gap filling mode selectable by RESULT_UNIFY_MODE variable.
+                                            Loop through merged quotation and order dates instead of calendar days.
+                                            Use compact row types for orders, owned funds and results.
+                                            Build orders into OrderLedger instead of nested dicts.
+                                            Stream generated entries to the writer, read only the window of result history.
+                                            Recalculate results of provided date range with .recalculateRange().
+                                            Calculate results of provided list of investments with .calculateSelectedResults().
+                                            Queue refresh of investments holding funds with new quotation.
+                                            Read result history of range recalculation up to its last day only.
+                                            Calculate results of the same investment under InvestmentLock.
+                                            Keep .calculateRecords() list wrapper in ResultLoop benchmark only.
+                                            Begin and end counted QuotationCache cycle around each refresh.
+                                            Replace locks inherited by forked calculation worker.
+                                            Do not generate entries kept in gap filling mode instead of skipping them while writing.
+                                            Accept range dates only in YYYY-MM-DD format.
+
 """
 
+import os
 import datetime
+from typing import Iterator
+from itertools import zip_longest
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from sqlalchemy import func, orm
 from SQL.Quotation import Quotation
 from SQL.InvestmentResult import InvestmentResult
 from SQL.Investment import Investment
+from SQL import read, write
 from SQL.write import Session_rw
 from SQL.read import Session_ro
+from SQL.ResultWriter import ResultWriter
+from SQL.QuotationCache import QuotationCache
+from SQL.InvestmentLock import InvestmentLock
 from Processing.InvestmentConfig import InvestmentConfig
+from Processing.InvestmentCalcVectorized import InvestmentCalcVectorized
+from Processing.ResultCheckpoint import ResultCheckpoint
+from Processing.AsyncJob import AsyncJob, JobProgress
 from Utility.Dates import Dates
+from Utility.TimeSeriesIndex import TimeSeriesIndex
+from Utility.StageTimer import StageTimer
+from Utility.OrderLedger import OrderLedger
+from Utility.Rows import FundState, ResultRow
+from Utility.HTTPClient import HTTPClient
 from Utility.Logger import logger
 
 
 class InvestmentCalcResult:
 
+    CalculationEngines = ("LOOP", "NUMPY")
+    DefaultCalculationEngine = os.getenv('CALCULATION_ENGINE', "LOOP")
+
+    CalculationModes = ("SERIAL", "PROCESS")
+    CalculationMode = os.getenv('CALCULATION_MODE', "SERIAL").upper()
+    CalculationWorkers = int(os.getenv('CALCULATION_WORKERS', os.cpu_count()))
+
+    UnifyModes = ("DELETE", "GAPFILL")
+    UnifyMode = os.getenv('RESULT_UNIFY_MODE', "DELETE").upper()
+
+    RefreshOnQuotationModes = ("ASYNC", "NONE")
+    RefreshOnQuotationMode = os.getenv('REFRESH_ON_QUOTATION', "ASYNC").upper()
+
     ConvertPeriodNamesDatesToInvestmentResult = {
         "daily": "last_day_result",
         "weekly": "last_week_result",
@@ -51,17 +106,12 @@ class InvestmentCalcResult:
     }
 
     @staticmethod
-    def calculateAllResults() -> tuple[int, list[dict[str, str]]]:
+    def calculateAllResults(engine: str = None, progress: JobProgress = None) -> tuple[int, list[dict[str, str]]]:
 
-        logger.debug("calculateAllResults()")
+        logger.debug("calculateAllResults(%s)", engine)
 
-        # Create session and init processing variables
+        # Create session
         s_ro = Session_ro()
-        responseCode = 200
-        responseBody = {
-            "Codes": [],
-            "Response": []
-        }
 
         # Get IDs for investments existing in DB
         try:
@@ -74,13 +124,189 @@ class InvestmentCalcResult:
                 "Status Details": str(e)
             }
 
-        # Loop through each investment and invoke result calculation
-        for id in investmentsToRefresh:
-            logger.debug("Processing investment ID: %s", id)
-            # invoke investment calculation
-            r_code, r_body = InvestmentCalcResult.calculateResult(id)
+        responseCode, responseBody = InvestmentCalcResult.calculateResults(
+            investmentsToRefresh,
+            s_ro,
+            engine,
+            progress
+        )
+
+        # Close SQL session
+        s_ro.close()
+
+        logger.debug(
+            "calculateAllResults(). Returning body and code: %d",
+            responseCode
+        )
+        return responseCode, responseBody
+
+    @staticmethod
+    def calculateSelectedResults(
+        investmentIDs: list[int],
+        engine: str = None,
+        progress: JobProgress = None
+    ) -> tuple[int, list[dict[str, str]]]:
+
+        logger.debug("calculateSelectedResults(%s, %s)", str(investmentIDs), engine)
+
+        # Create session
+        s_ro = Session_ro()
+
+        # Check all provided IDs with a single query, instead of validating each investment separately,
+        # duplicated IDs are calculated only once
+        investmentIDs = list(dict.fromkeys(investmentIDs))
+        existingIDs = InvestmentConfig.getInvestmentIDs(s_ro, investmentIDs)
+        if existingIDs is None:
+            s_ro.close()
+
+            return 400, {
+                "Status": "Failed to download Investment IDs"
+            }
+
+        # Report investments which do not exist, remaining ones are calculated as usual
+        missingInvestments = []
+        for id in investmentIDs:
+            if id not in existingIDs:
+                logger.error("Investment with ID: %s does not exist", id)
+                missingInvestments.append(
+                    {
+                        "Investment ID": id,
+                        "Status": f"Investment with ID: {id} does not exist"
+                    }
+                )
+
+        responseCode, responseBody = InvestmentCalcResult.calculateResults(
+            [id for id in investmentIDs if id in existingIDs],
+            s_ro,
+            engine,
+            progress
+        )
+
+        # Some of provided investments do not exist, so the refresh is partial
+        if missingInvestments and (responseCode == 200):
+            responseCode = 206
 
-            # append result variable
+        # Close SQL session
+        s_ro.close()
+
+        logger.debug(
+            "calculateSelectedResults(). Returning body and code: %d",
+            responseCode
+        )
+        return responseCode, missingInvestments + responseBody
+
+    @staticmethod
+    def refreshFundInvestments(fundIDs: list[str]) -> list[dict[str, str]]:
+
+        logger.debug(
+            "refreshFundInvestments(%s), mode: %s",
+            str(fundIDs),
+            InvestmentCalcResult.RefreshOnQuotationMode
+        )
+
+        if (InvestmentCalcResult.RefreshOnQuotationMode == "NONE") or (not fundIDs):
+            return []
+
+        # Refresh of all investments which did not start yet will include the new quotation
+        if AsyncJob.isQueued("InvestmentRefund", None, {"engine": None}):
+            logger.info("Refresh of all investments is already queued")
+            return []
+
+        # Find investments holding funds with new quotation, only those have to be calculated again
+        s_ro = Session_ro()
+        try:
+            investmentIDs = InvestmentConfig.getFundInvestmentIDs(fundIDs, s_ro)
+        except:
+            logger.exception("Failed to get investments holding funds", exc_info=True)
+            investmentIDs = []
+        s_ro.close()
+
+        if not investmentIDs:
+            logger.debug("No investment holds funds: %s", str(fundIDs))
+            return []
+
+        # Calculation of each investment is queued as separate background job with the same target and parameters
+        # as PUT /InvestmentRefund/<id>?mode=async, so it is coalesced with refresh of that investment which is already active,
+        # the quotation update returns without waiting for them
+        jobs = []
+        for investmentID in investmentIDs:
+            responseCode, responseBody = AsyncJob.submit(
+                "InvestmentRefund",
+                investmentID,
+                {"engine": None},
+                InvestmentCalcResult.calculateResult,
+                investmentID
+            )
+            logger.info(
+                "Refresh of investment %s submitted with code %d: %s",
+                investmentID,
+                responseCode,
+                responseBody
+            )
+            jobs.append(responseBody)
+
+        return jobs
+
+    @staticmethod
+    def calculateResults(
+        investmentIDs: list[int],
+        session: orm.session.Session,
+        engine: str = None,
+        progress: JobProgress = None
+    ) -> tuple[int, list[dict[str, str]]]:
+
+        logger.debug("calculateResults(%s, %s)", str(investmentIDs), engine)
+
+        # Init processing variables
+        responseCode = 200
+        responseBody = {
+            "Codes": [],
+            "Response": []
+        }
+
+        # Cycle is counted, so cache is not cleared by the other refresh running at the same time
+        QuotationCache.beginCycle()
+        try:
+            # Load quotation of all funds used by investments at once,
+            # so they do not have to be read from DB again for each investment
+            try:
+                QuotationCache.load(
+                    InvestmentConfig.getInvestmentFundIDs(investmentIDs, session),
+                    session
+                )
+            except:
+                logger.exception("Failed to load quotation cache", exc_info=True)
+
+            # Report number of investments to process if it is running as asynchronous job
+            if progress is not None:
+                progress.setTotal(len(investmentIDs))
+
+            match (InvestmentCalcResult.CalculationMode):
+
+                case "PROCESS":
+                    results = InvestmentCalcResult.calculateResultsInProcessPool(
+                        investmentIDs,
+                        engine,
+                        progress
+                    )
+
+                case _:
+                    results = []
+                    # Loop through each investment and invoke result calculation
+                    for id in investmentIDs:
+                        logger.debug("Processing investment ID: %s", id)
+                        # invoke investment calculation
+                        results.append(
+                            InvestmentCalcResult.calculateResult(id, engine)
+                        )
+                        if progress is not None:
+                            progress.itemCompleted(results[-1][1])
+        finally:
+            # Quotation is kept in cache only during the refresh, unless it is shared between requests
+            QuotationCache.endCycle()
+
+        # append result variable
+        for r_code, r_body in results:
             responseBody["Codes"].append(r_code)
             responseBody["Response"].append(r_body)
 
@@ -94,143 +320,564 @@ class InvestmentCalcResult:
             if 400 in responseBody["Codes"]:
                 responseCode = 400
 
-        # Close SQL session
-        s_ro.close()
-
         logger.debug(
-            "calculateAllResults(). Returning body and code: %d",
+            "calculateResults(). Returning body and code: %d",
             responseCode
         )
         return responseCode, responseBody["Response"]
 
     @staticmethod
-    def calculateResult(investment_id: int) -> tuple[int, dict[str, str]]:
+    def calculateResultsInProcessPool(
+        investmentIDs: list[int],
+        engine: str = None,
+        progress: JobProgress = None
+    ) -> list[tuple[int, dict[str, str]]]:
+
+        logger.debug(
+            "calculateResultsInProcessPool(%s, %s), workers: %d",
+            str(investmentIDs),
+            engine,
+            InvestmentCalcResult.CalculationWorkers
+        )
+
+        # Workers are forked from the API process, as it is not started by regular python interpreter.
+        # Spawn and forkserver start methods can not be used, as they start new interpreter,
+        # which is not able to import uwsgidecorators required by Logger.
+        # API process runs other threads (requests and asynchronous jobs), so each worker
+        # replaces inherited locks in .initWorker() before the calculation is started.
+        # Each investment is calculated in separate process, so the calculation loops run on all cores
+        with ProcessPoolExecutor(
+            max_workers=InvestmentCalcResult.CalculationWorkers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=InvestmentCalcResult.initWorker
+        ) as executor:
+            calculations = {
+                executor.submit(
+                    InvestmentCalcResult.calculateResult,
+                    id,
+                    engine
+                ): i
+                for i, id in enumerate(investmentIDs)
+            }
+
+            # Collect results in the same order as investments were provided,
+            # progress is reported as soon as any calculation is completed
+            results = [None] * len(investmentIDs)
+            for calculation in as_completed(calculations):
+                try:
+                    results[calculations[calculation]] = calculation.result()
+                except Exception as e:
+                    logger.exception("Calculation process failed", exc_info=True)
+                    results[calculations[calculation]] = (500, {
+                        "Investment ID": investmentIDs[calculations[calculation]],
+                        "Status": "Calculation process failed",
+                        "Status Details": str(e)
+                    })
+
+                if progress is not None:
+                    progress.itemCompleted(results[calculations[calculation]][1])
+
+        return results
+
+    @staticmethod
+    def initWorker() -> None:
+
+        # Connections inherited from parent process can not be shared,
+        # drop them without closing, so each worker opens its own ones
+        read.engine.dispose(close=False)
+        write.engine.dispose(close=False)
+
+        # Locks of shared classes might be held by the other thread of API process at the moment of fork,
+        # they are replaced, so the worker does not wait for a thread which does not exist in it.
+        # Quotation loaded by the parent process is kept. AsyncJob is not used by the worker,
+        # progress is reported by the parent process.
+        QuotationCache.initAfterFork()
+        HTTPClient.initAfterFork()
+
+        return None
+
+    @staticmethod
+    def calculateResult(investment_id: int, engine: str = None) -> tuple[int, dict[str, str]]:
+
+        # Results of the same investment are calculated by one thread or process at a time,
+        # otherwise deletes and inserts of concurrent calculations collide with each other
+        with InvestmentLock(investment_id):
+            return InvestmentCalcResult.__calculate_result(investment_id, engine)
+
+    @staticmethod
+    def __calculate_result(investment_id: int, engine: str = None) -> tuple[int, dict[str, str]]:
+
+        logger.debug("calculateResult(%s, %s)", investment_id, engine)
+
+        # Select calculation engine, if it is not provided use the default one
+        calculationEngine = (
+            engine or InvestmentCalcResult.DefaultCalculationEngine
+        ).upper()
+
+        if calculationEngine not in InvestmentCalcResult.CalculationEngines:
+            responseCode = 400
+            logger.error(
+                "Unknown calculation engine %s, setting code to %d",
+                calculationEngine,
+                responseCode
+            )
+            return responseCode, {
+                "Investment ID": investment_id,
+                "Status": f"Unknown calculation engine: {calculationEngine}"
+            }
 
-        logger.debug("calculateResult(%s)", investment_id)
-        # Create new SQL session
+        # Create new SQL session, it is used for all reads and writes related to the investment
         s_rw = Session_rw()
-        s_ro = Session_ro()
+
+        # Init timer to measure duration of each processing stage
+        timer = StageTimer()
 
         try:
-            # Check if provided ID exists in DB
-            if (Investment.IDisValid(investment_id, s_ro) != True):
-                responseCode = 404
-                logger.debug(
-                    "Provided Investment ID %s does not exist, setting code to %d",
+            # Get all data required for calculation with constant number of queries
+            data = InvestmentCalcResult.loadInvestmentData(
+                investment_id, s_rw, timer
+            )
+        except Exception as e:
+            logger.exception("Exception occurred", exc_info=True)
+            resultBody = {
+                "Investment ID": investment_id,
+                "Status": "Failed to retrieve data from DB",
+                "Status_Details": str(e)
+            }
+            responseCode = 500
+            logger.debug(
+                "calculateResult(%s). Returning body and code: %d",
+                investment_id,
+                responseCode
+            )
+            s_rw.close()
+            return responseCode, resultBody
+
+        # Investment without any order does not exist
+        if data is None:
+            responseCode = 404
+            logger.debug(
+                "Provided Investment ID %s does not exist, setting code to %d",
+                investment_id,
+                responseCode
+            )
+            resultBody = {
+                "Investment ID": investment_id,
+                "Status": f"Investment with ID: {investment_id} does not exist"
+            }
+            logger.debug(
+                "calculateResult(%s). Returning body and code: %d",
+                investment_id,
+                responseCode
+            )
+            s_rw.close()
+            return responseCode, resultBody
+
+        # Init writer, which will send calculated entries to DB in batches,
+        # while calculation is still running
+        writer = ResultWriter(s_rw)
+
+        # Calculated entries are passed through checkpoint to the writer,
+        # so the new checkpoint can be saved together with them
+        checkpoint = ResultCheckpoint(
+            investment_id, data["funds"], data["SQLdata"], writer
+        )
+        output = checkpoint if ResultCheckpoint.isEnabled() else writer
+
+        logger.debug("Calculating refund with %s engine", calculationEngine)
+        # Stream entries generated day by day by selected calculation engine to the writer,
+        # which sends them to DB in batches, so only the batch and the year window are kept in memory,
+        # in verification mode entries calculated with checkpoint are compared with the ones based on whole history
+        verification = None
+        with timer.stage("calculate"):
+            if data["checkpointData"] is None:
+                for record in InvestmentCalcResult.streamRecords(
+                    calculationEngine,
                     investment_id,
-                    responseCode
-                )
-                resultBody = {
-                    "Investment ID": investment_id,
-                    "Status": f"Investment with ID: {investment_id} does not exist"
-                }
-                logger.debug(
-                    "calculateResult(%s). Returning body and code: %d",
+                    data,
+                    data["tempOwnedFunds"],
+                    data["SQLdata"]
+                ):
+                    output.append(record)
+            else:
+                verification = InvestmentCalcResult.verifyCheckpoint(
+                    calculationEngine,
                     investment_id,
-                    responseCode
+                    data,
+                    output
                 )
-                return responseCode, resultBody
-
-            # Get necessary details required for calculation
-            # start date <- oldest date when some fund was bought
-            # funds <- list of involved funds
-            # ordersMap <- dict of dates and operations
-            start_date, funds, ordersMap = InvestmentCalcResult.getInvestmentOrderMap(
-                investment_id, s_ro
+
+        # Init processing variables
+        responseCode = 200
+        resultBody = []
+
+        logger.debug("Writing remaining calculation entries")
+        # Write entries which were not written yet and try to commit.
+        try:
+            with timer.stage("write"):
+                writer.flush()
+                if ResultCheckpoint.isEnabled():
+                    checkpoint.save(s_rw)
+                s_rw.commit()
+            logger.debug("Changes successfully committed")
+            resultBody = {
+                "Investment ID": investment_id,
+                "Status": "Results calculated and added successfully",
+                "Last Result Date": Dates.convertDateToString(writer.getLastResultDate())
+            }
+        except IndexError as indexErr:
+            logger.warning("No new result to add", exc_info=True)
+            s_rw.rollback()
+            resultBody = {
+                "Investment ID": investment_id,
+                "Status": "No new Result to add"
+            }
+        except Exception as e:
+            responseCode = 206
+            logger.exception("Failed to add entry", exc_info=True)
+            s_rw.rollback()
+            resultBody = {
+                "Investment ID": investment_id,
+                "Status": "Failed to add results",
+                "Status Details": str(e)
+            }
+
+        if ResultCheckpoint.CheckpointMode == "VERIFY":
+            resultBody["Checkpoint Verification"] = verification or {
+                "Status": "Not Available"
+            }
+
+        # Expose duration of each stage, to be able to verify where the time goes
+        resultBody["Stage Timings [ms]"] = timer.toDict()
+        logger.info(
+            "Investment %s stage timings [ms]: %s",
+            investment_id,
+            resultBody["Stage Timings [ms]"]
+        )
+
+        s_rw.close()
+        logger.debug(
+            "calculateResult(%s). Returning body and code: %d",
+            investment_id,
+            responseCode
+        )
+        return responseCode, resultBody
+
+    @staticmethod
+    def recalculateRange(
+        investment_id: int,
+        dateFrom: str,
+        dateTo: str = None,
+        engine: str = None
+    ) -> tuple[int, dict[str, str]]:
+
+        # Range is recalculated under the same lock as the whole investment
+        with InvestmentLock(investment_id):
+            return InvestmentCalcResult.__recalculate_range(
+                investment_id, dateFrom, dateTo, engine
             )
 
-            # Get quotations for each fund starting from start date of the oldest investment
-            quot = InvestmentCalcResult.getFundsQuotation(
-                funds, start_date, s_ro
+    @staticmethod
+    def __recalculate_range(
+        investment_id: int,
+        dateFrom: str,
+        dateTo: str = None,
+        engine: str = None
+    ) -> tuple[int, dict[str, str]]:
+
+        logger.debug(
+            "recalculateRange(%s, %s, %s, %s)",
+            investment_id,
+            dateFrom,
+            dateTo,
+            engine
+        )
+
+        # Select calculation engine, if it is not provided use the default one
+        calculationEngine = (
+            engine or InvestmentCalcResult.DefaultCalculationEngine
+        ).upper()
+
+        if calculationEngine not in InvestmentCalcResult.CalculationEngines:
+            responseCode = 400
+            logger.error(
+                "Unknown calculation engine %s, setting code to %d",
+                calculationEngine,
+                responseCode
             )
+            return responseCode, {
+                "Investment ID": investment_id,
+                "Status": f"Unknown calculation engine: {calculationEngine}"
+            }
 
-            # Check the latest update, to avoid calculating everything from the beginning
-            lastUpdateDate = InvestmentCalcResult.getLastResultDate(
-                investment_id, s_rw
+        # Start date of the range is required, if end date is not provided range lasts until today.
+        # Dates are parsed strictly as YYYY-MM-DD, as results are calculated for whole days
+        try:
+            rangeStart = Dates.convertStringToDate(dateFrom)
+            rangeEnd = (
+                Dates.convertStringToDate(dateTo)
+                if dateTo is not None
+                else datetime.datetime.now()
             )
-        except Exception:
+            if rangeStart > rangeEnd:
+                raise ValueError("Start date is newer than end date")
+        except Exception as e:
+            responseCode = 400
+            logger.error(
+                "Invalid date range %s - %s, setting code to %d",
+                dateFrom,
+                dateTo,
+                responseCode
+            )
+            return responseCode, {
+                "Investment ID": investment_id,
+                "Status": "Invalid date range, provide from and optional to as YYYY-MM-DD",
+                "Status Details": str(e)
+            }
+
+        # Create new SQL session, it is used for all reads and writes related to the investment,
+        # so deleted entries are restored if recalculation fails
+        s_rw = Session_rw()
+
+        # Init timer to measure duration of each processing stage
+        timer = StageTimer()
+
+        try:
+            # Delete affected results and get all data required to calculate them again
+            data = InvestmentCalcResult.loadRangeData(
+                investment_id, rangeStart, rangeEnd, s_rw, timer
+            )
+        except Exception as e:
             logger.exception("Exception occurred", exc_info=True)
-            resultBody = {
+            s_rw.rollback()
+            s_rw.close()
+            return 500, {
                 "Investment ID": investment_id,
                 "Status": "Failed to retrieve data from DB",
                 "Status_Details": str(e)
             }
-            responseCode = 500
+
+        # Investment without any order does not exist
+        if data is None:
+            responseCode = 404
             logger.debug(
-                "calculateResult(%s). Returning body and code: %d",
+                "Provided Investment ID %s does not exist, setting code to %d",
                 investment_id,
                 responseCode
             )
-            s_ro.close()
             s_rw.close()
-            return responseCode, resultBody
+            return responseCode, {
+                "Investment ID": investment_id,
+                "Status": f"Investment with ID: {investment_id} does not exist"
+            }
 
-        # Init temp dict for owned participation units
-        tempOwnedFunds = {}
+        # Range starts after the latest result, it will be calculated by regular refresh
+        if data["recalculateTo"] is None:
+            s_rw.close()
+            return 200, {
+                "Investment ID": investment_id,
+                "Status": "No results in provided range"
+            }
 
-        # Check if there is an lastUpdateDate if not, we have to count from the beginning
-        if lastUpdateDate is None:
+        # Entries are streamed to the writer until the last day depending on the range,
+        # results after it are left untouched
+        writer = ResultWriter(s_rw)
+        with timer.stage("calculate"):
+            for record in InvestmentCalcResult.streamRecords(
+                calculationEngine,
+                investment_id,
+                data,
+                data["tempOwnedFunds"],
+                data["SQLdata"]
+            ):
+                if record.result_date > data["recalculateTo"]:
+                    break
 
-            logger.debug("Last update is none")
+                writer.append(record)
 
-            # Set processing date to start date to begin calculation at day 0
-            currentProcessingDate = start_date
+        # Write entries which were not written yet and try to commit deletion and new entries at once
+        try:
+            with timer.stage("write"):
+                writer.flush()
+                s_rw.commit()
+            responseCode = 200
+            resultBody = {
+                "Investment ID": investment_id,
+                "Status": "Results recalculated successfully",
+                "Recalculated From": Dates.convertDateToString(data["currentProcessingDate"]),
+                "Recalculated To": Dates.convertDateToString(data["recalculateTo"])
+            }
+        except Exception as e:
+            responseCode = 206
+            logger.exception("Failed to add entry", exc_info=True)
+            s_rw.rollback()
+            resultBody = {
+                "Investment ID": investment_id,
+                "Status": "Failed to recalculate results",
+                "Status Details": str(e)
+            }
 
-            # fill in initiated temp dict
-            for fund in funds:
-                tempOwnedFunds[fund] = {
-                    "ParticipationUnits": 0,
-                    "InvestedMoney": 0
-                }
+        # Expose duration of each stage, to be able to verify where the time goes
+        resultBody["Stage Timings [ms]"] = timer.toDict()
 
-        # if there is an lastUpdateDate we can skip already calculated days
-        else:
+        s_rw.close()
+        logger.debug(
+            "recalculateRange(%s). Returning body and code: %d",
+            investment_id,
+            responseCode
+        )
+        return responseCode, resultBody
 
-            logger.debug("Last update is NOT none")
+    @staticmethod
+    def streamRecords(
+        calculationEngine: str,
+        investment_id: int,
+        data: dict[str, object],
+        tempOwnedFunds: dict[str, FundState],
+        SQLdata: list[ResultRow]
+    ) -> Iterator[ResultRow]:
 
-            # Get information about,
-            # participation units and invested money for each fund and assign it to temp dict
-            for fund in funds:
+        match (calculationEngine):
 
-                LastFundResult = InvestmentCalcResult.getLastFundResult(
+            case "NUMPY":
+                return InvestmentCalcVectorized.generateRecords(
                     investment_id,
-                    fund,
-                    lastUpdateDate,
-                    s_ro
+                    data["funds"],
+                    data["orderLedger"],
+                    data["quot"],
+                    tempOwnedFunds,
+                    data["currentProcessingDate"],
+                    SQLdata,
+                    data.get("existingResults")
                 )
 
-                tempOwnedFunds[fund] = {
-                    "ParticipationUnits": LastFundResult[0],
-                    "InvestedMoney": LastFundResult[1]
-                }
+            case _:
+                return InvestmentCalcResult.generateRecords(
+                    investment_id,
+                    data["funds"],
+                    data["orderLedger"],
+                    data["quot"],
+                    tempOwnedFunds,
+                    data["currentProcessingDate"],
+                    SQLdata,
+                    data.get("existingResults")
+                )
 
-            # Increment processing date to the next date as
-            # lastUpdateDate is a date retrieved form DB, which means it was already calculated
-            currentProcessingDate = Dates.addDays(lastUpdateDate, 1)
+    @staticmethod
+    def verifyCheckpoint(
+        calculationEngine: str,
+        investment_id: int,
+        data: dict[str, object],
+        result: ResultWriter | ResultCheckpoint
+    ) -> dict[str, str]:
+
+        # Owned funds are modified by calculation engines,
+        # so each calculation gets its own state
+        checkpointOwnedFunds = InvestmentCalcResult.getOwnedFunds(
+            data["funds"], data["lastUpdateDate"], data["checkpointData"]
+        )
+        identicalState = (
+            repr(checkpointOwnedFunds) == repr(data["tempOwnedFunds"])
+        )
 
-            # Get historical data to be able to calculate profits compared to last week, month etc.
-            SQLdata = InvestmentResult.getInvestmentResult(
-                investment_id, s_ro)
+        historyRecords = InvestmentCalcResult.streamRecords(
+            calculationEngine,
+            investment_id,
+            data,
+            data["tempOwnedFunds"],
+            data["SQLdata"]
+        )
+        checkpointRecords = InvestmentCalcResult.streamRecords(
+            calculationEngine,
+            investment_id,
+            data,
+            checkpointOwnedFunds,
+            data["checkpointData"]
+        )
 
-        logger.debug("Calculating refund")
-        # Init result variable
-        result = []
+        # Both streams are consumed together and entries are compared with their text representation,
+        # so any difference including float rounding is reported.
+        # Entries calculated with whole history are the ones written to DB
+        identicalRecords = True
+        comparedEntries = 0
+        for historyRecord, checkpointRecord in zip_longest(historyRecords, checkpointRecords):
+            if repr(historyRecord) != repr(checkpointRecord):
+                identicalRecords = False
+
+            if historyRecord is not None:
+                result.append(historyRecord)
+                comparedEntries += 1
+
+        if identicalState and identicalRecords:
+            logger.info(
+                "Checkpoint of investment %s verified, %d identical entries",
+                investment_id,
+                comparedEntries
+            )
+        else:
+            logger.error(
+                "Checkpoint of investment %s is different than result history",
+                investment_id
+            )
+
+        return {
+            "Status": "Identical" if (identicalState and identicalRecords) else "Different",
+            "Compared Entries": comparedEntries
+        }
+
+    @staticmethod
+    def generateRecords(
+        investment_id: int,
+        funds: list[str],
+        orderLedger: OrderLedger,
+        quot: dict[str, dict[datetime.datetime, float]],
+        tempOwnedFunds: dict[str, FundState],
+        currentProcessingDate: datetime.datetime,
+        SQLdata: list[ResultRow],
+        existingResults: set[tuple[str, datetime.datetime]] = None
+    ) -> Iterator[ResultRow]:
+
+        # Entries which are already stored in DB are not created again,
+        # they have to be provided in SQLdata as well, so following days are compared with them
+        if existingResults is None:
+            existingResults = set()
+
+        # Create sorted index of historical entries for each fund,
+        # SQLdata is empty if calculation was started from the beginning,
+        # calculated entries are added to it and trimmed to the year window,
+        # so memory does not grow with the length of investment history
+        fundHistory = TimeSeriesIndex.groupBy(
+            SQLdata,
+            "fund_id",
+            "result_date",
+            funds
+        )
+
+        # Entries can be created only on days with quotation of any fund or with an order,
+        # so the loop goes through such dates until now instead of each calendar day
+        processingDates = InvestmentCalcResult.getProcessingDates(
+            orderLedger,
+            quot,
+            currentProcessingDate,
+            datetime.datetime.now()
+        )
+        for currentProcessingDate in processingDates:
 
-        # loop through each day until now
-        while ((currentProcessingDate <= datetime.datetime.now())):
+            # If current date exists in order ledger it means that fund was sold or bought
+            if currentProcessingDate in orderLedger:
 
-            # If current date exists in orders map it means that fund was sold or bought
-            if currentProcessingDate in list(ordersMap.keys()):
+                # Loop through funds to increment participation units and invested money,
+                # units are already calculated by the ledger, order without quotation can not be processed
+                for fund, order in orderLedger.getOrders(currentProcessingDate).items():
 
-                # Loop through funds to increment participation units and invested money
-                for fund in ordersMap[currentProcessingDate]:
+                    if order.participation_units is None:
+                        raise KeyError(currentProcessingDate)
 
-                    tempOwnedFunds[fund]["ParticipationUnits"] += (
-                        ordersMap[currentProcessingDate][fund]["Money"] /
-                        quot[fund][currentProcessingDate]
+                    tempOwnedFunds[fund].participation_units += (
+                        order.participation_units
                     )
-                    tempOwnedFunds[fund]["InvestedMoney"] += (
-                        ordersMap[currentProcessingDate][fund]["Money"]
+                    tempOwnedFunds[fund].invested_money += (
+                        order.money
                     )
 
             # Get desired dates to calculate:
@@ -243,62 +890,42 @@ class InvestmentCalcResult:
             # Loop through each fund in investment
             for fund in funds:
 
-                # Try to calculate record entry
-                # Try is required if currentProcessingDate is a weekend or bank holiday
-                # on such days there is no quotation so any calculation which requires it will fail
-                try:
-                    record = {
-                        "result_date": currentProcessingDate,
-                        "investment_id": investment_id,
-                        "fund_id": fund,
-                        "fund_participation_units": (
-                            tempOwnedFunds[fund]["ParticipationUnits"]
-                        ),
-                        "fund_invested_money": (
-                            tempOwnedFunds[fund]["InvestedMoney"]
-                        ),
-                        "fund_value": (
-                            tempOwnedFunds[fund]["ParticipationUnits"] *
-                            quot[fund][currentProcessingDate]
-                        ),
-                        "last_day_result": None,
-                        "last_week_result": None,
-                        "last_month_result": None,
-                        "last_year_result": None
-                    }
-                except:
-                    # If calculation failed, nothing to worry about, just go to next fund
-                    # It might be that at current time there is no quotation for particular fund.
+                # Skip the fund if there is no quotation at current date,
+                # e.g. other funds are quoted on bank holidays of its market
+                fundQuotation = quot.get(fund, {})
+                if currentProcessingDate not in fundQuotation:
                     continue
 
+                # Skip the fund if its entry is already stored in DB and kept in fund history,
+                # e.g. in gap filling mode for funds quoted later than the others
+                if (fund, currentProcessingDate) in existingResults:
+                    continue
+
+                # Row is created with positional arguments in ResultRow field order
+                fundState = tempOwnedFunds[fund]
+                record = ResultRow(
+                    currentProcessingDate,
+                    investment_id,
+                    fund,
+                    fundState.participation_units,
+                    fundState.invested_money,
+                    (
+                        fundState.participation_units *
+                        fundQuotation[currentProcessingDate]
+                    )
+                )
+
                 # Loop through each time period to calculate appropriate column value
                 for date in desiredDates:
 
-                    # Based on the information if lastUpdateDate exists or not,
-                    # look up for historical data will be different.
-                    # If there is no such date it means that all data we can have is stored in memory,
-                    # so we do not have to check the SQL data
-                    if lastUpdateDate == None:
-                        listToLookUp = [
-                            entry for entry in result
-                            if entry["fund_id"] == fund
-                        ]
-                    else:
-                        listToLookUp = [
-                            entry for entry in (SQLdata + result)
-                            if entry["fund_id"] == fund
-                        ]
-
-                    # Use Dates method to get entry with required date,
+                    # Use fund history index to get entry with required date,
                     # if output is None, it means that there is nothing to count,
                     # as the fund was not bought on desired date yet
                     if ((
-                        entryToCompare := Dates.getEntryWithDesiredDate(
-                            listToLookUp,
-                            "result_date",
+                        entryToCompare := fundHistory[fund].getEntryWithDesiredDate(
                             desiredDates[date]
                         )
-                    ) != None) and record["fund_invested_money"] > 0:
+                    ) is not None) and record.fund_invested_money > 0:
 
                         # If the condition is met we can retrieve destination column name
                         colName = InvestmentCalcResult.ConvertPeriodNamesDatesToInvestmentResult[
@@ -308,85 +935,272 @@ class InvestmentCalcResult:
                         # try is required as used method can create entries with 0,
                         # for funds which were not bought since the beginning of investment
                         try:
-                            record[colName] = (
+                            setattr(
+                                record,
+                                colName,
                                 (
-                                    (record["fund_value"] - record["fund_invested_money"]) -
-                                    (entryToCompare["fund_value"] -
-                                     entryToCompare["fund_invested_money"])
+                                    (record.fund_value - record.fund_invested_money) -
+                                    (entryToCompare.fund_value -
+                                     entryToCompare.fund_invested_money)
                                 )
                             )
                         except:
                             # If calculation fails, nothing to worry, fund was not bought yet.
                             pass
 
-                # Append the result list with entry ready to insert to DB
-                result.append(record)
+                # Pass entry ready to insert to DB to the consumer
+                # and add it to fund history to be able to compare with it on following days
+                yield record
+                fundHistory[fund].append(record)
 
-            # Calculate next processing date and go to the beginning of while loop
-            currentProcessingDate = Dates.addDays(currentProcessingDate, 1)
+                # Following dates are newer, so entries older than the current yearly one are not needed
+                fundHistory[fund].trim(desiredDates["yearly"])
 
-        # Init processing variables
-        responseCode = 200
-        resultBody = []
+    @staticmethod
+    def getProcessingDates(
+        orderLedger: OrderLedger,
+        quot: dict[str, dict[datetime.datetime, float]],
+        start_date: datetime.datetime,
+        end_date: datetime.datetime
+    ) -> list[datetime.datetime]:
+
+        # Merge order dates with quotation dates of all funds
+        dates = set(orderLedger)
+        for fundQuotation in quot.values():
+            dates.update(fundQuotation)
 
-        logger.debug("Adding calculation entries to session")
-        # Loop through each entry in result var, create an DB entry, add it to session and try to commit.
-        for output in result:
-            record = InvestmentResult(
-                **output
+        return sorted(
+            date for date in dates
+            if start_date <= date <= end_date
+        )
+
+    @staticmethod
+    def loadInvestmentData(
+        investment_id: int,
+        session: orm.session.Session,
+        timer: StageTimer
+    ) -> dict[str, object]:
+
+        # Get necessary details required for calculation
+        # start date <- oldest date when some fund was bought
+        # funds <- list of involved funds
+        # orderLedger <- orders indexed by date and by fund
+        with timer.stage("orders"):
+            start_date, funds, orderLedger = InvestmentCalcResult.getInvestmentOrderLedger(
+                investment_id, session
             )
-            s_rw.add(record)
 
-        try:
-            s_rw.commit()
-            logger.debug("Changes successfully committed")
-            resultBody = {
-                "Investment ID": investment_id,
-                "Status": "Results calculated and added successfully",
-                "Last Result Date": Dates.convertDateToString((result[-1]["result_date"]))
-            }
-        except IndexError as indexErr:
-            logger.warning("No new result to add", exc_info=True)
-            s_rw.rollback()
-            resultBody = {
-                "Investment ID": investment_id,
-                "Status": "No new Result to add"
-            }
-        except Exception as e:
-            responseCode = 206
-            logger.exception("Failed to add entry", exc_info=True)
-            s_rw.rollback()
-            resultBody = {
-                "Investment ID": investment_id,
-                "Status": "Failed to add results",
-                "Status Details": str(e)
+        if funds is None:
+            raise RuntimeError("Failed to retrieve investment orders")
+
+        # Investment without orders does not exist
+        if not funds:
+            return None
+
+        # Get quotations for all funds starting from start date of the oldest investment
+        # and calculate participation units bought with each order
+        with timer.stage("quotations"):
+            quot = InvestmentCalcResult.getFundsQuotation(
+                funds, start_date, session
+            )
+            orderLedger.applyQuotation(quot)
+
+        # Check the latest update, to avoid calculating everything from the beginning,
+        # in gap filling mode results newer than it are kept, so calculation engines do not create them again
+        existingResults = []
+        with timer.stage("unify"):
+            lastUpdateDate = InvestmentCalcResult.getLastResultDate(
+                investment_id, session
+            )
+            if (lastUpdateDate is not None) and (InvestmentCalcResult.UnifyMode == "GAPFILL"):
+                existingResults = InvestmentCalcResult.getExistingResults(
+                    investment_id, lastUpdateDate, session
+                )
+
+        # Check if there is an lastUpdateDate if not, we have to count from the beginning
+        if lastUpdateDate is None:
+
+            logger.debug("Last update is none")
+
+            # Set processing date to start date to begin calculation at day 0
+            # and fill in temp dict for owned participation units
+            return {
+                "funds": funds,
+                "orderLedger": orderLedger,
+                "quot": quot,
+                "lastUpdateDate": None,
+                "checkpointData": None,
+                "existingResults": set(),
+                "tempOwnedFunds": {
+                    fund: FundState()
+                    for fund in funds
+                },
+                "currentProcessingDate": start_date,
+                "SQLdata": []
             }
 
-        s_ro.close()
-        s_rw.close()
-        logger.debug(
-            "calculateResult(%s). Returning body and code: %d",
-            investment_id,
-            responseCode
-        )
-        return responseCode, resultBody
+        logger.debug("Last update is NOT none")
+
+        # Checkpoint contains only results required to calculate profits compared to last week, month etc.
+        checkpointData = None
+        if ResultCheckpoint.isEnabled():
+            with timer.stage("checkpoint"):
+                checkpointData = ResultCheckpoint.load(
+                    investment_id, funds, lastUpdateDate, session
+                )
+
+            # Checkpoint contains entries up to the last complete date only, unlike result history,
+            # so entries kept in gap filling mode are added to compare following days with them
+            if (checkpointData is not None) and existingResults:
+                checkpointData = checkpointData + existingResults
+
+        # Get historical data if there is no valid checkpoint or it has to be verified,
+        # participation units and invested money for each fund are taken from the same data.
+        # Only the same window as in checkpoint is required to calculate following days
+        if (checkpointData is None) or (ResultCheckpoint.CheckpointMode == "VERIFY"):
+            with timer.stage("history"):
+                SQLdata = InvestmentResult.getInvestmentResult(
+                    investment_id,
+                    session,
+                    Dates.addDays(lastUpdateDate, -ResultCheckpoint.WindowDays)
+                )
+        else:
+            SQLdata = checkpointData
+            checkpointData = None
+
+        # Increment processing date to the next date as
+        # lastUpdateDate is a date retrieved form DB, which means it was already calculated
+        return {
+            "funds": funds,
+            "orderLedger": orderLedger,
+            "quot": quot,
+            "lastUpdateDate": lastUpdateDate,
+            "checkpointData": checkpointData,
+            "existingResults": set(
+                (entry.fund_id, entry.result_date)
+                for entry in existingResults
+            ),
+            "tempOwnedFunds": InvestmentCalcResult.getOwnedFunds(
+                funds, lastUpdateDate, SQLdata
+            ),
+            "currentProcessingDate": Dates.addDays(lastUpdateDate, 1),
+            "SQLdata": SQLdata
+        }
+
+    @staticmethod
+    def loadRangeData(
+        investment_id: int,
+        rangeStart: datetime.datetime,
+        rangeEnd: datetime.datetime,
+        session: orm.session.Session,
+        timer: StageTimer
+    ) -> dict[str, object]:
+
+        with timer.stage("orders"):
+            start_date, funds, orderLedger = InvestmentCalcResult.getInvestmentOrderLedger(
+                investment_id, session
+            )
+
+        if funds is None:
+            raise RuntimeError("Failed to retrieve investment orders")
+
+        # Investment without orders does not exist
+        if not funds:
+            return None
+
+        # There are no results before the first order,
+        # so the range has to end after it to affect any of them
+        rangeStart = max(rangeStart, start_date)
+        if rangeStart > rangeEnd:
+            return {"recalculateTo": None}
+
+        # Range is recalculated after historical quotation was corrected,
+        # cache validation compares only number of entries and the last date, so cached values are dropped
+        with timer.stage("quotations"):
+            for fund in funds:
+                QuotationCache.invalidate(fund)
+            quot = InvestmentCalcResult.getFundsQuotation(
+                funds, start_date, session
+            )
+            orderLedger.applyQuotation(quot)
+
+        # Find the last day which depends on the range:
+        # order within the range changes participation units of all following days,
+        # otherwise period results are compared with entries in the range
+        # until a year after the first quotation of each fund following the range
+        recalculateTo = datetime.datetime.now()
+        if not any(rangeStart <= date <= rangeEnd for date in orderLedger):
+            nextQuotationDates = [
+                min((date for date in quot[fund] if date > rangeEnd), default=None)
+                for fund in funds
+            ]
+            if None not in nextQuotationDates:
+                recalculateTo = min(
+                    recalculateTo,
+                    Dates.addDays(max(nextQuotationDates), Dates.Yearly)
+                )
+
+        with timer.stage("unify"):
+            # Results newer than the latest one are not recalculated,
+            # it is a job for regular refresh
+            lastResultDate = (
+                session
+                .query(func.max(InvestmentResult.result_date))
+                .filter(InvestmentResult.investment_id == investment_id)
+                .scalar()
+            )
+            if (lastResultDate is None) or (rangeStart > lastResultDate):
+                return {"recalculateTo": None}
+            recalculateTo = min(recalculateTo, lastResultDate)
+
+            # Delete affected results within the same transaction as new entries will be added,
+            # checkpoint no longer matches results, so it is removed as well
+            (
+                session
+                .query(InvestmentResult)
+                .filter(
+                    InvestmentResult.investment_id == investment_id,
+                    InvestmentResult.result_date >= rangeStart,
+                    InvestmentResult.result_date <= recalculateTo
+                )
+                .delete()
+            )
+            ResultCheckpoint.remove(investment_id, session)
+
+        # Get the window of results before the range, required to calculate period results,
+        # participation units and invested money are taken from the last entry before the range.
+        # Calculation stops at the last recalculated day, so newer results are not read
+        lastUpdateDate = Dates.addDays(rangeStart, -1)
+        with timer.stage("history"):
+            SQLdata = InvestmentResult.getInvestmentResult(
+                investment_id,
+                session,
+                Dates.addDays(lastUpdateDate, -ResultCheckpoint.WindowDays),
+                recalculateTo
+            )
+
+        return {
+            "funds": funds,
+            "orderLedger": orderLedger,
+            "quot": quot,
+            "recalculateTo": recalculateTo,
+            "tempOwnedFunds": InvestmentCalcResult.getOwnedFunds(
+                funds, lastUpdateDate, SQLdata
+            ),
+            "currentProcessingDate": rangeStart,
+            "SQLdata": SQLdata
+        }
 
     @staticmethod
-    def getInvestmentOrderMap(
+    def getInvestmentOrderLedger(
         investment_id: int,
         session: orm.session.Session
     ) -> tuple[
             datetime.datetime,
             list[str],
-            dict[
-                datetime.datetime,
-                dict[
-                    str,
-                    dict[str, int]
-                ]
-            ]
+            OrderLedger
     ]:
-        resultMap = {}
+        orderLedger = OrderLedger()
         fundList = set()
         try:
             orders = (
@@ -402,26 +1216,20 @@ class InvestmentCalcResult:
             )
         except:
             logger.exception(
-                "getInvestmentOrderMap(%s) failed to retrieve data from DB",
+                "getInvestmentOrderLedger(%s) failed to retrieve data from DB",
                 investment_id,
                 exc_info=True
             )
             return None, None, None
 
+        if not orders:
+            return None, [], orderLedger
+
         for date, fund_id, money in orders:
             fundList.add(fund_id)
-            if date not in list(resultMap.keys()):
-                resultMap[date] = {}
-
-            if fund_id not in list(resultMap[date].keys()):
-                resultMap[date][fund_id] = {
-                    "Money": 0,
-                    "ParticipationUnits": 0
-                }
-
-            resultMap[date][fund_id]["Money"] += money
+            orderLedger.add(date, fund_id, money)
 
-        return orders[0][0], list(fundList), resultMap
+        return orders[0][0], list(fundList), orderLedger
 
     @staticmethod
     def getFundsQuotation(
@@ -435,9 +1243,32 @@ class InvestmentCalcResult:
         quotation = {}
 
         try:
+            # Shared cache has to be validated, as quotation might be inserted by the other process
+            if QuotationCache.CacheMode == "SHARED":
+                QuotationCache.load(fundList, session)
+
+            # Use cached quotation if available
             for fund in fundList:
-                quotation[fund] = InvestmentCalcResult.getQuotation(
-                    fund, start_date, session)
+                if (cached := QuotationCache.getQuotation(fund, start_date)) is not None:
+                    quotation[fund] = cached
+
+            # Read quotation of remaining funds from DB with a single query
+            missingFunds = [fund for fund in fundList if fund not in quotation]
+            if missingFunds:
+                for fund in missingFunds:
+                    quotation[fund] = {}
+
+                rows = (
+                    session
+                    .query(Quotation.fund_id, Quotation.date, Quotation.value)
+                    .filter(
+                        Quotation.fund_id.in_(missingFunds),
+                        Quotation.date >= start_date
+                    )
+                    .all()
+                )
+                for fund_id, date, value in rows:
+                    quotation[fund_id][date] = value
         except:
             logger.exception(
                 "getFundsQuotation(%s, %s) failed to retrieve data from DB",
@@ -447,58 +1278,73 @@ class InvestmentCalcResult:
 
         return quotation
 
-    @staticmethod
-    def getQuotation(
-        fund_id: str,
-        start_date: datetime.datetime,
-        session: orm.session.Session
-    ) -> dict[datetime.datetime, float]:
-        result = {}
-        quotation = (
-            session
-            .query(Quotation.date, Quotation.value)
-            .filter(Quotation.date >= start_date, Quotation.fund_id == fund_id)
-            .all()
-        )
-        for date, value in quotation:
-            result[date] = value
-
-        return result
-
     @staticmethod
     def getLastResultDate(investment_id: int, session: orm.session.Session) -> datetime.datetime:
         return InvestmentCalcResult.unifyInvestmentResults(investment_id, session)
 
     @staticmethod
-    def getLastFundResult(
+    def getOwnedFunds(
+        funds: list[str],
+        last_date: datetime.datetime,
+        SQLdata: list[ResultRow]
+    ) -> dict[str, FundState]:
+
+        ownedFunds = {
+            fund: FundState()
+            for fund in funds
+        }
+
+        # Historical data is sorted by date,
+        # so the last entry not newer than last date is the state of each fund
+        for entry in SQLdata:
+            if entry.result_date > last_date:
+                break
+
+            if entry.fund_id in ownedFunds:
+                ownedFunds[entry.fund_id] = FundState(
+                    entry.fund_participation_units,
+                    entry.fund_invested_money
+                )
+
+        return ownedFunds
+
+    @staticmethod
+    def getExistingResults(
         investment_id: int,
-        fund_id: str,
         last_date: datetime.datetime,
         session: orm.session.Session
-    ) -> None:
-        try:
-            return (
-                session
-                .query(
-                    InvestmentResult.fund_participation_units,
-                    InvestmentResult.fund_invested_money
-                )
-                .filter(
-                    InvestmentResult.investment_id == investment_id,
-                    InvestmentResult.fund_id == fund_id,
-                    InvestmentResult.result_date == last_date
-                )
-                .first()
+    ) -> list[ResultRow]:
+
+        # Results newer than the last complete date exist only for funds with more recent quotation,
+        # they are returned sorted by date, the same as result history
+        existingResults = (
+            session
+            .query(
+                InvestmentResult.result_date,
+                InvestmentResult.fund_id,
+                InvestmentResult.fund_participation_units,
+                InvestmentResult.fund_invested_money,
+                InvestmentResult.fund_value
             )
-        except:
-            logger.exception(
-                "getLastFundResult(%s, %s, %s) failed to retrieve data from DB",
-                investment_id,
-                fund_id,
-                last_date,
-                exc_info=True
+            .filter(
+                InvestmentResult.investment_id == investment_id,
+                InvestmentResult.result_date > last_date
             )
-            return None
+            .order_by(InvestmentResult.result_date.asc())
+            .all()
+        )
+
+        return [
+            ResultRow(
+                result_date=result_date,
+                investment_id=investment_id,
+                fund_id=fund_id,
+                fund_participation_units=units,
+                fund_invested_money=money,
+                fund_value=value
+            )
+            for result_date, fund_id, units, money, value in existingResults
+        ]
 
     @staticmethod
     def unifyInvestmentResults(investment_id: int, session: orm.session.Session) -> datetime.datetime:
@@ -542,6 +1388,12 @@ class InvestmentCalcResult:
         if dateToFilter == None:
             return None
 
+        # In gap filling mode complete results of the other funds are left untouched,
+        # only missing ones are calculated and added
+        if InvestmentCalcResult.UnifyMode == "GAPFILL":
+            logger.debug("Returning filter date %s without deleting newer entries", dateToFilter)
+            return dateToFilter
+
         # Find rows with incomplete results and delete them
         # Example:
         # fund1 has last result from 02.01, but fund2 has result from 05.01,
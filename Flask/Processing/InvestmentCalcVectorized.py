@@ -0,0 +1,273 @@
+"""
+.DESCRIPTION
+    Class definition for static methods related to Investment refund calculation
+    performed with NumPy array operations instead of the day by day loop.
+    Orders and quotations are loaded into dense date x fund arrays,
+    output entries are the same as the ones created by InvestmentCalcResult.generateRecords().
+
+
+.NOTES
+
+    Version:            1.5
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Use compact row types for orders, owned funds and results.
+                                            Remove .calculateRecords() wrapper, entries are streamed by .generateRecords().
+                                            Do not create entries which are already stored in DB.
+                                            Start processing at midnight, if provided date contains time part.
+
+"""
+
+import datetime
+import numpy as np
+from typing import Iterator
+from Utility.Dates import Dates
+from Utility.OrderLedger import OrderLedger
+from Utility.Rows import FundState, ResultRow
+from Utility.Logger import logger
+
+
+class InvestmentCalcVectorized:
+
+    ConvertPeriodNamesDatesToInvestmentResult = {
+        "daily": "last_day_result",
+        "weekly": "last_week_result",
+        "monthly": "last_month_result",
+        "yearly": "last_year_result"
+    }
+
+    PeriodLengths = {
+        "daily": Dates.Daily,
+        "weekly": Dates.Weekly,
+        "monthly": Dates.Monthly,
+        "yearly": Dates.Yearly
+    }
+
+    @staticmethod
+    def generateRecords(
+        investment_id: int,
+        funds: list[str],
+        orderLedger: OrderLedger,
+        quot: dict[str, dict[datetime.datetime, float]],
+        tempOwnedFunds: dict[str, FundState],
+        currentProcessingDate: datetime.datetime,
+        SQLdata: list[ResultRow],
+        existingResults: set[tuple[str, datetime.datetime]] = None
+    ) -> Iterator[ResultRow]:
+
+        logger.debug(
+            "generateRecords(%s, %s)",
+            investment_id,
+            currentProcessingDate
+        )
+
+        # Arrays are indexed by whole days, so processing starts at midnight,
+        # the first day is the same as in loop engine, which processes dates not older than provided one
+        dayStart = currentProcessingDate.replace(hour=0, minute=0, second=0, microsecond=0)
+        if dayStart != currentProcessingDate:
+            currentProcessingDate = Dates.addDays(dayStart, 1)
+
+        # Calculate number of days to process, the last one is today
+        now = datetime.datetime.now()
+        if currentProcessingDate > now:
+            return
+        numOfDays = (now - currentProcessingDate).days + 1
+
+        # History window is required to find entries to compare with,
+        # the longest period is a year, so it is enough to keep 1 year before the first processed day
+        windowLength = Dates.Yearly
+        windowStart = Dates.addDays(currentProcessingDate, -windowLength)
+        numOfFunds = len(funds)
+        fundIndex = {fund: i for i, fund in enumerate(funds)}
+
+        # Init dense arrays [fund, day] for processed days
+        quotation = np.zeros((numOfFunds, numOfDays))
+        hasQuotation = np.zeros((numOfFunds, numOfDays), dtype=bool)
+        unitsIncrement = np.zeros((numOfFunds, numOfDays + 1))
+        moneyIncrement = np.zeros((numOfFunds, numOfDays + 1))
+
+        # Init dense arrays [fund, day] for window and processed days,
+        # to look up for entries to compare with
+        hasEntry = np.zeros((numOfFunds, windowLength + numOfDays), dtype=bool)
+        entryProfit = np.zeros((numOfFunds, windowLength + numOfDays))
+
+        # Fill in quotation for each processed day
+        for fund in funds:
+            for date, value in quot.get(fund, {}).items():
+                if (day := InvestmentCalcVectorized.__getDayIndex(
+                    date,
+                    currentProcessingDate,
+                    numOfDays
+                )) is not None:
+                    quotation[fundIndex[fund], day] = value
+                    hasQuotation[fundIndex[fund], day] = True
+
+        # Fill in participation units and invested money which were owned before the first processed day,
+        # they are placed in the first column, so cumulative sum will start from them
+        for fund in funds:
+            unitsIncrement[fundIndex[fund], 0] = (
+                tempOwnedFunds[fund].participation_units
+            )
+            moneyIncrement[fundIndex[fund], 0] = (
+                tempOwnedFunds[fund].invested_money
+            )
+
+        # Fill in orders with units calculated by the ledger, the same way as loop engine,
+        # order for a day without quotation can not be processed
+        for date in orderLedger:
+            if (day := InvestmentCalcVectorized.__getDayIndex(
+                date,
+                currentProcessingDate,
+                numOfDays
+            )) is None:
+                continue
+
+            for fund, order in orderLedger.getOrders(date).items():
+                if order.participation_units is None:
+                    raise KeyError(date)
+
+                unitsIncrement[fundIndex[fund], day + 1] = (
+                    order.participation_units
+                )
+                moneyIncrement[fundIndex[fund], day + 1] = (
+                    order.money
+                )
+
+        # Fill in historical entries already stored in DB,
+        # entries older than window are moved to its first day as they are still the latest ones
+        for entry in SQLdata:
+            if entry.fund_id not in fundIndex:
+                continue
+            day = max(
+                (entry.result_date - windowStart).days,
+                0
+            )
+            if day >= windowLength:
+                continue
+            hasEntry[fundIndex[entry.fund_id], day] = True
+            entryProfit[fundIndex[entry.fund_id], day] = (
+                entry.fund_value - entry.fund_invested_money
+            )
+
+        # Calculate participation units, invested money and fund value for each processed day,
+        # cumulative sum adds values one by one, so the output is the same as in the loop
+        units = np.cumsum(unitsIncrement, axis=1)[:, 1:]
+        investedMoney = np.cumsum(moneyIncrement, axis=1)[:, 1:]
+        fundValue = units * quotation
+        profit = fundValue - investedMoney
+
+        # Calculated entries are available to compare with as well
+        hasEntry[:, windowLength:] = hasQuotation
+        entryProfit[:, windowLength:] = profit
+
+        # Entries which are already stored in DB are compared with, but they are not created again,
+        # e.g. in gap filling mode for funds quoted later than the others
+        isCreated = hasQuotation
+        if existingResults:
+            isCreated = hasQuotation.copy()
+            for fund, date in existingResults:
+                if (fund in fundIndex) and ((day := InvestmentCalcVectorized.__getDayIndex(
+                    date,
+                    currentProcessingDate,
+                    numOfDays
+                )) is not None):
+                    isCreated[fundIndex[fund], day] = False
+
+        # For each day find index of the latest entry at or before it, -1 if there is no such entry
+        entryPosition = np.where(
+            hasEntry,
+            np.arange(windowLength + numOfDays),
+            -1
+        )
+        latestEntry = np.maximum.accumulate(entryPosition, axis=1)
+
+        # Calculate each period result for all funds and days at once
+        periodResults = {}
+        for period, length in InvestmentCalcVectorized.PeriodLengths.items():
+            comparedEntry = latestEntry[
+                :,
+                (windowLength - length):(windowLength - length + numOfDays)
+            ]
+            isCalculated = (comparedEntry >= 0) & (investedMoney > 0)
+            periodResults[period] = (
+                isCalculated,
+                profit - np.take_along_axis(
+                    entryProfit,
+                    np.maximum(comparedEntry, 0),
+                    axis=1
+                )
+            )
+
+        # Convert arrays to entries ready to insert to DB one by one
+        yield from InvestmentCalcVectorized.__convertToRecords(
+            investment_id,
+            funds,
+            currentProcessingDate,
+            isCreated,
+            units,
+            investedMoney,
+            fundValue,
+            periodResults
+        )
+
+    @staticmethod
+    def __getDayIndex(
+        date: datetime.datetime,
+        firstDay: datetime.datetime,
+        numOfDays: int
+    ) -> int:
+
+        # Only dates which will be reached by adding full days to the first day can be processed
+        difference = date - firstDay
+        if difference % datetime.timedelta(days=1) != datetime.timedelta(0):
+            return None
+
+        if 0 <= difference.days < numOfDays:
+            return difference.days
+
+        return None
+
+    @staticmethod
+    def __convertToRecords(
+        investment_id: int,
+        funds: list[str],
+        firstDay: datetime.datetime,
+        isCreated: np.ndarray,
+        units: np.ndarray,
+        investedMoney: np.ndarray,
+        fundValue: np.ndarray,
+        periodResults: dict[str, tuple[np.ndarray, np.ndarray]]
+    ) -> Iterator[ResultRow]:
+
+        # Convert arrays to python types, to keep the output the same as in the loop engine
+        unitsList = units.tolist()
+        investedMoneyList = investedMoney.tolist()
+        fundValueList = fundValue.tolist()
+        periodLists = {
+            InvestmentCalcVectorized.ConvertPeriodNamesDatesToInvestmentResult[period]: (
+                isCalculated.tolist(),
+                values.tolist()
+            )
+            for period, (isCalculated, values) in periodResults.items()
+        }
+
+        # Entries are ordered by date and then by fund, the same as in the loop engine
+        for day, fundIndex in np.argwhere(isCreated.T).tolist():
+            record = ResultRow(
+                result_date=Dates.addDays(firstDay, day),
+                investment_id=investment_id,
+                fund_id=funds[fundIndex],
+                fund_participation_units=unitsList[fundIndex][day],
+                fund_invested_money=investedMoneyList[fundIndex][day],
+                fund_value=fundValueList[fundIndex][day]
+            )
+            for colName, (isCalculated, values) in periodLists.items():
+                if isCalculated[fundIndex][day]:
+                    setattr(record, colName, values[fundIndex][day])
+
+            yield record
@@ -6,7 +6,7 @@
 
 .NOTES
 
-    Version:            1.4
+    Version:            1.6
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -22,6 +22,10 @@
 
     2024-05-06      Stanisław Horna         Add missing I/O datatypes. Refactor variable names.
 
+    2026-10-18      Stanisław Horna         Method to retrieve fund IDs used by investments.
+                                            Filter retrieved investment IDs by provided list.
+                                            Method to retrieve IDs of investments holding provided funds.
+
 """
 
 import json
@@ -174,14 +178,14 @@ class InvestmentConfig:
         return investments
 
     @staticmethod
-    def getInvestmentIDs(session: orm.session.Session) -> list[int]:
+    def getInvestmentIDs(session: orm.session.Session, investmentIDs: list[int] = None) -> list[int]:
         result = []
         try:
-            output = (
-                session
-                .query(func.distinct(Investment.investment_id))
-                .all()
-            )
+            # If IDs are provided, only existing ones are returned
+            query = session.query(func.distinct(Investment.investment_id))
+            if investmentIDs is not None:
+                query = query.filter(Investment.investment_id.in_(investmentIDs))
+            output = query.all()
         except:
             logger.exception("Failed to get Investment IDs", exc_info=True)
             return None
@@ -190,6 +194,28 @@ class InvestmentConfig:
             result.append(id[0])
         return result
 
+    @staticmethod
+    def getInvestmentFundIDs(investmentIDs: list[int], session: orm.session.Session) -> list[str]:
+        output = (
+            session
+            .query(func.distinct(Investment.investment_fund_id))
+            .filter(Investment.investment_id.in_(investmentIDs))
+            .all()
+        )
+
+        return [fund_id[0] for fund_id in output]
+
+    @staticmethod
+    def getFundInvestmentIDs(fundIDs: list[str], session: orm.session.Session) -> list[int]:
+        output = (
+            session
+            .query(func.distinct(Investment.investment_id))
+            .filter(Investment.investment_fund_id.in_(fundIDs))
+            .all()
+        )
+
+        return sorted(investment_id[0] for investment_id in output)
+
     @staticmethod
     def getInvestmentFunds(investment_id: int = None) -> tuple[int, list[dict[str, str]]]:
 
@@ -4,7 +4,7 @@
 
 .NOTES
 
-    Version:            1.3
+    Version:            1.12
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -18,23 +18,48 @@
 
     2024-05-06      Stanisław Horna         add missing I/O datatypes. Refactor variable names.
 
+    2026-10-18      Stanisław Horna         Look up for previous quotation based on TimeSeriesIndex.
+                                            Bulk COPY insert mode selectable by QUOTATION_INSERT_MODE variable.
+                                            Download quotation concurrently with QUOTATION_DOWNLOAD_WORKERS threads.
+                                            Incremental download mode selectable by QUOTATION_DOWNLOAD_MODE variable.
+                                            Report per fund progress of asynchronous job.
+                                            Invalidate cached fund quotation once new entries are committed.
+                                            Process downloaded quotation as QuotationRow entries.
+                                            Update quotation of provided list of funds within one call.
+                                            Queue refresh of investments holding funds with new quotation.
+
 """
 
+import os
+import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 from sqlalchemy import func, orm
 from AnalizyPL.API import AnalizyFundAPI
 from SQL.Quotation import Quotation
 from SQL.Fund import Fund
 from SQL.write import Session_rw
 from SQL.read import Session_ro
+from SQL.BulkInsert import BulkInsert
+from SQL.QuotationCache import QuotationCache
+from Processing.AsyncJob import JobProgress
+from Processing.InvestmentCalcResult import InvestmentCalcResult
 from Utility.Logger import logger
 from Utility.ConvertToDict import ConvertToDict
 from Utility.Dates import Dates
+from Utility.TimeSeriesIndex import TimeSeriesIndex
+from Utility.Rows import QuotationRow
 
 
 class Price:
 
+    QuotationInsertModes = ("ORM", "COPY")
+    QuotationInsertMode = os.getenv('QUOTATION_INSERT_MODE', "ORM").upper()
+    QuotationDownloadWorkers = int(os.getenv('QUOTATION_DOWNLOAD_WORKERS', 8))
+    QuotationDownloadModes = ("FULL", "INCREMENTAL")
+    QuotationDownloadMode = os.getenv('QUOTATION_DOWNLOAD_MODE', "INCREMENTAL").upper()
+
     @staticmethod
-    def updateQuotation(ID: str = None) -> tuple[int, list[dict[str, str]]]:
+    def updateQuotation(ID: str | list[str] = None, progress: JobProgress = None) -> tuple[int, list[dict[str, str]]]:
 
         logger.debug("updateQuotation(%s)", ID)
 
@@ -43,6 +68,8 @@ class Price:
         s_rw = Session_rw()
         responseCode = 200
         result = []
+        missingFunds = False
+        updatedFunds = set()
 
         if ID is None:
 
@@ -58,6 +85,51 @@ class Price:
                 .group_by(Quotation.fund_id)
                 .all()
             )
+        elif isinstance(ID, list):
+
+            logger.debug("ID is a list")
+
+            # Get provided Fund IDs which exist in DB and their last quotation dates,
+            # with the same queries as for all funds
+            try:
+                fund = ConvertToDict.fundList(
+                    (
+                        s_ro
+                        .query(Fund)
+                        .filter(Fund.fund_id.in_(ID))
+                        .all()
+                    )
+                )
+                lastRefreshDates = (
+                    s_ro
+                    .query(func.max(Quotation.date), Quotation.fund_id)
+                    .filter(Quotation.fund_id.in_(ID))
+                    .group_by(Quotation.fund_id)
+                    .all()
+                )
+            except:
+                logger.exception(
+                    "Failed to get list of provided funds",
+                    exc_info=True
+                )
+                s_ro.close()
+                s_rw.close()
+                return 500, {
+                    "fund_id": ID,
+                    "Status": "Failed to get list of provided funds"
+                }
+
+            # Report funds which do not exist, remaining ones are processed as usual
+            for fundID in ID:
+                if fundID not in fund:
+                    logger.error("Fund with ID: %s does not exist", fundID)
+                    missingFunds = True
+                    result.append(
+                        {
+                            "fund_id": fundID,
+                            "Status": f"Fund with ID: {fundID} does not exist"
+                        }
+                    )
         else:
 
             logger.debug("ID is not none")
@@ -114,12 +186,32 @@ class Price:
                     exc_info=True
                 )
 
+        logger.debug("Filtering out funds without quotations saved in DB")
+        # Get funds without any quotation
+        fundsWithPrice = list([fr[1] for fr in lastRefreshDates])
+        fundsWithoutPrice = [
+            f for f in list(fund.keys())
+            if f not in fundsWithPrice
+        ]
+
+        # Report number of funds to process if it is running as asynchronous job
+        if progress is not None:
+            progress.setTotal(len(fund))
+
+        # Start downloading quotation for all funds in background,
+        # downloads overlap each other, while DB inserts are still done one by one in this thread
+        downloads = Price.downloadQuotations(
+            fundsWithPrice + fundsWithoutPrice,
+            fund,
+            {fundID: date for date, fundID in lastRefreshDates}
+        )
+
         # Loop through each fund which already has some quotation in DB
         for date, fundID in lastRefreshDates:
 
             logger.debug("Processing (date | fund ID) %s | %s", date, fundID)
-            # Download newest quotation from Analizy.pl
-            downloadedQuot = AnalizyFundAPI.downloadQuotation(fund[fundID])
+            # Wait for newest quotation downloaded from Analizy.pl
+            downloadedQuot = downloads[fundID].result()
 
             if downloadedQuot is None:
                 responseCode = 204
@@ -133,6 +225,8 @@ class Price:
                         "Status": "Failed to download quotation"
                     }
                 )
+                if progress is not None:
+                    progress.itemCompleted(result[-1])
                 continue
 
             # Create temp variable to store all downloaded quotation
@@ -142,33 +236,35 @@ class Price:
             # Filter out the quotation to only those entries which will be inserted to DB
             downloadedQuot["FundQuotation"] = [
                 q for q in downloadedQuot["FundQuotation"]
-                if q[AnalizyFundAPI.RESPONSE_DATE_NAME] > date
+                if q.date > date
             ]
 
             # Insert quotation to DB
             code, responseBody = Price.insertQuotationRecords(
                 downloadedQuot,
                 s_rw,
-                allQuotations
+                allQuotations,
+                updatedFunds
             )
 
             responseBody["fund_id"] = fundID
 
             result.append(responseBody)
+            if progress is not None:
+                progress.itemCompleted(responseBody)
 
             if code != 204:
                 responseCode = code
 
-        logger.debug("Filtering out funds without quotations saved in DB")
-        # Get funds without any quotation
-        fundsWithPrice = list([fr[1] for fr in lastRefreshDates])
-        fundsWithoutPrice = [
-            f for f in list(fund.keys())
-            if f not in fundsWithPrice
-        ]
-
-        # Download and insert all available quotation for funds without them
-        insertStatus = Price.insertQuotation(fundsWithoutPrice, fund, s_rw)
+        # Insert all available quotation for funds without them
+        insertStatus = Price.insertQuotation(
+            fundsWithoutPrice,
+            fund,
+            s_rw,
+            downloads,
+            progress,
+            updatedFunds
+        )
 
         # Extract error codes from .insertQuotation() method output
         errorCodes = [entry["responseCode"] for entry in insertStatus]
@@ -185,17 +281,66 @@ class Price:
         for entry in insertStatus:
             result.append(entry["responseBody"])
 
+        # Some of provided funds do not exist, so the update is partial
+        if missingFunds and (responseCode == 200):
+            responseCode = 206
+
         # Close SQL session
         s_ro.close()
         s_rw.close()
 
+        # Investments holding funds with new quotation are calculated again in background
+        InvestmentCalcResult.refreshFundInvestments(sorted(updatedFunds))
+
         return responseCode, result
 
+    @staticmethod
+    def downloadQuotations(
+            fundIDs: list[str],
+            allFunds: dict[str, Fund],
+            lastRefreshDates: dict[str, datetime.datetime] = {}
+    ) -> dict[str, Future]:
+
+        logger.debug(
+            "downloadQuotations(%s), workers: %d, mode: %s",
+            str(fundIDs),
+            Price.QuotationDownloadWorkers,
+            Price.QuotationDownloadMode
+        )
+
+        # In incremental mode only entries newer than the last stored quotation
+        # and the window required to calculate value changes are converted,
+        # funds without any quotation are always downloaded in full
+        if Price.QuotationDownloadMode != "INCREMENTAL":
+            lastRefreshDates = {}
+
+        # Submit download for each fund, number of requests in flight is limited by number of workers
+        executor = ThreadPoolExecutor(
+            max_workers=Price.QuotationDownloadWorkers,
+            thread_name_prefix="QuotationDownload"
+        )
+        downloads = {
+            fundID: executor.submit(
+                AnalizyFundAPI.downloadQuotation,
+                allFunds[fundID],
+                lastRefreshDates.get(fundID)
+            )
+            for fundID in fundIDs
+        }
+
+        # Do not wait for downloads, threads will be released once all submitted downloads are completed
+        executor.shutdown(wait=False)
+
+        return downloads
+
     @staticmethod
     def insertQuotation(
             fundsWithoutPrice: list[str],
             allFunds: dict[str, Fund],
-            session: orm.session.Session
+            session: orm.session.Session,
+            downloads: dict[str, Future] = None,
+            progress: JobProgress = None,
+            updatedFunds: set[str] = None
     ) -> tuple[int, list[dict[str, str]]]:
 
         logger.debug("insertQuotation(%s)", str(fundsWithoutPrice))
@@ -208,9 +353,13 @@ class Price:
 
             logger.debug("Processing: %s", fundID)
 
-            downloadedQuot = AnalizyFundAPI.downloadQuotation(
-                allFunds[fundID]
-            )
+            # Use quotation downloaded in background if it was already requested
+            if downloads is not None and fundID in downloads:
+                downloadedQuot = downloads[fundID].result()
+            else:
+                downloadedQuot = AnalizyFundAPI.downloadQuotation(
+                    allFunds[fundID]
+                )
 
             if downloadedQuot is None:
                 logger.error(
@@ -227,13 +376,16 @@ class Price:
                         }
                     }
                 )
+                if progress is not None:
+                    progress.itemCompleted(responseBody[-1]["responseBody"])
                 continue
 
             responseBody.append({})
             # Insert quotation to DB
             responseBody[-1]["responseCode"], responseBody[-1]["responseBody"] = Price.insertQuotationRecords(
                 downloadedQuot,
-                session
+                session,
+                updatedFunds=updatedFunds
             )
 
             # create success result entry
@@ -243,32 +395,46 @@ class Price:
                     "responseBody": {
                         "Status": "Quotation successfully added",
                         "Last Quotation Date": Dates.convertDateToString(
-                            downloadedQuot["FundQuotation"][-1][AnalizyFundAPI.RESPONSE_DATE_NAME]
+                            downloadedQuot["FundQuotation"][-1].date
                         ),
                         "fund_id": fundID
                     }
                 }
             )
+            if progress is not None:
+                progress.itemCompleted(responseBody[-1]["responseBody"])
         logger.debug("insertQuotation(%s). Returning", str(fundsWithoutPrice))
         return responseBody
 
     @staticmethod
     def insertQuotationRecords(
-            dataToInsert: list[dict[str, str]],
+            dataToInsert: dict[str, str | list[QuotationRow]],
             session: orm.session.Session,
-            allQuotation: list[dict[str, str]] = []
+            allQuotation: list[QuotationRow] = [],
+            updatedFunds: set[str] = None
     ) -> tuple[int, dict[str, str]]:
 
         logger.debug(
             "insertQuotationRecords(), Fund: %s",
             dataToInsert["Fund_ID"]
         )
+
+        # Create sorted index of all known quotations once,
+        # to look up for previous values without scanning the whole list for each entry
+        quotationHistory = TimeSeriesIndex(
+            "date",
+            allQuotation + dataToInsert["FundQuotation"]
+        )
+
+        # Init list of rows to insert
+        rowsToInsert = []
+
         # Loop through each quotation entry
         for entry in dataToInsert["FundQuotation"]:
 
             # Create local variables for quotation value and date
-            currentDate = entry[AnalizyFundAPI.RESPONSE_DATE_NAME]
-            currentValue = entry[AnalizyFundAPI.RESPONSE_PRICE_NAME]
+            currentDate = entry.date
+            currentValue = entry.value
 
             # Prepare dict to calculate refund in different periods
             result = {
@@ -288,20 +454,18 @@ class Price:
 
                 # Get appropriate result to currently calculated refund period
                 # if the result equals to None it means that there is no quotation for desired date
-                if (prev_value := Dates.getEntryWithDesiredDate(
-                    allQuotation + dataToInsert["FundQuotation"],
-                    AnalizyFundAPI.RESPONSE_DATE_NAME,
+                if (prev_value := quotationHistory.getEntryWithDesiredDate(
                     dates[period]
                 )
-                ) != None:
+                ) is not None:
 
                     # Based on filtered data calculate result
                     result[period] = (
-                        currentValue / prev_value[AnalizyFundAPI.RESPONSE_PRICE_NAME]) - 1.0
+                        currentValue / prev_value.value) - 1.0
 
-            # Create DB entry
-            session.add(
-                Quotation(
+            # Create row to insert
+            rowsToInsert.append(
+                (
                     currentDate,
                     dataToInsert["Fund_ID"],
                     currentValue,
@@ -313,13 +477,39 @@ class Price:
             )
 
         responseCode = 200
-        # try to commit all inserted data
+        # try to insert and commit all rows
         try:
+            match (Price.QuotationInsertMode):
+
+                case "COPY":
+                    # Stream all rows to quotation table at once
+                    if rowsToInsert:
+                        logger.debug(
+                            "Copying %d quotation rows",
+                            len(rowsToInsert)
+                        )
+                        BulkInsert.insertQuotations(session, rowsToInsert)
+
+                case _:
+                    # Create DB entry for each row
+                    for row in rowsToInsert:
+                        session.add(
+                            Quotation(*row)
+                        )
+
             session.commit()
+
+            # Cached quotation of the fund is outdated,
+            # the fund is recorded to refresh investments holding it
+            if rowsToInsert:
+                QuotationCache.invalidate(dataToInsert["Fund_ID"])
+                if updatedFunds is not None:
+                    updatedFunds.add(dataToInsert["Fund_ID"])
+
             responseBody = {
                 "Status": "Quotation successfully added",
                 "Last Quotation Date": Dates.convertDateToString(
-                    dataToInsert["FundQuotation"][-1][AnalizyFundAPI.RESPONSE_DATE_NAME]
+                    dataToInsert["FundQuotation"][-1].date
                 )
             }
 
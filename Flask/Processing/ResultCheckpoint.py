@@ -0,0 +1,258 @@
+"""
+.DESCRIPTION
+    Class definition for checkpoints of investment results.
+    Checkpoint keeps the state of each fund in investment at the last complete result date,
+    together with the results from rolling window required to calculate period profits,
+    so incremental calculation reads only the window instead of whole result history.
+
+    Checkpoint usage is selected by CHECKPOINT_MODE variable:
+        - NONE <- result history is always read from DB, checkpoints are not saved.
+        - CHECKPOINT <- valid checkpoint replaces result history.
+        - VERIFY <- both checkpoint and result history are read,
+                    calculation is done with each of them and produced entries are compared.
+
+
+.NOTES
+
+    Version:            1.3
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Replace historical entries calculated again.
+                                            Process ResultRow entries.
+                                            Trim remembered entries to the window while they are appended.
+                                            Remove checkpoint of recalculated investment.
+
+"""
+
+import os
+import bisect
+import datetime
+from operator import attrgetter
+from sqlalchemy import orm
+from SQL.InvestmentCheckpoint import InvestmentCheckpoint
+from SQL.ResultWriter import ResultWriter
+from Utility.Dates import Dates
+from Utility.Rows import ResultRow
+from Utility.Logger import logger
+
+
+class ResultCheckpoint:
+
+    CheckpointModes = ("NONE", "CHECKPOINT", "VERIFY")
+    CheckpointMode = os.getenv('CHECKPOINT_MODE', "CHECKPOINT").upper()
+
+    # The oldest compared entry is a year before the first calculated day,
+    # so window has to cover one more day than the longest period
+    WindowDays = Dates.Yearly + 1
+
+    # Number of appended entries after which entries older than the window are removed
+    TrimInterval = 1024
+
+    def __init__(
+        self,
+        investment_id: int,
+        funds: list[str],
+        SQLdata: list[ResultRow],
+        writer: ResultWriter
+    ) -> None:
+        self.__investment_id = investment_id
+        self.__writer = writer
+        self.__appendedRecords = 0
+
+        # Results of each fund sorted by date, historical ones first,
+        # followed by calculated entries
+        self.__fundResults: dict[str, list[ResultRow]] = {
+            fund: [] for fund in funds
+        }
+        for entry in SQLdata:
+            if entry.fund_id in self.__fundResults:
+                self.__fundResults[entry.fund_id].append(entry)
+
+    @staticmethod
+    def isEnabled() -> bool:
+        return ResultCheckpoint.CheckpointMode in ("CHECKPOINT", "VERIFY")
+
+    @staticmethod
+    def load(
+        investment_id: int,
+        funds: list[str],
+        lastUpdateDate: datetime.datetime,
+        session: orm.session.Session
+    ) -> list[ResultRow]:
+        '''
+            Returns None if there is no checkpoint matching last complete result date,
+            so the caller has to read whole result history
+        '''
+        checkpoints = (
+            session
+            .query(InvestmentCheckpoint)
+            .filter(InvestmentCheckpoint.investment_id == investment_id)
+            .all()
+        )
+
+        # Checkpoint is valid only if it was saved for the same last result date
+        # and it contains all funds of the investment,
+        # otherwise results were changed after it was saved
+        checkpoints = {
+            checkpoint.fund_id: checkpoint
+            for checkpoint in checkpoints
+            if checkpoint.checkpoint_date == lastUpdateDate
+        }
+        if any(fund not in checkpoints for fund in funds):
+            logger.debug(
+                "No valid checkpoint for investment %s at %s",
+                investment_id,
+                lastUpdateDate
+            )
+            return None
+
+        # Return entries in the same order as result history read from DB
+        return sorted(
+            (
+                entry
+                for fund in funds
+                for entry in checkpoints[fund].toResults()
+            ),
+            key=lambda entry: entry.result_date
+        )
+
+    @staticmethod
+    def remove(investment_id: int, session: orm.session.Session) -> None:
+
+        # Checkpoint is removed within the caller transaction,
+        # next calculation will read result history instead of it
+        (
+            session
+            .query(InvestmentCheckpoint)
+            .filter(InvestmentCheckpoint.investment_id == investment_id)
+            .delete()
+        )
+
+        return None
+
+    def append(self, record: ResultRow) -> None:
+
+        # Calculated entries are remembered to create new checkpoint
+        # and passed to the writer to be sent to DB,
+        # historical entries which were calculated again are replaced
+        results = self.__fundResults[record.fund_id]
+        while results and (results[-1].result_date >= record.result_date):
+            results.pop()
+
+        results.append(record)
+        self.__writer.append(record)
+
+        # Remember only entries which can be still saved in the checkpoint
+        self.__appendedRecords += 1
+        if self.__appendedRecords % ResultCheckpoint.TrimInterval == 0:
+            self.__trim(record.result_date)
+
+        return None
+
+    def __trim(self, currentDate: datetime.datetime) -> None:
+        '''
+            Entries are appended in date order and only the ones not older than appended one are replaced,
+            so the checkpoint date can not be older than current date or the oldest of the latest fund results
+        '''
+        latestDates = [
+            results[-1].result_date
+            for results in self.__fundResults.values()
+            if results
+        ]
+        windowStart = Dates.addDays(
+            min(latestDates + [currentDate]),
+            -ResultCheckpoint.WindowDays
+        )
+
+        # Keep the latest entry at or before window start, as it is kept in the checkpoint as well
+        for results in self.__fundResults.values():
+            position = bisect.bisect_right(
+                results,
+                windowStart,
+                key=attrgetter("result_date")
+            ) - 1
+            if position > 0:
+                del results[:position]
+
+        return None
+
+    def save(self, session: orm.session.Session) -> None:
+
+        # Next calculation will start after the oldest of the latest fund results,
+        # newer entries are treated as incomplete ones
+        latestDates = [
+            results[-1].result_date
+            for results in self.__fundResults.values()
+            if results
+        ]
+        if not latestDates:
+            return None
+
+        checkpointDate = min(latestDates)
+        windowStart = Dates.addDays(checkpointDate, -ResultCheckpoint.WindowDays)
+
+        logger.debug(
+            "Saving checkpoint for investment %s at %s",
+            self.__investment_id,
+            checkpointDate
+        )
+
+        # Previous checkpoint is replaced within the same transaction as calculated results
+        (
+            session
+            .query(InvestmentCheckpoint)
+            .filter(InvestmentCheckpoint.investment_id == self.__investment_id)
+            .delete()
+        )
+        session.add_all(
+            [
+                ResultCheckpoint.__create_checkpoint(
+                    self.__investment_id,
+                    fund,
+                    results,
+                    checkpointDate,
+                    windowStart
+                )
+                for fund, results in self.__fundResults.items()
+            ]
+        )
+        session.flush()
+
+        return None
+
+    @staticmethod
+    def __create_checkpoint(
+        investment_id: int,
+        fund_id: str,
+        results: list[ResultRow],
+        checkpointDate: datetime.datetime,
+        windowStart: datetime.datetime
+    ) -> InvestmentCheckpoint:
+
+        # Keep entries within the window and the latest one before it,
+        # as it is still the entry to compare with for the oldest days in the window
+        window = []
+        for entry in results:
+            if entry.result_date > checkpointDate:
+                break
+
+            if (entry.result_date <= windowStart) and window:
+                window[0] = entry
+            else:
+                window.append(entry)
+
+        return InvestmentCheckpoint(
+            investment_id,
+            fund_id,
+            checkpointDate,
+            windowStart,
+            [entry.result_date for entry in window],
+            [entry.fund_participation_units for entry in window],
+            [entry.fund_invested_money for entry in window],
+            [entry.fund_value for entry in window]
+        )
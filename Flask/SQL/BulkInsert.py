@@ -0,0 +1,128 @@
+"""
+.DESCRIPTION
+    Definition file for bulk insert operations, which bypass ORM and views.
+    Rows are streamed with PostgreSQL COPY into temporary staging table
+    and merged into destination table with a single INSERT statement.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import io
+import csv
+from sqlalchemy import orm
+
+
+class BulkInsert:
+
+    QuotationTable = "Fund_Quotation"
+    QuotationColumns = (
+        "Quotation_date",
+        "Fund_ID",
+        "Quotation_value",
+        "Day_value_change",
+        "Week_value_change",
+        "Month_value_change",
+        "Year_value_change"
+    )
+    QuotationKey = ("Quotation_date", "Fund_ID")
+
+    ResultTable = "Investment_Fund_Results"
+    ResultColumns = (
+        "Result_date",
+        "Fund_ID",
+        "Investment_ID",
+        "Participation_units",
+        "Invested_money",
+        "Fund_value",
+        "Day_profit",
+        "Week_profit",
+        "Month_profit",
+        "Year_profit"
+    )
+    ResultKey = ("Result_date", "Fund_ID", "Investment_ID")
+
+    @staticmethod
+    def insertQuotations(session: orm.session.Session, rows: list[tuple]) -> int:
+        return BulkInsert.copyRows(
+            session,
+            BulkInsert.QuotationTable,
+            BulkInsert.QuotationColumns,
+            BulkInsert.QuotationKey,
+            rows
+        )
+
+    @staticmethod
+    def insertResults(session: orm.session.Session, rows: list[tuple]) -> int:
+
+        # Results are recalculated, so existing rows are overwritten with the new values
+        return BulkInsert.copyRows(
+            session,
+            BulkInsert.ResultTable,
+            BulkInsert.ResultColumns,
+            BulkInsert.ResultKey,
+            rows,
+            updateExisting=True
+        )
+
+    @staticmethod
+    def copyRows(
+        session: orm.session.Session,
+        tableName: str,
+        columns: tuple[str],
+        keyColumns: tuple[str],
+        rows: list[tuple],
+        updateExisting: bool = False
+    ) -> int:
+
+        stageName = f"{tableName}_stage"
+        columnList = ", ".join(columns)
+
+        # Rows which already exist in destination table are skipped or updated
+        if updateExisting:
+            conflictAction = "UPDATE SET " + ", ".join(
+                f"{col} = EXCLUDED.{col}"
+                for col in columns if col not in keyColumns
+            )
+        else:
+            conflictAction = "NOTHING"
+
+        # Convert rows to CSV format, None is written as empty field which is loaded as NULL
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+
+        # Use connection of provided session,
+        # so inserted rows are committed or rolled back together with the rest of the transaction
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {stageName} (LIKE {tableName}) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                f"COPY {stageName} ({columnList}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+            cursor.execute(
+                f"INSERT INTO {tableName} ({columnList}) " +
+                f"SELECT {columnList} FROM {stageName} " +
+                f"ON CONFLICT ({', '.join(keyColumns)}) DO {conflictAction}"
+            )
+            insertedRows = cursor.rowcount
+
+            # Staging table is cleared, so it can be reused within the same transaction
+            cursor.execute(f"TRUNCATE {stageName}")
+        finally:
+            cursor.close()
+
+        return insertedRows
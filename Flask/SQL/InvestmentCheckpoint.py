@@ -0,0 +1,75 @@
+"""
+.DESCRIPTION
+    SQLAlchemy ORM file to define investment_checkpoints view.
+
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Convert checkpoint window to ResultRow entries.
+
+"""
+
+from sqlalchemy import Column, String, Integer, Float, DateTime, ARRAY
+from SQL.base import Base
+from Utility.Rows import ResultRow
+
+
+class InvestmentCheckpoint(Base):
+    __tablename__ = 'investment_checkpoints'
+
+    investment_id = Column(Integer, primary_key=True)
+    fund_id = Column(String, primary_key=True)
+    checkpoint_date = Column(DateTime)
+    checkpoint_window_start = Column(DateTime)
+    checkpoint_result_dates = Column(ARRAY(DateTime))
+    checkpoint_participation_units = Column(ARRAY(Float))
+    checkpoint_invested_money = Column(ARRAY(Float))
+    checkpoint_fund_values = Column(ARRAY(Float))
+
+    def __init__(
+        self,
+        investment_id,
+        fund_id,
+        checkpoint_date,
+        checkpoint_window_start,
+        checkpoint_result_dates,
+        checkpoint_participation_units,
+        checkpoint_invested_money,
+        checkpoint_fund_values
+    ):
+        self.investment_id = investment_id
+        self.fund_id = fund_id
+        self.checkpoint_date = checkpoint_date
+        self.checkpoint_window_start = checkpoint_window_start
+        self.checkpoint_result_dates = checkpoint_result_dates
+        self.checkpoint_participation_units = checkpoint_participation_units
+        self.checkpoint_invested_money = checkpoint_invested_money
+        self.checkpoint_fund_values = checkpoint_fund_values
+
+    def toResults(self) -> list[ResultRow]:
+
+        # Entries have the same format as InvestmentResult.getInvestmentResult() output
+        return [
+            ResultRow(
+                result_date=date,
+                investment_id=self.investment_id,
+                fund_id=self.fund_id,
+                fund_participation_units=units,
+                fund_invested_money=money,
+                fund_value=value
+            )
+            for date, units, money, value in zip(
+                self.checkpoint_result_dates,
+                self.checkpoint_participation_units,
+                self.checkpoint_invested_money,
+                self.checkpoint_fund_values
+            )
+        ]
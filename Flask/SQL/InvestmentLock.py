@@ -0,0 +1,68 @@
+"""
+.DESCRIPTION
+    Definition file for lock of investment results calculation.
+    PostgreSQL advisory lock is taken for the investment ID,
+    so results of the same investment are calculated by only one thread or API process at a time.
+    Lock is held on its own connection, as calculation session commits more than once.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection
+from SQL import write
+from Utility.Logger import logger
+
+
+class InvestmentLock:
+
+    # First key of two-key advisory lock, to not collide with locks taken for other purposes
+    LockNamespace = 1
+
+    def __init__(self, investment_id: int) -> None:
+        self.__investment_id = investment_id
+        self.__connection: Connection = None
+
+    def __enter__(self) -> "InvestmentLock":
+
+        logger.debug("Waiting for lock of investment %s", self.__investment_id)
+        self.__connection = write.engine.connect()
+        try:
+            self.__connection.execute(
+                select(func.pg_advisory_lock(InvestmentLock.LockNamespace, self.__investment_id))
+            )
+            self.__connection.commit()
+        except:
+            self.__connection.close()
+            raise
+
+        logger.debug("Lock of investment %s acquired", self.__investment_id)
+        return self
+
+    def __exit__(self, *exc) -> None:
+
+        try:
+            self.__connection.execute(
+                select(func.pg_advisory_unlock(InvestmentLock.LockNamespace, self.__investment_id))
+            )
+            self.__connection.commit()
+            self.__connection.close()
+        except:
+            # Lock is released by the server once connection is closed,
+            # so connection which failed to unlock must not be returned to the pool
+            logger.exception("Failed to release lock of investment %s", self.__investment_id, exc_info=True)
+            self.__connection.invalidate()
+
+        logger.debug("Lock of investment %s released", self.__investment_id)
+        return None
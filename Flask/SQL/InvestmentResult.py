@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.4
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -15,10 +15,15 @@
     Date            Who                     What
     2024-05-05      Stanisław Horna         Add Foreign keys mapping.
 
+    2026-10-18      Stanisław Horna         Return investment result history as ResultRow entries.
+                                            Optionally limit result history to the window.
+                                            Optionally limit result history to the window end.
+
 """
 
-from sqlalchemy import orm, Column, String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import orm, func, or_, tuple_, Column, String, Integer, Float, DateTime, ForeignKey
 from SQL.base import Base
+from Utility.Rows import ResultRow
 
 
 class InvestmentResult(Base):
@@ -78,8 +83,8 @@ class InvestmentResult(Base):
         self.last_year_result = last_year_result
 
     @staticmethod
-    def getInvestmentResult(investment_id: int, session):
-        output = (
+    def getInvestmentResult(investment_id: int, session, windowStart=None, windowEnd=None) -> list[ResultRow]:
+        query = (
             session
             .query(
                 InvestmentResult.result_date,
@@ -90,20 +95,53 @@ class InvestmentResult(Base):
                 InvestmentResult.fund_value
             )
             .filter(InvestmentResult.investment_id == investment_id)
+        )
+
+        # If window start is provided, return only entries newer than it
+        # and the latest entry of each fund at or before it, which is still compared with
+        if windowStart is not None:
+            anchors = (
+                session
+                .query(
+                    InvestmentResult.fund_id,
+                    func.max(InvestmentResult.result_date)
+                )
+                .filter(
+                    InvestmentResult.investment_id == investment_id,
+                    InvestmentResult.result_date <= windowStart
+                )
+                .group_by(InvestmentResult.fund_id)
+            )
+            query = query.filter(
+                or_(
+                    InvestmentResult.result_date > windowStart,
+                    tuple_(
+                        InvestmentResult.fund_id,
+                        InvestmentResult.result_date
+                    ).in_(anchors)
+                )
+            )
+
+        # If window end is provided, entries newer than it are not returned
+        if windowEnd is not None:
+            query = query.filter(InvestmentResult.result_date <= windowEnd)
+
+        output = (
+            query
             .order_by(InvestmentResult.result_date.asc())
             .all()
         )
         result = []
         for date, fund, investment, units, money, value in output:
             result.append(
-                {
-                    "result_date": date,
-                    "investment_id": investment,
-                    "fund_id": fund,
-                    "fund_participation_units": units,
-                    "fund_invested_money": money,
-                    "fund_value": value
-                }
+                ResultRow(
+                    result_date=date,
+                    investment_id=investment,
+                    fund_id=fund,
+                    fund_participation_units=units,
+                    fund_invested_money=money,
+                    fund_value=value
+                )
             )
 
         return result
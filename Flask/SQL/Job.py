@@ -0,0 +1,79 @@
+"""
+.DESCRIPTION
+    SQLAlchemy ORM file to define jobs view.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import datetime
+from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from SQL.base import Base
+from Utility.Dates import Dates
+
+
+class Job(Base):
+    __tablename__ = 'jobs'
+
+    job_id = Column(Integer, primary_key=True)
+    job_type = Column(String)
+    job_target_id = Column(String)
+    job_parameters = Column(JSONB(none_as_null=True))
+    job_status = Column(String)
+    job_total_items = Column(Integer)
+    job_completed_items = Column(Integer)
+    job_items = Column(JSONB)
+    job_response_code = Column(Integer)
+    job_response_body = Column(JSONB(none_as_null=True))
+    job_created_date = Column(DateTime)
+    job_started_date = Column(DateTime)
+    job_updated_date = Column(DateTime)
+    job_finished_date = Column(DateTime)
+
+    def __init__(self, job_type, job_target_id, job_parameters=None):
+        self.job_type = job_type
+        self.job_target_id = job_target_id
+        self.job_parameters = job_parameters
+        self.job_status = "Queued"
+        self.job_completed_items = 0
+        self.job_items = []
+        self.job_created_date = datetime.datetime.now()
+        self.job_updated_date = self.job_created_date
+
+    def toDict(self) -> dict[str, str]:
+        return {
+            "Job ID": self.job_id,
+            "Type": self.job_type,
+            "Target ID": self.job_target_id or None,
+            "Parameters": self.job_parameters,
+            "Status": self.job_status,
+            "Progress": {
+                "Completed": self.job_completed_items,
+                "Total": self.job_total_items
+            },
+            "Items": self.job_items,
+            "Response Code": self.job_response_code,
+            "Response": self.job_response_body,
+            "Created": Job.__convertDate(self.job_created_date),
+            "Started": Job.__convertDate(self.job_started_date),
+            "Updated": Job.__convertDate(self.job_updated_date),
+            "Finished": Job.__convertDate(self.job_finished_date)
+        }
+
+    @staticmethod
+    def __convertDate(date: datetime.datetime) -> str:
+        if date is None:
+            return None
+
+        return Dates.convertDateToString(date, "%Y-%m-%d %H:%M:%S")
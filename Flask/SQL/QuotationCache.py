@@ -0,0 +1,273 @@
+"""
+.DESCRIPTION
+    Definition file for in-memory cache of fund quotations used by investment result calculation.
+    Quotations of each fund are kept as compact NumPy arrays of dates and values,
+    they are loaded with a single bulk query for all requested funds.
+
+    Cache lifetime is selected by QUOTATION_CACHE_MODE variable:
+        - NONE <- quotations are always read from DB.
+        - CYCLE <- quotations are kept until the end of all investments refresh.
+                   Refreshes running at the same time share entries,
+                   which are cleared when the last of them ends.
+        - SHARED <- quotations are kept between requests in the least recently used order,
+                    until total size exceeds QUOTATION_CACHE_MAX_MB.
+                    Entries are validated against DB before each refresh,
+                    as quotations might be inserted by the other API process.
+
+
+.NOTES
+
+    Version:            1.2
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Count active cycles, so entries are cleared by the last one only.
+                                            Replace lock inherited by forked calculation worker with .initAfterFork().
+
+"""
+
+import os
+import datetime
+import threading
+import numpy as np
+from collections import OrderedDict
+from sqlalchemy import func, orm
+from SQL.Quotation import Quotation
+from Utility.Logger import logger
+
+
+class QuotationCacheEntry:
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray) -> None:
+        self.dates = dates
+        self.values = values
+
+    def getSize(self) -> int:
+        return self.dates.nbytes + self.values.nbytes
+
+    def getCount(self) -> int:
+        return len(self.dates)
+
+    def getLastDate(self) -> datetime.datetime:
+        if not len(self.dates):
+            return None
+
+        return self.dates[-1].item()
+
+    def getQuotation(self, start_date: datetime.datetime) -> dict[datetime.datetime, float]:
+
+        # Dates are sorted, so the first entry to return can be found with binary search
+        position = np.searchsorted(
+            self.dates,
+            np.datetime64(start_date, "us")
+        )
+
+        return dict(
+            zip(
+                self.dates[position:].tolist(),
+                self.values[position:].tolist()
+            )
+        )
+
+
+class QuotationCache:
+
+    CacheModes = ("NONE", "CYCLE", "SHARED")
+    CacheMode = os.getenv('QUOTATION_CACHE_MODE', "CYCLE").upper()
+    MaxSize_MB = float(os.getenv('QUOTATION_CACHE_MAX_MB', 64))
+
+    __entries: OrderedDict[str, QuotationCacheEntry] = OrderedDict()
+    __size: int = 0
+    __cycles: int = 0
+    __lock = threading.Lock()
+
+    @staticmethod
+    def isEnabled() -> bool:
+        return QuotationCache.CacheMode in ("CYCLE", "SHARED")
+
+    @staticmethod
+    def load(fundList: list[str], session: orm.session.Session) -> None:
+
+        logger.debug("QuotationCache.load(%s)", str(fundList))
+
+        if not QuotationCache.isEnabled():
+            return None
+
+        # Shared entries might be outdated, if quotation was inserted by the other process,
+        # so number of entries and the last date is compared with DB
+        fundsToLoad = QuotationCache.__get_funds_to_load(fundList, session)
+        if not fundsToLoad:
+            logger.debug("All funds are already cached")
+            return None
+
+        logger.debug("Loading quotation for funds: %s", str(fundsToLoad))
+        # Load quotation for all funds with a single query,
+        # entries are ordered, so each fund is a continuous sorted block
+        quotation = (
+            session
+            .query(Quotation.fund_id, Quotation.date, Quotation.value)
+            .filter(Quotation.fund_id.in_(fundsToLoad))
+            .order_by(Quotation.fund_id, Quotation.date)
+            .all()
+        )
+
+        rows = {fund: ([], []) for fund in fundsToLoad}
+        for fund_id, date, value in quotation:
+            rows[fund_id][0].append(date)
+            rows[fund_id][1].append(value)
+
+        with QuotationCache.__lock:
+            for fund, (dates, values) in rows.items():
+                QuotationCache.__put(
+                    fund,
+                    QuotationCacheEntry(
+                        np.array(dates, dtype="datetime64[us]"),
+                        np.array(values, dtype=np.float64)
+                    )
+                )
+
+            if QuotationCache.CacheMode == "SHARED":
+                QuotationCache.__evict()
+
+        return None
+
+    @staticmethod
+    def getQuotation(fund_id: str, start_date: datetime.datetime) -> dict[datetime.datetime, float]:
+        '''
+            Returns None if fund is not cached, so the caller has to read quotation from DB
+        '''
+        with QuotationCache.__lock:
+            entry = QuotationCache.__entries.get(fund_id)
+            if entry is None:
+                return None
+
+            QuotationCache.__entries.move_to_end(fund_id)
+
+        return entry.getQuotation(start_date)
+
+    @staticmethod
+    def invalidate(fund_id: str) -> None:
+
+        with QuotationCache.__lock:
+            if (entry := QuotationCache.__entries.pop(fund_id, None)) is not None:
+                logger.debug("Quotation cache for fund %s invalidated", fund_id)
+                QuotationCache.__size -= entry.getSize()
+
+        return None
+
+    @staticmethod
+    def beginCycle() -> None:
+        '''
+            Each call has to be followed by .endCycle(), even if refresh failed
+        '''
+        with QuotationCache.__lock:
+            QuotationCache.__cycles += 1
+
+        return None
+
+    @staticmethod
+    def endCycle() -> None:
+
+        with QuotationCache.__lock:
+            QuotationCache.__cycles = max(QuotationCache.__cycles - 1, 0)
+
+            # Entries are kept between requests only in shared mode,
+            # otherwise they are cleared once no other refresh is running, e.g. in asynchronous job
+            if (QuotationCache.CacheMode != "SHARED") and (QuotationCache.__cycles == 0):
+                QuotationCache.__reset()
+            else:
+                logger.debug("Quotation cache kept, active cycles: %d", QuotationCache.__cycles)
+
+        return None
+
+    @staticmethod
+    def initAfterFork() -> None:
+        '''
+            Has to be called in forked child process before any other method.
+            Lock might be held by the other thread of parent process at the moment of fork,
+            that thread does not exist in the child, so the lock would never be released.
+        '''
+        QuotationCache.__lock = threading.Lock()
+
+        # Entries inherited from parent are kept, the size is counted again,
+        # as it might be changed after the entry was put by the other thread
+        QuotationCache.__size = sum(
+            entry.getSize() for entry in QuotationCache.__entries.values()
+        )
+        QuotationCache.__cycles = 0
+
+        return None
+
+    @staticmethod
+    def clear() -> None:
+
+        with QuotationCache.__lock:
+            QuotationCache.__reset()
+
+        return None
+
+    @staticmethod
+    def __reset() -> None:
+
+        QuotationCache.__entries = OrderedDict()
+        QuotationCache.__size = 0
+
+        return None
+
+    @staticmethod
+    def __get_funds_to_load(fundList: list[str], session: orm.session.Session) -> list[str]:
+
+        with QuotationCache.__lock:
+            cached = {
+                fund: QuotationCache.__entries[fund]
+                for fund in fundList
+                if fund in QuotationCache.__entries
+            }
+
+        if not cached:
+            return list(fundList)
+
+        state = (
+            session
+            .query(Quotation.fund_id, func.count(), func.max(Quotation.date))
+            .filter(Quotation.fund_id.in_(list(cached.keys())))
+            .group_by(Quotation.fund_id)
+            .all()
+        )
+        upToDate = set(
+            fund_id for fund_id, count, lastDate in state
+            if (
+                (cached[fund_id].getCount() == count) and
+                (cached[fund_id].getLastDate() == lastDate)
+            )
+        )
+
+        return [fund for fund in fundList if fund not in upToDate]
+
+    @staticmethod
+    def __put(fund_id: str, entry: QuotationCacheEntry) -> None:
+
+        if (previous := QuotationCache.__entries.pop(fund_id, None)) is not None:
+            QuotationCache.__size -= previous.getSize()
+
+        QuotationCache.__entries[fund_id] = entry
+        QuotationCache.__size += entry.getSize()
+
+        return None
+
+    @staticmethod
+    def __evict() -> None:
+
+        # Remove the least recently used funds until the cache fits into memory limit,
+        # the most recent one is always kept
+        maxSize = QuotationCache.MaxSize_MB * 1024 * 1024
+        while (QuotationCache.__size > maxSize) and (len(QuotationCache.__entries) > 1):
+            fund_id, entry = QuotationCache.__entries.popitem(last=False)
+            QuotationCache.__size -= entry.getSize()
+            logger.debug("Quotation cache for fund %s evicted", fund_id)
+
+        return None
@@ -0,0 +1,128 @@
+"""
+.DESCRIPTION
+    Definition file for batched writer of investment results.
+    Entries are collected in a buffer and written to DB once the buffer reaches configured size,
+    so calculation can be still running while previous entries are already sent to DB.
+    All batches are written within the session transaction, commit remains on the caller side.
+
+
+.NOTES
+
+    Version:            1.2
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Skip entries which already exist in DB.
+                                            Write ResultRow entries.
+                                            Entries existing in DB are not created by calculation engines, instead of skipping them.
+
+"""
+
+import os
+import datetime
+from sqlalchemy import orm
+from SQL.InvestmentResult import InvestmentResult
+from SQL.BulkInsert import BulkInsert
+from Utility.Rows import ResultRow
+from Utility.Logger import logger
+
+
+class ResultWriter:
+
+    WriteModes = ("ORM", "COPY")
+    DefaultWriteMode = os.getenv('RESULT_WRITE_MODE', "ORM").upper()
+    DefaultBatchSize = int(os.getenv('RESULT_WRITE_BATCH_SIZE', 5000))
+
+    def __init__(
+        self,
+        session: orm.session.Session,
+        writeMode: str = None,
+        batchSize: int = None
+    ) -> None:
+        self.__session = session
+        self.__writeMode = writeMode or ResultWriter.DefaultWriteMode
+        self.__batchSize = batchSize or ResultWriter.DefaultBatchSize
+        self.__buffer: list[ResultRow] = []
+        self.__lastRecord: ResultRow = None
+        self.__writtenRecords = 0
+        self.__error: Exception = None
+
+    def append(self, record: ResultRow) -> None:
+
+        self.__buffer.append(record)
+        self.__lastRecord = record
+
+        if len(self.__buffer) >= self.__batchSize:
+            self.__write_batch()
+
+        return None
+
+    def flush(self) -> None:
+        '''
+            Method to write remaining entries to DB.
+            Raises exception if writing of any batch failed.
+        '''
+        self.__write_batch()
+
+        if self.__error is not None:
+            raise self.__error
+
+        logger.debug("%d entries written", self.__writtenRecords)
+        return None
+
+    def getLastResultDate(self) -> datetime.datetime:
+        '''
+            Method to get result date of the last entry,
+            raises IndexError if nothing was written, the same way as empty list would.
+        '''
+        if self.__lastRecord is None:
+            raise IndexError("No entries were written")
+
+        return self.__lastRecord.result_date
+
+    def __write_batch(self) -> None:
+
+        # Once any batch failed, whole transaction will be rolled back,
+        # so there is no point to send remaining entries to DB
+        if (not self.__buffer) or (self.__error is not None):
+            self.__buffer = []
+            return None
+
+        logger.debug(
+            "Writing batch of %d entries with %s mode",
+            len(self.__buffer),
+            self.__writeMode
+        )
+        try:
+            match (self.__writeMode):
+
+                case "COPY":
+                    BulkInsert.insertResults(
+                        self.__session,
+                        [
+                            record.toRow()
+                            for record in self.__buffer
+                        ]
+                    )
+
+                case _:
+                    for record in self.__buffer:
+                        self.__session.add(
+                            InvestmentResult(*record.toRow())
+                        )
+                    self.__session.flush()
+
+            self.__writtenRecords += len(self.__buffer)
+
+        except Exception as e:
+            # Error is raised when writer is flushed,
+            # so the calculation is not interrupted by DB errors
+            logger.exception("Failed to write batch", exc_info=True)
+            self.__error = e
+
+        self.__buffer = []
+        return None
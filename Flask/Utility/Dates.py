@@ -5,7 +5,7 @@
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.3
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -15,9 +15,13 @@
     Date            Who                     What
     2024-05-06      Stanisław Horna         add missing I/O datatypes.
 
+    2026-10-18      Stanisław Horna         Add fast ISO date parsing with dateutil fallback.
+                                            Add strict date parsing in provided format.
+
 """
 
 import datetime
+from dateutil.parser import parse
 
 
 class Dates:
@@ -63,6 +67,22 @@ class Dates:
             date + datetime.timedelta(days=days)
         )
 
+    @staticmethod
+    def parseDate(text: str) -> datetime.datetime:
+
+        # Dates are usually sent in ISO format which is parsed directly,
+        # general purpose parser is used only for other formats
+        try:
+            return datetime.datetime.fromisoformat(text)
+        except ValueError:
+            return parse(text)
+
+    @staticmethod
+    def convertStringToDate(text: str, inFormat: str = "%Y-%m-%d") -> datetime.datetime:
+
+        # Only provided format is accepted, raises ValueError for anything else, e.g. time part
+        return datetime.datetime.strptime(text, inFormat)
+
     @staticmethod
     def convertDateToString(date: datetime.datetime, outFormat: str = "%Y-%m-%d") -> str:
         return date.strftime(outFormat)
@@ -0,0 +1,120 @@
+"""
+.DESCRIPTION
+    Utility class definition for shared HTTP client.
+    Single session is created per process, it keeps connections alive in the pool,
+    applies connect/read timeouts and retries failed requests with jittered backoff.
+
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Replace lock inherited by forked calculation worker with .initAfterFork().
+
+"""
+
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from Utility.Logger import logger
+
+
+class HTTPClient:
+
+    PoolSize = int(os.getenv('HTTP_POOL_SIZE', 10))
+    ConnectTimeout_s = float(os.getenv('HTTP_CONNECT_TIMEOUT_S', 5))
+    ReadTimeout_s = float(os.getenv('HTTP_READ_TIMEOUT_S', 30))
+    Retries = int(os.getenv('HTTP_RETRIES', 3))
+    BackoffFactor_s = float(os.getenv('HTTP_BACKOFF_FACTOR_S', 0.5))
+    BackoffJitter_s = float(os.getenv('HTTP_BACKOFF_JITTER_S', 0.5))
+
+    RetryStatusCodes = (429, 500, 502, 503, 504)
+
+    __session: requests.Session = None
+    __sessionPID: int = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get(url: str, **kwargs) -> requests.Response:
+
+        # Apply default timeouts if they were not provided by the caller
+        kwargs.setdefault(
+            "timeout",
+            (HTTPClient.ConnectTimeout_s, HTTPClient.ReadTimeout_s)
+        )
+
+        return HTTPClient.getSession().get(url, **kwargs)
+
+    @staticmethod
+    def getSession() -> requests.Session:
+
+        with HTTPClient.__lock:
+
+            # Session is created per process,
+            # connections opened before fork can not be shared with a child process
+            if (
+                (HTTPClient.__session is None) or
+                (HTTPClient.__sessionPID != os.getpid())
+            ):
+                HTTPClient.__session = HTTPClient.__create_session()
+                HTTPClient.__sessionPID = os.getpid()
+
+            return HTTPClient.__session
+
+    @staticmethod
+    def initAfterFork() -> None:
+        '''
+            Has to be called in forked child process before any other method.
+            Lock might be held by the other thread of parent process at the moment of fork,
+            that thread does not exist in the child, so the lock would never be released.
+        '''
+        HTTPClient.__lock = threading.Lock()
+        HTTPClient.__session = None
+        HTTPClient.__sessionPID = None
+
+        return None
+
+    @staticmethod
+    def __create_session() -> requests.Session:
+
+        logger.debug(
+            "Creating HTTP session. Pool size: %d, retries: %d",
+            HTTPClient.PoolSize,
+            HTTPClient.Retries
+        )
+
+        retryPolicy = Retry(
+            total=HTTPClient.Retries,
+            connect=HTTPClient.Retries,
+            read=HTTPClient.Retries,
+            status=HTTPClient.Retries,
+            backoff_factor=HTTPClient.BackoffFactor_s,
+            backoff_jitter=HTTPClient.BackoffJitter_s,
+            status_forcelist=HTTPClient.RetryStatusCodes,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTPClient.PoolSize,
+            pool_maxsize=HTTPClient.PoolSize,
+            max_retries=retryPolicy
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive"
+            }
+        )
+
+        return session
@@ -0,0 +1,81 @@
+"""
+.DESCRIPTION
+    Utility class definition for investment orders.
+    Orders are indexed by date for O(1) look up of operations performed on given day,
+    orders of the same fund placed on the same day are merged into one.
+
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Remove cumulative per fund index, which was not used by calculation.
+
+"""
+
+import datetime
+from Utility.Rows import FundOrder
+
+
+class OrderLedger:
+
+    def __init__(self) -> None:
+
+        # Orders of each fund summed up per day
+        self.__orders: dict[datetime.datetime, dict[str, FundOrder]] = {}
+
+        # Sorted dates of orders, created when they are required
+        self.__dates: list[datetime.datetime] = None
+
+    def __contains__(self, date: datetime.datetime) -> bool:
+        return date in self.__orders
+
+    def __iter__(self):
+        return iter(self.getDates())
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def add(self, date: datetime.datetime, fund_id: str, money: float) -> None:
+
+        # Multiple orders of the same fund on the same day are merged into one
+        fundOrders = self.__orders.setdefault(date, {})
+        if fund_id not in fundOrders:
+            fundOrders[fund_id] = FundOrder()
+        fundOrders[fund_id].money += money
+
+        # Sorted dates have to be created again
+        self.__dates = None
+
+        return None
+
+    def getDates(self) -> list[datetime.datetime]:
+        if self.__dates is None:
+            self.__dates = sorted(self.__orders)
+
+        return self.__dates
+
+    def getOrders(self, date: datetime.datetime) -> dict[str, FundOrder]:
+        return self.__orders.get(date, {})
+
+    def applyQuotation(self, quot: dict[str, dict[datetime.datetime, float]]) -> None:
+
+        # Calculate participation units bought with each order,
+        # units of orders without quotation are unknown, so they are set to None
+        for date in self.getDates():
+            for fund, order in self.__orders[date].items():
+                fundQuotation = quot.get(fund, {})
+                order.participation_units = (
+                    order.money / fundQuotation[date]
+                    if date in fundQuotation
+                    else None
+                )
+
+
+        return None
@@ -0,0 +1,73 @@
+"""
+.DESCRIPTION
+    Definition file for compact row types used by quotation and investment result processing.
+    Rows are kept in memory in large numbers, so they are defined with slots instead of dicts,
+    which removes per entry dictionary and key storage.
+
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Participation units of order without quotation are None.
+
+"""
+
+import datetime
+from typing import NamedTuple
+from dataclasses import dataclass
+
+
+class QuotationRow(NamedTuple):
+    date: datetime.datetime
+    value: float
+
+
+# Participation units are calculated by OrderLedger,
+# they are None if there is no quotation at order date
+@dataclass(slots=True)
+class FundOrder:
+    money: float = 0
+    participation_units: float = 0
+
+
+@dataclass(slots=True)
+class FundState:
+    participation_units: float = 0
+    invested_money: float = 0
+
+
+@dataclass(slots=True)
+class ResultRow:
+    result_date: datetime.datetime
+    investment_id: int
+    fund_id: str
+    fund_participation_units: float
+    fund_invested_money: float
+    fund_value: float
+    last_day_result: float = None
+    last_week_result: float = None
+    last_month_result: float = None
+    last_year_result: float = None
+
+    def toRow(self) -> tuple:
+
+        # Columns in the same order as in Investment_Fund_Results table
+        return (
+            self.result_date,
+            self.fund_id,
+            self.investment_id,
+            self.fund_participation_units,
+            self.fund_invested_money,
+            self.fund_value,
+            self.last_day_result,
+            self.last_week_result,
+            self.last_month_result,
+            self.last_year_result
+        )
@@ -0,0 +1,45 @@
+"""
+.DESCRIPTION
+    Utility class definition to measure duration of processing stages.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class StageTimer:
+
+    def __init__(self) -> None:
+        self.__durations: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, stageName: str):
+
+        # Duration is added, so the same stage can be measured multiple times
+        startTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__durations[stageName] = (
+                self.__durations.get(stageName, 0.0) +
+                time.perf_counter() - startTime
+            )
+
+    def toDict(self) -> dict[str, float]:
+        return {
+            stageName: round(duration * 1000, 3)
+            for stageName, duration in self.__durations.items()
+        }
@@ -0,0 +1,105 @@
+"""
+.DESCRIPTION
+    Utility class definition for sorted time series,
+    which allows to find the latest entry at or before desired date in O(log n).
+    Entries are row objects, date and key are read from their attributes.
+
+
+.NOTES
+
+    Version:            1.2
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-18      Stanisław Horna         Read date and key from row attributes instead of dict keys.
+                                            Trim entries which will not be returned anymore.
+
+"""
+
+import bisect
+import datetime
+from operator import attrgetter
+
+
+class TimeSeriesIndex:
+
+    # Minimal number of entries removed at once,
+    # so the lists are not shifted each time the index is trimmed
+    TrimChunk = 256
+
+    def __init__(self, dateFieldName: str, inputData: list[object] = []) -> None:
+        self.__getDate = attrgetter(dateFieldName)
+        self.__dates: list[datetime.datetime] = []
+        self.__entries: list[object] = []
+        self.extend(inputData)
+
+    def append(self, entry: object) -> None:
+
+        date = self.__getDate(entry)
+
+        # Entries are usually added in order, so they can be simply appended,
+        # otherwise insert entry after all entries with the same or older date
+        if (not self.__dates) or (self.__dates[-1] <= date):
+            self.__dates.append(date)
+            self.__entries.append(entry)
+        else:
+            position = bisect.bisect_right(self.__dates, date)
+            self.__dates.insert(position, date)
+            self.__entries.insert(position, entry)
+
+        return None
+
+    def extend(self, inputData: list[object]) -> None:
+        for entry in inputData:
+            self.append(entry)
+
+        return None
+
+    def getEntryWithDesiredDate(self, desiredDate: datetime.datetime) -> object:
+
+        # Find position of the first entry newer than desired date,
+        # the entry before it is the latest one at or before desired date
+        position = bisect.bisect_right(self.__dates, desiredDate)
+        if position == 0:
+            return None
+
+        return self.__entries[position - 1]
+
+    def trim(self, desiredDate: datetime.datetime) -> None:
+        '''
+            Removes entries older than the latest one at or before desired date,
+            they will not be returned as long as desired dates are not older than the provided one
+        '''
+        position = bisect.bisect_right(self.__dates, desiredDate) - 1
+        if position >= TimeSeriesIndex.TrimChunk:
+            del self.__dates[:position]
+            del self.__entries[:position]
+
+        return None
+
+    @staticmethod
+    def groupBy(
+        inputData: list[object],
+        keyFieldName: str,
+        dateFieldName: str,
+        keys: list[str] = []
+    ) -> dict[str, "TimeSeriesIndex"]:
+
+        # Create empty index for each required key, so it can be appended later on
+        result = {
+            key: TimeSeriesIndex(dateFieldName)
+            for key in keys
+        }
+
+        getKey = attrgetter(keyFieldName)
+        for entry in inputData:
+            if getKey(entry) not in result:
+                result[getKey(entry)] = TimeSeriesIndex(dateFieldName)
+
+            result[getKey(entry)].append(entry)
+
+        return result
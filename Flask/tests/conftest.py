@@ -0,0 +1,41 @@
+"""
+.DESCRIPTION
+    Common setup of Flask API tests.
+    Tests are run from Flask directory, the same way as API modules import each other:
+        python -m pytest tests
+
+    uwsgidecorators is available only inside uWSGI process,
+    so outside of it the decorator used by Logger is replaced with the one returning decorated function.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import os
+import sys
+import types
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Logger writes to the file in LOG_PATH, it is created once modules are imported
+os.environ.setdefault("LOG_PATH", tempfile.mkdtemp() + os.sep)
+os.environ.setdefault("LOG_TYPE", "JSON")
+os.environ.setdefault("LOG_LEVEL", "CRITICAL")
+
+try:
+    import uwsgidecorators
+except ImportError:
+    uwsgidecorators = types.ModuleType("uwsgidecorators")
+    uwsgidecorators.postfork = lambda function: function
+    sys.modules["uwsgidecorators"] = uwsgidecorators
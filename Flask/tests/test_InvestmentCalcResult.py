@@ -0,0 +1,120 @@
+"""
+.DESCRIPTION
+    Tests of investment result calculation in Processing.InvestmentCalcResult
+    and Processing.InvestmentCalcVectorized.
+    DB sessions and locks are replaced with mocks, so tests do not require database.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import datetime
+from unittest import mock
+import pytest
+from Processing import InvestmentCalcResult as InvestmentCalcResultModule
+from Processing.InvestmentCalcResult import InvestmentCalcResult
+from Processing.InvestmentCalcVectorized import InvestmentCalcVectorized
+from Utility.Dates import Dates
+from Utility.OrderLedger import OrderLedger
+from Utility.Rows import FundState
+
+ENGINES = ["LOOP", "NUMPY"]
+FUNDS = ["F1", "F2"]
+
+
+def createInvestment() -> tuple[OrderLedger, dict[str, dict[datetime.datetime, float]], datetime.datetime]:
+
+    # Funds are quoted each day at midnight during the last 30 days and bought on the first one
+    today = datetime.datetime.combine(datetime.date.today(), datetime.time())
+    firstDay = Dates.addDays(today, -30)
+    quot = {
+        fund: {
+            Dates.addDays(firstDay, day): 100.0 + day + i
+            for day in range(31)
+        }
+        for i, fund in enumerate(FUNDS)
+    }
+
+    orderLedger = OrderLedger()
+    for fund in FUNDS:
+        orderLedger.add(firstDay, fund, 1000.0)
+    orderLedger.applyQuotation(quot)
+
+    return orderLedger, quot, firstDay
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("dateFrom", ["2024-03-01T12:00", "2024-03-01 12:00", "01.03.2024", "abc"])
+def test_recalculateRange_rejects_date_not_in_YYYY_MM_DD_format(monkeypatch, engine, dateFrom):
+
+    session = mock.MagicMock()
+    monkeypatch.setattr(InvestmentCalcResultModule, "InvestmentLock", mock.MagicMock())
+    monkeypatch.setattr(InvestmentCalcResultModule, "Session_rw", session)
+
+    responseCode, responseBody = InvestmentCalcResult.recalculateRange(1, dateFrom, None, engine)
+
+    # Results are not deleted, if range is invalid
+    assert responseCode == 400
+    assert responseBody["Status"] == "Invalid date range, provide from and optional to as YYYY-MM-DD"
+    session.assert_not_called()
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_recalculateRange_rejects_end_date_not_in_YYYY_MM_DD_format(monkeypatch, engine):
+
+    session = mock.MagicMock()
+    monkeypatch.setattr(InvestmentCalcResultModule, "InvestmentLock", mock.MagicMock())
+    monkeypatch.setattr(InvestmentCalcResultModule, "Session_rw", session)
+
+    responseCode, _ = InvestmentCalcResult.recalculateRange(1, "2024-03-01", "2024-03-05T00:00", engine)
+
+    assert responseCode == 400
+    session.assert_not_called()
+
+
+@pytest.mark.parametrize("startHour", [0, 12])
+def test_engines_create_the_same_entries_from_date_with_time_part(startHour):
+
+    orderLedger, quot, firstDay = createInvestment()
+    start = Dates.addDays(firstDay, 10).replace(hour=startHour)
+
+    # Owned units are taken from the day before the first processed one, the same as in range recalculation
+    records = {}
+    for engine in ENGINES:
+        ownedFunds = {
+            fund: FundState(
+                orderLedger.getOrders(firstDay)[fund].participation_units,
+                1000.0
+            )
+            for fund in FUNDS
+        }
+        records[engine] = [
+            repr(record)
+            for record in InvestmentCalcResult.streamRecords(
+                engine,
+                1,
+                {
+                    "funds": FUNDS,
+                    "orderLedger": orderLedger,
+                    "quot": quot,
+                    "currentProcessingDate": start
+                },
+                ownedFunds,
+                []
+            )
+        ]
+
+    # Entries with time part start on the next day
+    expectedDays = 21 if startHour == 0 else 20
+    assert len(records["LOOP"]) == expectedDays * len(FUNDS)
+    assert records["NUMPY"] == records["LOOP"]
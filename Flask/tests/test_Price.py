@@ -0,0 +1,93 @@
+"""
+.DESCRIPTION
+    Tests of fund quotation update in Processing.Price.
+    DB sessions are replaced with mocks, so tests do not require database.
+
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
+    Creation Date:      18-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import json
+import datetime
+from unittest import mock
+import requests
+from SQL.Fund import Fund
+from Processing import Price as PriceModule
+from Processing.Price import Price
+from Processing.InvestmentCalcResult import InvestmentCalcResult
+from Utility.HTTPClient import HTTPClient
+
+FUND_URL = "https://www.analizy.pl/fundusze-inwestycyjne-otwarte/{}/fund-{}"
+LAST_QUOTATION_DATE = datetime.datetime(2026, 10, 14)
+
+
+def createResponse(fundID: str) -> mock.Mock:
+    return mock.Mock(
+        content=json.dumps(
+            {
+                "id": fundID,
+                "series": [
+                    {
+                        "price": [
+                            {"date": "2026-10-14", "value": "100.0"},
+                            {"date": "2026-10-15", "value": "101.5"}
+                        ]
+                    }
+                ]
+            }
+        ).encode()
+    )
+
+
+def test_updateQuotation_reports_timed_out_fund_and_processes_others(monkeypatch):
+
+    fundIDs = ["F1", "F2", "F3"]
+    funds = {
+        fundID: Fund(FUND_URL.format(fundID, fundID.lower()))
+        for fundID in fundIDs
+    }
+
+    # All funds already have quotation in DB
+    session = mock.MagicMock()
+    session.query.return_value.group_by.return_value.all.return_value = [
+        (LAST_QUOTATION_DATE, fundID) for fundID in fundIDs
+    ]
+    monkeypatch.setattr(PriceModule, "Session_ro", lambda: session)
+    monkeypatch.setattr(PriceModule, "Session_rw", mock.MagicMock)
+    monkeypatch.setattr(PriceModule.ConvertToDict, "fundList", lambda _: funds)
+
+    # Download of F2 runs out of time, the other ones return quotation
+    def get(url: str, **kwargs):
+        if "/F2" in url:
+            raise requests.exceptions.ReadTimeout("Read timed out")
+        return createResponse(url.rsplit("/", 1)[-1])
+
+    monkeypatch.setattr(HTTPClient, "get", staticmethod(get))
+
+    insertedFunds = []
+
+    def insertQuotationRecords(downloadedQuot, session, allQuotations=None, updatedFunds=None):
+        insertedFunds.append(downloadedQuot["Fund_ID"])
+        return 200, {"Status": "Quotation successfully added"}
+
+    monkeypatch.setattr(Price, "insertQuotationRecords", staticmethod(insertQuotationRecords))
+    monkeypatch.setattr(InvestmentCalcResult, "refreshFundInvestments", staticmethod(lambda fundIDs: []))
+
+    _, result = Price.updateQuotation()
+
+    assert sorted(insertedFunds) == ["F1", "F3"]
+    assert {entry["fund_id"]: entry["Status"] for entry in result} == {
+        "F1": "Quotation successfully added",
+        "F2": "Failed to download quotation",
+        "F3": "Quotation successfully added"
+    }
@@ -45,7 +45,7 @@
 
     .NOTES
 
-        Version:            1.0
+        Version:            1.4
         Author:             Stanisław Horna
         Mail:               stanislawhorna@outlook.com
         GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -53,6 +53,10 @@
         ChangeLog:
 
         Date            Who                     What
+        2026-10-18      Stanisław Horna         Add Job table to track asynchronous API jobs.
+                                                Add Investment_Fund_Checkpoint table for incremental result calculation.
+                                                Allow InvestmentRefundRange job type.
+                                                Coalesce active jobs only if their parameters are the same.
 
 */
 
@@ -124,11 +128,52 @@ CREATE TABLE Investment_Fund_Results (
     CONSTRAINT Investment_Fund_Results_pkey PRIMARY KEY (Result_date,Fund_ID,Investment_ID)
 );
 
+-- Compact state of each fund in investment at the last complete result date,
+-- holds the results within rolling window required to calculate period profits,
+-- so incremental calculation does not have to read whole result history
+CREATE TABLE Investment_Fund_Checkpoint (
+    Investment_ID int NOT NULL,
+    Fund_ID varchar NOT NULL,
+    Checkpoint_date timestamp NOT NULL,
+    Window_start timestamp NOT NULL,
+    Result_dates timestamp[] NOT NULL,
+    Participation_units float[] NOT NULL,
+    Invested_money float[] NOT NULL,
+    Fund_values float[] NOT NULL,
+
+    CONSTRAINT Investment_Fund_Checkpoint_pkey PRIMARY KEY (Investment_ID,Fund_ID)
+);
+
 CREATE TABLE Investment_Owner (
     ID serial PRIMARY KEY NOT NULL,
     O_Name varchar NULL
 );
 
+CREATE TABLE Job (
+    ID serial PRIMARY KEY NOT NULL,
+    J_type varchar NOT NULL,
+    Target_ID varchar NOT NULL DEFAULT '',
+    J_parameters jsonb NULL,
+    J_status varchar NOT NULL DEFAULT 'Queued',
+    Total_items int NULL,
+    Completed_items int NOT NULL DEFAULT 0,
+    Items jsonb NOT NULL DEFAULT '[]',
+    Response_code int NULL,
+    Response_body jsonb NULL,
+    Created_date timestamp NOT NULL DEFAULT now(),
+    Started_date timestamp NULL,
+    Updated_date timestamp NOT NULL DEFAULT now(),
+    Finished_date timestamp NULL,
+
+    CONSTRAINT J_type_chk CHECK (J_type IN ('FundQuotation', 'InvestmentRefund', 'InvestmentRefundRange')),
+    CONSTRAINT J_status_chk CHECK (J_status IN ('Queued', 'Running', 'Completed', 'Failed'))
+);
+
+-- Only one job of given type, target and parameters can be queued or running at the same time,
+-- duplicate submissions are coalesced into the existing job
+CREATE UNIQUE INDEX Job_active_idx ON Job (J_type, Target_ID, COALESCE(J_parameters, '{}'::jsonb))
+WHERE J_status IN ('Queued', 'Running');
+
 ALTER TABLE Fund 
 ADD CONSTRAINT Category_fkey FOREIGN KEY (Category_ID) 
 REFERENCES Fund_Category (ID) MATCH SIMPLE;
@@ -149,6 +194,10 @@ ALTER TABLE Investment_Fund_Results
 ADD CONSTRAINT Fund_fkey FOREIGN KEY (Fund_ID) 
 REFERENCES Fund (ID) MATCH SIMPLE;
 
+ALTER TABLE Investment_Fund_Checkpoint 
+ADD CONSTRAINT Fund_fkey FOREIGN KEY (Fund_ID) 
+REFERENCES Fund (ID) MATCH SIMPLE;
+
 ALTER TABLE Investment
 ADD CONSTRAINT Owner_fkey FOREIGN KEY (Owner_ID) 
 REFERENCES Investment_Owner (ID) MATCH SIMPLE;
@@ -19,7 +19,7 @@
 
     .NOTES
 
-        Version:            1.0
+        Version:            1.2
         Author:             Stanisław Horna
         Mail:               stanislawhorna@outlook.com
         GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -27,6 +27,8 @@
         ChangeLog:
 
         Date            Who                     What
+        2026-10-18      Stanisław Horna         Add Jobs view.
+                                                Add Investment_Checkpoints view.
 
 */
 
@@ -88,3 +90,33 @@ SELECT
 FROM Investment_Fund_Results ifr;
 
 
+CREATE VIEW Jobs AS
+SELECT
+    j.ID AS "job_id",
+    j.J_type AS "job_type",
+    j.Target_ID AS "job_target_id",
+    j.J_parameters AS "job_parameters",
+    j.J_status AS "job_status",
+    j.Total_items AS "job_total_items",
+    j.Completed_items AS "job_completed_items",
+    j.Items AS "job_items",
+    j.Response_code AS "job_response_code",
+    j.Response_body AS "job_response_body",
+    j.Created_date AS "job_created_date",
+    j.Started_date AS "job_started_date",
+    j.Updated_date AS "job_updated_date",
+    j.Finished_date AS "job_finished_date"
+FROM Job j;
+
+
+CREATE VIEW Investment_Checkpoints AS
+SELECT
+    ifc.Investment_ID AS "investment_id",
+    ifc.Fund_ID AS "fund_id",
+    ifc.Checkpoint_date AS "checkpoint_date",
+    ifc.Window_start AS "checkpoint_window_start",
+    ifc.Result_dates AS "checkpoint_result_dates",
+    ifc.Participation_units AS "checkpoint_participation_units",
+    ifc.Invested_money AS "checkpoint_invested_money",
+    ifc.Fund_values AS "checkpoint_fund_values"
+FROM Investment_Fund_Checkpoint ifc;
@@ -4,12 +4,13 @@
 
         Users to be created:
             - api_read <- will have access to SELECT views only.
-            - api_write <- will have access to INSERT and UPDATE views only.
+            - api_write <- will have access to INSERT and UPDATE views,
+                           and to INSERT into tables loaded in bulk.
             - grafana_read <- will have access to SELECT views and invoke grafana functions.
 
     .NOTES
 
-        Version:            1.2
+        Version:            1.5
         Author:             Stanisław Horna
         Mail:               stanislawhorna@outlook.com
         GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment
@@ -22,6 +23,14 @@
                                                     - pg_sys_memory_info
         
         2024-04-23      Stanisław Horna         Add DELETE permissions for api_write user
+
+        2026-10-18      Stanisław Horna         Add SELECT, INSERT permissions on Fund_Quotation table for api_write user,
+                                                    required by bulk COPY insert.
+                                                Add SELECT, INSERT, UPDATE permissions on Investment_Fund_Results table
+                                                    for api_write user, required by bulk COPY insert.
+
+        2026-10-18      Stanisław Horna         Add permissions on jobs view for api_read and api_write users.
+                                                Add permissions on investment_checkpoints view for api_read and api_write users.
 */
 
 -- create required roles
@@ -37,6 +46,8 @@ GRANT SELECT ON funds TO "api_read";
 GRANT SELECT ON investment_results TO "api_read";
 GRANT SELECT ON investments TO "api_read";
 GRANT SELECT ON quotations TO "api_read";
+GRANT SELECT ON jobs TO "api_read";
+GRANT SELECT ON investment_checkpoints TO "api_read";
 
 
 -- Grant privileges for API WRITE user
@@ -46,6 +57,11 @@ GRANT SELECT, INSERT, UPDATE, DELETE ON funds TO "api_write";
 GRANT SELECT, INSERT, UPDATE, DELETE ON investment_results TO "api_write";
 GRANT SELECT, INSERT, UPDATE, DELETE ON investments TO "api_write";
 GRANT SELECT, INSERT, UPDATE, DELETE ON quotations TO "api_write";
+GRANT SELECT, INSERT ON Fund_Quotation TO "api_write";
+GRANT SELECT, INSERT, UPDATE ON Investment_Fund_Results TO "api_write";
+GRANT SELECT, INSERT, UPDATE ON jobs TO "api_write";
+GRANT USAGE ON SEQUENCE job_id_seq TO "api_write";
+GRANT SELECT, INSERT, DELETE ON investment_checkpoints TO "api_write";
 
 -- Grant privileges for Grafana user
 GRANT CONNECT ON DATABASE "Investments" TO "grafana_read";